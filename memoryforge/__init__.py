@@ -6,7 +6,6 @@ architecture decisions, and preferences across AI conversations.
 """
 
 from memoryforge.models import Memory, MemoryType, MemorySource, SearchResult, Project
-from memoryforge.core.memory_manager import MemoryManager
 from memoryforge.config import Config
 
 __version__ = "1.0.1"
@@ -19,3 +18,11 @@ __all__ = [
     "MemoryManager",
     "Config",
 ]
+
+
+def __getattr__(name):
+    """Lazy import so that importing the package does not load Qdrant."""
+    if name == "MemoryManager":
+        from memoryforge.core.memory_manager import MemoryManager
+        return MemoryManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,12 @@ CLI for MemoryForge.
 Commands:
 - init: Initialize MemoryForge in current directory
 - add: Add a memory manually
+- add-batch: Add one memory per line from a file or stdin
 - list: List stored memories
-- delete: Delete a memory by ID
+- delete: Delete one or more memories by ID
 - confirm: Confirm a pending memory
 - search: Search for memories
+- search-many: Run several searches in one batch
 - serve: Start the MCP server
 
 v2 Commands:
@@ -21,29 +23,49 @@ v2 Commands:
 import asyncio
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from uuid import UUID
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 
 from memoryforge.config import Config, EmbeddingProvider
 from memoryforge.models import MemoryType, MemorySource, Project
 from memoryforge.storage.sqlite_db import SQLiteDatabase
-from memoryforge.storage.qdrant_store import QdrantStore
-from memoryforge.core.embedding_factory import create_embedding_service, get_embedding_dimension
-from memoryforge.core.memory_manager import MemoryManager
-from memoryforge.core.retrieval import RetrievalEngine
 from memoryforge.core.project_router import ProjectRouter
-from memoryforge.mcp.server import run_mcp_server
+
+# Qdrant, the embedding stack and the MCP server are imported inside the
+# commands that need them so that read-only commands start quickly.
+if TYPE_CHECKING:
+    from memoryforge.storage.qdrant_store import QdrantStore
 
 console = Console()
 
+# Timeline colours per memory type, built once rather than parsed from
+# markup for every row
+TIMELINE_TYPE_STYLES = {
+    MemoryType.DECISION.value: Style(color="red"),
+    MemoryType.STACK.value: Style(color="cyan"),
+    MemoryType.CONSTRAINT.value: Style(color="yellow"),
+}
+TIMELINE_DEFAULT_STYLE = Style(color="white")
+DIM_STYLE = Style(dim=True)
+BOLD_STYLE = Style(bold=True)
+
+# Minimum seconds between progress counter updates in long-running loops
+STATUS_REFRESH_INTERVAL = 0.1
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -52,23 +74,37 @@ logging.basicConfig(
 logger = logging.getLogger("memoryforge")
 
 
+def truncate(text: str, width: int = 40) -> str:
+    """Shorten text to at most width characters, ending in "..." when cut."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
 def get_project_id(config: Config) -> Optional[UUID]:
     """Get the active project ID from the database."""
     try:
-        db = SQLiteDatabase(config.sqlite_path)
+        db = SQLiteDatabase.open(config.sqlite_path)
         project = db.get_project_by_name(config.project_name)
         return project.id if project else None
     except Exception:
         return None
 
 
-def ensure_initialized(config: Config) -> tuple[SQLiteDatabase, QdrantStore, UUID]:
-    """Ensure MemoryForge is initialized and return storage components."""
+def event_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Get uvloop's loop factory when it is installed, else None for asyncio's default."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def ensure_project(config: Config) -> tuple[SQLiteDatabase, UUID]:
+    """Ensure MemoryForge is initialized and return the database and active project ID."""
     if not config.sqlite_path.exists():
         console.print("[red]MemoryForge not initialized. Run 'memoryforge init' first.[/red]")
         sys.exit(1)
     
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     
     # v2: Use active_project_id from config, fallback to project_name
     project = None
@@ -85,6 +121,14 @@ def ensure_initialized(config: Config) -> tuple[SQLiteDatabase, QdrantStore, UUI
         console.print("[red]Project not found. Run 'memoryforge init' first.[/red]")
         sys.exit(1)
     
+    return db, project.id
+
+
+def open_qdrant(config: Config, project_id: UUID) -> "QdrantStore":
+    """Open the per-project Qdrant collection sized for the configured embeddings."""
+    from memoryforge.core.embedding_factory import get_embedding_dimension
+    from memoryforge.storage.qdrant_store import QdrantStore
+    
     # Get embedding dimension based on provider
     embedding_dim = get_embedding_dimension(
         config.embedding_provider,
@@ -92,13 +136,64 @@ def ensure_initialized(config: Config) -> tuple[SQLiteDatabase, QdrantStore, UUI
     )
     
     # v2: Per-project Qdrant collection
-    qdrant = QdrantStore(
+    return QdrantStore(
         config.qdrant_path,
-        project_id=project.id,
+        project_id=project_id,
         embedding_dimension=embedding_dim,
     )
+
+
+class LazyQdrantStore:
+    """Stand-in for QdrantStore that opens the collection on first use.
+    
+    Commands that only sometimes need vectors (e.g. 'add --no-confirm' or
+    'stale unused') then never pay for opening Qdrant.
+    """
+    
+    def __init__(self, config: Config, project_id: UUID):
+        self._config = config
+        self._project_id = project_id
+        self._store: Optional[QdrantStore] = None
+    
+    def __getattr__(self, name: str):
+        if self._store is None:
+            self._store = open_qdrant(self._config, self._project_id)
+        return getattr(self._store, name)
+    
+    def close(self) -> None:
+        """Close the store if it was ever opened."""
+        if self._store is not None:
+            self._store.close()
+
+
+class LazyEmbeddingService:
+    """Stand-in for an embedding service that creates it on first use.
     
-    return db, qdrant, project.id
+    Commands that only sometimes embed (e.g. 'consolidate stats' with a
+    warm similarity cache or 'stale unused') then never load a model or
+    need an API key.
+    """
+    
+    def __init__(self, config: Config):
+        self._config = config
+        self._service = None
+    
+    def __getattr__(self, name: str):
+        if self._service is None:
+            from memoryforge.core.embedding_factory import create_embedding_service
+            
+            self._service = create_embedding_service(self._config)
+        return getattr(self._service, name)
+
+
+def ensure_initialized(config: Config) -> tuple[SQLiteDatabase, LazyQdrantStore, UUID]:
+    """Ensure MemoryForge is initialized and return storage components.
+    
+    Qdrant is opened lazily on first use. Commands that never touch vectors
+    should use ensure_project instead.
+    """
+    db, project_id = ensure_project(config)
+    return db, LazyQdrantStore(config, project_id), project_id
 
 
 @click.group()
@@ -123,8 +218,15 @@ def main(ctx: click.Context, config: Optional[str]) -> None:
     default="local",
     help="Embedding provider (default: local for free embeddings)",
 )
+@click.option("--yes", "-y", is_flag=True, help="Accept defaults and skip confirmation prompts")
 @click.pass_context
-def init(ctx: click.Context, name: Optional[str], api_key: Optional[str], provider: str) -> None:
+def init(
+    ctx: click.Context,
+    name: Optional[str],
+    api_key: Optional[str],
+    provider: str,
+    yes: bool,
+) -> None:
     """Initialize MemoryForge for the current project."""
     config: Config = ctx.obj["config"]
     
@@ -138,7 +240,7 @@ def init(ctx: click.Context, name: Optional[str], api_key: Optional[str], provid
     if not name:
         cwd = Path.cwd()
         default_name = cwd.name
-        name = Prompt.ask("Project name", default=default_name)
+        name = default_name if yes else Prompt.ask("Project name", default=default_name)
     
     # Set embedding provider
     config.embedding_provider = EmbeddingProvider(provider)
@@ -164,7 +266,7 @@ def init(ctx: click.Context, name: Optional[str], api_key: Optional[str], provid
     config.ensure_directories()
     
     # Initialize database
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     
     # Use ProjectRouter for v2
     router = ProjectRouter(db, config)
@@ -173,7 +275,7 @@ def init(ctx: click.Context, name: Optional[str], api_key: Optional[str], provid
     existing = db.get_project_by_name(name)
     if existing:
         console.print(f"[yellow]Project '{name}' already exists.[/yellow]")
-        if not Confirm.ask("Reinitialize?"):
+        if not yes and not Confirm.ask("Reinitialize?"):
             return
         project = existing
         # Set as active project
@@ -183,6 +285,9 @@ def init(ctx: click.Context, name: Optional[str], api_key: Optional[str], provid
         project = router.create_project(name, str(Path.cwd()), set_active=True)
     
     # Initialize Qdrant with correct dimension and project scope
+    from memoryforge.core.embedding_factory import get_embedding_dimension
+    from memoryforge.storage.qdrant_store import QdrantStore
+    
     embedding_dim = get_embedding_dimension(
         config.embedding_provider,
         config.local_embedding_model if config.embedding_provider == EmbeddingProvider.LOCAL else config.openai_embedding_model
@@ -215,6 +320,9 @@ def init(ctx: click.Context, name: Optional[str], api_key: Optional[str], provid
 @click.pass_context
 def add(ctx: click.Context, content: str, type: str, confirm: bool) -> None:
     """Add a new memory."""
+    from memoryforge.core.embedding_factory import create_embedding_service
+    from memoryforge.core.memory_manager import MemoryManager
+    
     config: Config = ctx.obj["config"]
     db, qdrant, project_id = ensure_initialized(config)
     
@@ -255,6 +363,68 @@ def add(ctx: click.Context, content: str, type: str, confirm: bool) -> None:
     console.print(f"  Content: {content[:100]}{'...' if len(content) > 100 else ''}")
 
 
+@main.command("add-batch")
+@click.argument("source", type=click.File("r"), default="-")
+@click.option(
+    "--type", "-t",
+    type=click.Choice(["stack", "decision", "constraint", "convention", "note"]),
+    default="note",
+    help="Memory type for every line",
+)
+@click.option("--confirm/--no-confirm", default=True, help="Immediately confirm the memories")
+@click.option("--batch-size", "-b", default=64, help="Texts per embedding batch")
+@click.pass_context
+def add_batch(ctx: click.Context, source, type: str, confirm: bool, batch_size: int) -> None:
+    """Add one memory per line from a file or stdin.
+    
+    Faster than calling 'add' repeatedly: the embedding model is loaded once
+    and memories are embedded and stored in batches.
+    """
+    from memoryforge.core.embedding_factory import create_embedding_service
+    from memoryforge.core.memory_manager import MemoryManager
+    from memoryforge.core.validation import ValidationError
+    
+    config: Config = ctx.obj["config"]
+    
+    contents = [line.strip() for line in source if line.strip()]
+    if not contents:
+        console.print("[dim]No memories to add.[/dim]")
+        return
+    
+    db, qdrant, project_id = ensure_initialized(config)
+    
+    embedding_service = None
+    if confirm:
+        try:
+            embedding_service = create_embedding_service(config)
+        except (ValueError, ImportError) as e:
+            console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+    
+    memory_manager = MemoryManager(
+        sqlite_db=db,
+        qdrant_store=qdrant,
+        embedding_service=embedding_service,
+        project_id=project_id,
+    )
+    
+    try:
+        with console.status(f"[bold green]Adding {len(contents)} memories..."):
+            memories = memory_manager.create_memories_bulk(
+                contents,
+                memory_type=MemoryType(type),
+                source=MemorySource.MANUAL,
+                auto_confirm=confirm,
+                batch_size=batch_size,
+            )
+    except (ValidationError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    
+    confirmed = sum(1 for m in memories if m.confirmed)
+    console.print(f"\n[bold]Added {len(memories)} memories[/bold] ({confirmed} confirmed)")
+
+
 @main.command("list")
 @click.option(
     "--type", "-t",
@@ -268,18 +438,18 @@ def add(ctx: click.Context, content: str, type: str, confirm: bool) -> None:
 def list_memories(ctx: click.Context, type: Optional[str], show_all: bool, limit: int) -> None:
     """List stored memories."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     # Parse memory type
     memory_type = MemoryType(type) if type else None
     
-    # Get memories
-    memories = db.list_memories(
+    # Get memories (summary rows only, no Memory hydration)
+    memories = list(db.list_memories_summary(
         project_id=project_id,
         confirmed_only=not show_all,
         memory_type=memory_type,
         limit=limit,
-    )
+    ))
     
     if not memories:
         console.print("[dim]No memories stored yet.[/dim]")
@@ -292,52 +462,69 @@ def list_memories(ctx: click.Context, type: Optional[str], show_all: bool, limit
     table.add_column("ID", style="dim", width=36)
     table.add_column("Status", width=10)
     
-    for memory in memories:
-        status = "✓" if memory.confirmed else "⏳"
-        content = memory.content[:47] + "..." if len(memory.content) > 50 else memory.content
-        table.add_row(
-            memory.type.value,
-            content.replace("\n", " "),
-            str(memory.id),
-            status,
+    # Build plain cell strings up front so Rich only does layout
+    rows = [
+        (
+            mem_type,
+            truncate(content, 50).replace("\n", " "),
+            mem_id,
+            "✓" if confirmed else "⏳",
         )
+        for mem_id, mem_type, content, confirmed, _ in memories
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
 
 @main.command()
-@click.argument("memory_id")
+@click.argument("memory_ids", nargs=-1, required=True)
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 @click.pass_context
-def delete(ctx: click.Context, memory_id: str) -> None:
-    """Delete a memory by ID."""
+def delete(ctx: click.Context, memory_ids: tuple[str, ...], yes: bool) -> None:
+    """Delete one or more memories by ID."""
     config: Config = ctx.obj["config"]
-    db, qdrant, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
-    try:
-        uuid = UUID(memory_id)
-    except ValueError:
-        console.print(f"[red]Invalid memory ID: {memory_id}[/red]")
-        sys.exit(1)
+    uuids = []
+    for memory_id in memory_ids:
+        try:
+            uuids.append(UUID(memory_id))
+        except ValueError:
+            console.print(f"[red]Invalid memory ID: {memory_id}[/red]")
+            sys.exit(1)
     
-    # Check if memory exists
-    memory = db.get_memory(uuid)
-    if not memory:
-        console.print(f"[red]Memory not found: {memory_id}[/red]")
-        sys.exit(1)
+    # Check that every memory exists
+    memories = []
+    for uuid in uuids:
+        memory = db.get_memory(uuid)
+        if not memory:
+            console.print(f"[red]Memory not found: {uuid}[/red]")
+            sys.exit(1)
+        memories.append(memory)
     
     # Confirm deletion
-    console.print(f"Memory: {memory.content[:100]}...")
-    if not Confirm.ask("Delete this memory?"):
+    for memory in memories:
+        console.print(f"Memory: {memory.content[:100]}...")
+    if len(memories) == 1:
+        prompt = "Delete this memory?"
+    else:
+        prompt = f"Delete these {len(memories)} memories?"
+    if not yes and not Confirm.ask(prompt):
         return
     
-    # Delete from Qdrant if confirmed
-    if memory.confirmed:
-        qdrant.delete(uuid)
-    
-    # Delete from SQLite
-    db.delete_memory(uuid)
+    # Delete indexed vectors in one request (only confirmed memories are
+    # indexed, so Qdrant is not opened otherwise), then rows in one transaction
+    indexed_ids = [m.id for m in memories if m.confirmed]
+    if indexed_ids:
+        open_qdrant(config, project_id).delete_batch(indexed_ids)
+    db.delete_memories([m.id for m in memories])
     
-    console.print(f"[green]✓ Memory deleted[/green]")
+    if len(memories) == 1:
+        console.print(f"[green]✓ Memory deleted[/green]")
+    else:
+        console.print(f"[green]✓ {len(memories)} memories deleted[/green]")
 
 
 @main.command("confirm")
@@ -345,6 +532,9 @@ def delete(ctx: click.Context, memory_id: str) -> None:
 @click.pass_context
 def confirm_memory(ctx: click.Context, memory_id: str) -> None:
     """Confirm a pending memory."""
+    from memoryforge.core.embedding_factory import create_embedding_service
+    from memoryforge.core.memory_manager import MemoryManager
+    
     config: Config = ctx.obj["config"]
     db, qdrant, project_id = ensure_initialized(config)
     
@@ -401,6 +591,9 @@ def confirm_memory(ctx: click.Context, memory_id: str) -> None:
 @click.pass_context
 def search(ctx: click.Context, query: str, type: Optional[str], limit: int) -> None:
     """Search for relevant memories."""
+    from memoryforge.core.embedding_factory import create_embedding_service
+    from memoryforge.core.retrieval import RetrievalEngine
+    
     config: Config = ctx.obj["config"]
     db, qdrant, project_id = ensure_initialized(config)
     
@@ -445,15 +638,80 @@ def search(ctx: click.Context, query: str, type: Optional[str], limit: int) -> N
         console.print()
 
 
+@main.command("search-many")
+@click.option(
+    "--query", "-q", "queries",
+    multiple=True,
+    required=True,
+    help="Search query (repeatable)",
+)
+@click.option(
+    "--type", "-t",
+    type=click.Choice(["stack", "decision", "constraint", "convention", "note"]),
+    default=None,
+    help="Filter by memory type",
+)
+@click.option("--limit", "-l", default=5, help="Maximum number of results per query")
+@click.pass_context
+def search_many(
+    ctx: click.Context,
+    queries: tuple[str, ...],
+    type: Optional[str],
+    limit: int,
+) -> None:
+    """Run several searches with one batched embedding and vector lookup."""
+    from memoryforge.core.embedding_factory import create_embedding_service
+    from memoryforge.core.retrieval import RetrievalEngine
+    
+    config: Config = ctx.obj["config"]
+    db, qdrant, project_id = ensure_initialized(config)
+    
+    try:
+        embedding_service = create_embedding_service(config)
+    except (ValueError, ImportError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    
+    retrieval = RetrievalEngine(
+        sqlite_db=db,
+        qdrant_store=qdrant,
+        embedding_service=embedding_service,
+        project_id=project_id,
+        max_results=config.max_results,
+        min_score=config.min_score,
+    )
+    
+    memory_type = MemoryType(type) if type else None
+    
+    with console.status("[bold green]Searching..."):
+        all_results = retrieval.search_many(
+            queries=list(queries),
+            memory_type=memory_type,
+            limit=limit,
+        )
+    
+    for query, results in zip(queries, all_results):
+        console.print(f"\n[bold]{query}[/bold]")
+        if not results:
+            console.print("[dim]No relevant memories found.[/dim]")
+            continue
+        
+        for i, result in enumerate(results, 1):
+            memory = result.memory
+            console.print(f"[cyan]{i}. {result.explanation}[/cyan]")
+            console.print(f"   {memory.content[:200]}{'...' if len(memory.content) > 200 else ''}")
+        console.print()
+
+
 @main.command()
 @click.option("--limit", "-l", default=20, help="Number of memories to show")
 @click.pass_context
 def timeline(ctx: click.Context, limit: int) -> None:
     """Show memory timeline (chronological view)."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
-    memories = db.get_recent_memories(project_id, limit=limit)
+    memories = list(db.list_memories_summary(project_id, confirmed_only=False, limit=limit))
     
     if not memories:
         console.print("[yellow]No memories found.[/yellow]")
@@ -461,37 +719,36 @@ def timeline(ctx: click.Context, limit: int) -> None:
         
     console.print(f"\n[bold]Memory Timeline ({len(memories)} most recent):[/bold]\n")
     
-    for memory in memories:
-        date_str = memory.created_at.strftime("%Y-%m-%d %H:%M")
+    # Build one styled Text for the whole timeline and print it once
+    output = Text()
+    for mem_id, mem_type, content, _, created_at in memories:
+        # ISO timestamp "YYYY-MM-DDTHH:MM..." -> "YYYY-MM-DD HH:MM"
+        date_str = created_at[:16].replace("T", " ")
         
-        # Color code types
-        type_color = "white"
-        if memory.type == MemoryType.DECISION:
-            type_color = "red"
-        elif memory.type == MemoryType.STACK:
-            type_color = "cyan"
-        elif memory.type == MemoryType.CONSTRAINT:
-            type_color = "yellow"
-            
-        console.print(f"[{type_color}][{date_str}] {memory.type.value.upper()}[/{type_color}]")
-        console.print(f"[dim]ID: {memory.id}[/dim]")
+        output.append(
+            f"[{date_str}] {mem_type.upper()}\n",
+            style=TIMELINE_TYPE_STYLES.get(mem_type, TIMELINE_DEFAULT_STYLE),
+        )
+        output.append(f"ID: {mem_id}\n", style=DIM_STYLE)
         
         # Truncate content for display
-        content = memory.content
         if len(content) > 100:
             content = content[:100] + "..."
-        console.print(f"  {content}")
-        console.print("")
+        output.append(f"  {content}\n\n")
+    
+    console.print(output)
 
 
 @main.command()
 @click.pass_context
 def serve(ctx: click.Context) -> None:
     """Start the MCP server."""
+    from memoryforge.mcp.server import run_mcp_server
+    
     config: Config = ctx.obj["config"]
     
     # Ensure initialized
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     console.print("[bold blue]Starting MemoryForge MCP Server...[/bold blue]")
     console.print(f"[dim]Project: {config.project_name}[/dim]")
@@ -502,7 +759,8 @@ def serve(ctx: click.Context) -> None:
     
     # Run the async server
     try:
-        asyncio.run(run_mcp_server(config, project_id))
+        with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+            runner.run(run_mcp_server(config, project_id))
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped.[/yellow]")
 
@@ -528,7 +786,7 @@ def project_create(ctx: click.Context, name: str, path: str) -> None:
     
     # Ensure storage exists
     config.ensure_directories()
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     router = ProjectRouter(db, config)
     
     try:
@@ -553,7 +811,7 @@ def project_switch(ctx: click.Context, name_or_id: str) -> None:
         console.print("[red]MemoryForge not initialized. Run 'memoryforge init' first.[/red]")
         sys.exit(1)
     
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     router = ProjectRouter(db, config)
     
     try:
@@ -583,12 +841,14 @@ def project_list(ctx: click.Context) -> None:
         console.print("[dim]No projects found. Run 'memoryforge init' first.[/dim]")
         return
     
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     router = ProjectRouter(db, config)
     
-    projects = router.list_projects()
+    memory_counts = db.get_memory_counts(confirmed_only=True)
+    projects = router.list_projects_iter()
     
-    if not projects:
+    first = next(projects, None)
+    if first is None:
         console.print("[dim]No projects found.[/dim]")
         return
     
@@ -601,24 +861,25 @@ def project_list(ctx: click.Context) -> None:
     table.add_column("Memories", justify="right")
     table.add_column("ID", style="dim")
     
-    for proj in projects:
-        is_active = "→" if str(proj.id) == active_id else ""
-        memory_count = db.get_memory_count(proj.id, confirmed_only=True)
-        table.add_row(
-            is_active,
-            proj.name,
-            proj.root_path[:40] + "..." if len(proj.root_path) > 40 else proj.root_path,
-            str(memory_count),
-            str(proj.id)[:8],
-        )
-    
-    console.print(table)
+    # Rows are rendered progressively as they are read from the cursor
+    with Live(table, console=console, refresh_per_second=10):
+        for proj in chain((first,), projects):
+            is_active = "→" if str(proj.id) == active_id else ""
+            memory_count = memory_counts.get(proj.id, 0)
+            table.add_row(
+                is_active,
+                proj.name,
+                proj.root_path[:40] + "..." if len(proj.root_path) > 40 else proj.root_path,
+                str(memory_count),
+                str(proj.id)[:8],
+            )
 
 
 @project.command("delete")
 @click.argument("name_or_id")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 @click.pass_context
-def project_delete(ctx: click.Context, name_or_id: str) -> None:
+def project_delete(ctx: click.Context, name_or_id: str, yes: bool) -> None:
     """Delete a project (blocked if has memories)."""
     config: Config = ctx.obj["config"]
     
@@ -626,7 +887,7 @@ def project_delete(ctx: click.Context, name_or_id: str) -> None:
         console.print("[red]MemoryForge not initialized.[/red]")
         sys.exit(1)
     
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     router = ProjectRouter(db, config)
     
     # Find project
@@ -651,7 +912,7 @@ def project_delete(ctx: click.Context, name_or_id: str) -> None:
             console.print("[dim]Delete all memories first.[/dim]")
             sys.exit(1)
         
-        if not Confirm.ask("Delete this project?"):
+        if not yes and not Confirm.ask("Delete this project?"):
             return
         
         router.delete_project(project.id)
@@ -673,7 +934,7 @@ def status(ctx: click.Context) -> None:
         console.print("Run: [cyan]memoryforge init[/cyan]")
         return
     
-    db = SQLiteDatabase(config.sqlite_path)
+    db = SQLiteDatabase.open(config.sqlite_path)
     router = ProjectRouter(db, config)
     
     status_info = router.get_project_status()
@@ -714,7 +975,7 @@ def git(ctx: click.Context) -> None:
 def git_status(ctx: click.Context) -> None:
     """Show git integration status."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.git_integration import GitIntegration
     
@@ -748,7 +1009,7 @@ def git_status(ctx: click.Context) -> None:
 def git_sync(ctx: click.Context, limit: int) -> None:
     """Scan for architectural commits and suggest memory links."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.git_integration import GitIntegration
     
@@ -784,11 +1045,12 @@ def git_sync(ctx: click.Context, limit: int) -> None:
         table.add_column("Files", justify="right", width=6)
         
         for s in unlinked[:limit]:
+            commit_info = s["commit"]
             table.add_row(
-                s["commit"]["short_sha"],
-                s["commit"]["message"][:38] + "..." if len(s["commit"]["message"]) > 40 else s["commit"]["message"],
+                commit_info["short_sha"],
+                truncate(commit_info["message"]),
                 s["reason"],
-                str(s["commit"]["files_changed"]),
+                str(commit_info["files_changed"]),
             )
         
         console.print(table)
@@ -809,7 +1071,7 @@ def git_sync(ctx: click.Context, limit: int) -> None:
 def git_link(ctx: click.Context, memory_id: str, commit_sha: str) -> None:
     """Link a memory to a git commit."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.git_integration import GitIntegration
     from memoryforge.models import LinkType
@@ -858,7 +1120,7 @@ def git_link(ctx: click.Context, memory_id: str, commit_sha: str) -> None:
 def git_activity(ctx: click.Context, days: int) -> None:
     """Show recent git activity summary."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.git_integration import GitIntegration
     
@@ -924,16 +1186,23 @@ def consolidate_suggest(ctx: click.Context, limit: int) -> None:
     
     console.print(f"\n[bold]Consolidation Suggestions ({len(suggestions)}):[/bold]\n")
     
+    # Build every panel first and print them as one group; memory content
+    # goes in as plain Text so brackets are never parsed as markup
+    panels = []
     for i, suggestion in enumerate(suggestions, 1):
-        console.print(Panel(
-            f"[bold]Similarity:[/bold] {suggestion.similarity_score:.2%}\n\n"
-            f"[bold]Memory 1:[/bold] {suggestion.source_memories[0].content[:100]}...\n"
-            f"[dim]ID: {suggestion.source_memories[0].id}[/dim]\n\n"
-            f"[bold]Memory 2:[/bold] {suggestion.source_memories[1].content[:100]}...\n"
-            f"[dim]ID: {suggestion.source_memories[1].id}[/dim]",
+        first, second = suggestion.source_memories[:2]
+        panels.append(Panel(
+            Text.assemble(
+                ("Similarity:", BOLD_STYLE), f" {suggestion.similarity_score:.2%}\n\n",
+                ("Memory 1:", BOLD_STYLE), f" {first.content[:100]}...\n",
+                (f"ID: {first.id}", DIM_STYLE), "\n\n",
+                ("Memory 2:", BOLD_STYLE), f" {second.content[:100]}...\n",
+                (f"ID: {second.id}", DIM_STYLE),
+            ),
             title=f"Suggestion {i}",
             border_style="yellow",
         ))
+    console.print(Group(*panels))
     
     console.print("\n[dim]To consolidate, use:[/dim]")
     console.print("[cyan]memoryforge consolidate apply <id1> <id2> --content 'merged content'[/cyan]")
@@ -1019,7 +1288,6 @@ def consolidate_rollback(ctx: click.Context, consolidated_id: str) -> None:
     db, qdrant, project_id = ensure_initialized(config)
     
     from memoryforge.core.memory_consolidator import MemoryConsolidator
-    from memoryforge.core.embedding_factory import create_embedding_service
     
     try:
         uid = UUID(consolidated_id)
@@ -1027,7 +1295,7 @@ def consolidate_rollback(ctx: click.Context, consolidated_id: str) -> None:
         console.print(f"[red]Invalid memory ID: {consolidated_id}[/red]")
         sys.exit(1)
     
-    embedding_service = create_embedding_service(config)
+    embedding_service = LazyEmbeddingService(config)
     consolidator = MemoryConsolidator(
         sqlite_db=db,
         qdrant_store=qdrant,
@@ -1060,9 +1328,8 @@ def consolidate_stats(ctx: click.Context) -> None:
     db, qdrant, project_id = ensure_initialized(config)
     
     from memoryforge.core.memory_consolidator import MemoryConsolidator
-    from memoryforge.core.embedding_factory import create_embedding_service
     
-    embedding_service = create_embedding_service(config)
+    embedding_service = LazyEmbeddingService(config)
     consolidator = MemoryConsolidator(
         sqlite_db=db,
         qdrant_store=qdrant,
@@ -1101,7 +1368,7 @@ def stale(ctx: click.Context) -> None:
 def stale_list(ctx: click.Context) -> None:
     """List stale memories."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     stale_memories = db.get_stale_memories(project_id)
     
@@ -1118,7 +1385,7 @@ def stale_list(ctx: click.Context) -> None:
     for memory in stale_memories:
         table.add_row(
             str(memory.id)[:8] + "...",
-            memory.content[:38] + "..." if len(memory.content) > 40 else memory.content,
+            truncate(memory.content),
             memory.stale_reason or "Unknown",
             memory.type.value,
         )
@@ -1134,7 +1401,7 @@ def stale_list(ctx: click.Context) -> None:
 def stale_mark(ctx: click.Context, memory_id: str, reason: str) -> None:
     """Mark a memory as stale."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     try:
         uid = UUID(memory_id)
@@ -1158,7 +1425,7 @@ def stale_mark(ctx: click.Context, memory_id: str, reason: str) -> None:
 def stale_clear(ctx: click.Context, memory_id: str) -> None:
     """Clear the stale flag from a memory."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     try:
         uid = UUID(memory_id)
@@ -1184,9 +1451,8 @@ def stale_unused(ctx: click.Context, days: int) -> None:
     db, qdrant, project_id = ensure_initialized(config)
     
     from memoryforge.core.memory_consolidator import MemoryConsolidator
-    from memoryforge.core.embedding_factory import create_embedding_service
     
-    embedding_service = create_embedding_service(config)
+    embedding_service = LazyEmbeddingService(config)
     consolidator = MemoryConsolidator(
         sqlite_db=db,
         qdrant_store=qdrant,
@@ -1213,7 +1479,7 @@ def stale_unused(ctx: click.Context, days: int) -> None:
         last_access = memory.last_accessed.strftime("%Y-%m-%d") if memory.last_accessed else "Never"
         table.add_row(
             str(memory.id)[:8] + "...",
-            memory.content[:38] + "..." if len(memory.content) > 40 else memory.content,
+            truncate(memory.content),
             memory.created_at.strftime("%Y-%m-%d"),
             last_access,
         )
@@ -1238,7 +1504,7 @@ def migrate(ctx: click.Context, rollback: bool, backup_file: str) -> None:
     if not config.sqlite_path.exists() and not rollback:
         console.print("[yellow]Database not found. Initializing new v2 database...[/yellow]")
         # Standard init will handle it
-        db = SQLiteDatabase(config.sqlite_path)
+        db = SQLiteDatabase.open(config.sqlite_path)
         console.print("[green]Created new database.[/green]")
         return
 
@@ -1341,11 +1607,17 @@ def sync_init(ctx: click.Context, path: str, key: str) -> None:
 
 @sync.command("push")
 @click.option("--force", is_flag=True, help="Overwrite remote files even if newer")
+@click.option(
+    "--workers", "-w",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Worker threads for encryption and file I/O (capped at 16)",
+)
 @click.pass_context
-def sync_push(ctx: click.Context, force: bool) -> None:
+def sync_push(ctx: click.Context, force: bool, workers: Optional[int]) -> None:
     """Export memories to sync backend."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     if not config.sync_path or not config.sync_key:
         console.print("[red]Sync not initialized.[/red]")
@@ -1362,7 +1634,7 @@ def sync_push(ctx: click.Context, force: bool) -> None:
         manager = SyncManager(db, adapter, encryption, project_id)
         
         with console.status("[bold green]Encrypting and pushing memories..."):
-            result = manager.export_memories(force=force)
+            result = manager.export_memories(force=force, workers=workers)
         
         if result.conflicts:
             for conflict in result.conflicts:
@@ -1371,6 +1643,8 @@ def sync_push(ctx: click.Context, force: bool) -> None:
             for error in result.errors:
                 console.print(f"[red]✗ Error: {error}[/red]")
         console.print(f"[green]✓ Pushed {result.exported} memories[/green]")
+        if result.unchanged:
+            console.print(f"[dim]{result.unchanged} unchanged memories skipped[/dim]")
         
     except (ImportError, EncryptionError) as e:
         console.print(f"[red]Sync failed: {e}[/red]")
@@ -1379,11 +1653,17 @@ def sync_push(ctx: click.Context, force: bool) -> None:
 
 
 @sync.command("pull")
+@click.option(
+    "--workers", "-w",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Worker threads for encryption and file I/O (capped at 16)",
+)
 @click.pass_context
-def sync_pull(ctx: click.Context) -> None:
+def sync_pull(ctx: click.Context, workers: Optional[int]) -> None:
     """Import memories from sync backend."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     if not config.sync_path or not config.sync_key:
         console.print("[red]Sync not initialized.[/red]")
@@ -1400,7 +1680,7 @@ def sync_pull(ctx: click.Context) -> None:
         manager = SyncManager(db, adapter, encryption, project_id)
         
         with console.status("[bold green]Pulling and decrypting memories..."):
-            result = manager.import_memories()
+            result = manager.import_memories(workers=workers)
         
         if result.conflicts:
             for conflict in result.conflicts:
@@ -1435,8 +1715,10 @@ def sync_status(ctx: click.Context) -> None:
     
     # Check if sync path exists and has files
     if config.sync_path.exists():
-        sync_files = list(config.sync_path.glob("*.json"))
-        console.print(f"\n[bold]Remote memories:[/bold] {len(sync_files)} files")
+        from memoryforge.sync.local_file_adapter import LocalFileAdapter
+        
+        file_count = LocalFileAdapter(config.sync_path).count_files()
+        console.print(f"\n[bold]Remote memories:[/bold] {file_count} files")
     else:
         console.print("\n[yellow]Sync directory does not exist yet.[/yellow]")
 
@@ -1460,7 +1742,7 @@ def share(ctx: click.Context) -> None:
 def share_memory(ctx: click.Context, memory_id: str, share_with: str, note: str) -> None:
     """Share a specific memory with the team."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     if not config.sync_path or not config.sync_key:
         console.print("[red]Sync not initialized.[/red]")
@@ -1562,9 +1844,9 @@ def share_list(ctx: click.Context) -> None:
                 
                 table.add_row(
                     data.get("id", "?")[:8] + "...",
-                    (data.get("content", "")[:33] + "...") if len(data.get("content", "")) > 35 else data.get("content", ""),
+                    truncate(data.get("content", ""), 35),
                     data.get("shared_at", "?")[:16],
-                    (data.get("note", "") or "-")[:18],
+                    truncate(data.get("note", "") or "-", 18),
                 )
             except Exception:
                 continue
@@ -1663,8 +1945,14 @@ def share_import(ctx: click.Context, filename: str) -> None:
 
 @main.command("reindex")
 @click.option("--force", is_flag=True, help="Skip confirmation prompt")
+@click.option(
+    "--batch-size", "-b",
+    default=64,
+    type=click.IntRange(min=1),
+    help="Memories embedded per batch",
+)
 @click.pass_context
-def reindex(ctx: click.Context, force: bool) -> None:
+def reindex(ctx: click.Context, force: bool, batch_size: int) -> None:
     """Rebuild vector index from SQLite data.
     
     Use this after changing embedding provider or if Qdrant gets corrupted.
@@ -1689,37 +1977,62 @@ def reindex(ctx: click.Context, force: bool) -> None:
     
     embedding_service = create_embedding_service(config)
     
-    # Get all confirmed memories
-    memories = db.list_memories(project_id, confirmed_only=True, limit=10000)
+    # Stream confirmed memories rather than loading the whole project
+    memories = db.iter_memories(project_id, confirmed_only=True, batch_size=batch_size)
     
     success_count = 0
     error_count = 0
-    
-    with console.status("[bold green]Reindexing memories...") as status:
-        for i, memory in enumerate(memories):
-            try:
-                # Generate new embedding
-                embedding = embedding_service.generate(memory.content)
-                
-                # Upsert to Qdrant
-                vector_id = qdrant.upsert(
-                    memory_id=str(memory.id),
-                    embedding=embedding,
-                    metadata={
-                        "type": memory.type.value,
-                        "project_id": str(project_id),
-                    }
+    pending = None
+    last_update = 0.0
+    
+    # Embeddings are generated on a worker thread so that the next batch is
+    # embedded while this thread writes the previous one to Qdrant and SQLite
+    with console.status("[bold green]Reindexing memories...") as status, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            batch = list(islice(memories, batch_size))
+            if batch:
+                future = executor.submit(
+                    embedding_service.generate_batch, [m.content for m in batch]
                 )
+            
+            if pending:
+                indexed, embeddings_future = pending
+                try:
+                    # One Qdrant request per batch
+                    vector_ids = qdrant.upsert_batch([
+                        (m.id, embedding, m.type.value, m.created_at.isoformat())
+                        for m, embedding in zip(indexed, embeddings_future.result())
+                    ], wait=False)
+                    
+                    # Update embedding references
+                    db.save_embedding_references(
+                        [(m.id, vector_id) for m, vector_id in zip(indexed, vector_ids)]
+                    )
+                    
+                    success_count += len(indexed)
+                except Exception as e:
+                    error_count += len(indexed)
+                    logger.warning(f"Failed to reindex batch of {len(indexed)} memories: {e}")
                 
-                # Update embedding reference
-                db.save_embedding_reference(memory.id, vector_id)
-                
-                success_count += 1
-                status.update(f"[bold green]Reindexing memories... {i+1}/{len(memories)}")
-                
-            except Exception as e:
-                error_count += 1
-                logger.warning(f"Failed to reindex memory {memory.id}: {e}")
+                # Small batches finish faster than the spinner redraws, so
+                # refresh the counter at most STATUS_REFRESH_INTERVAL apart
+                now = time.monotonic()
+                if now - last_update >= STATUS_REFRESH_INTERVAL:
+                    done = success_count + error_count
+                    status.update(
+                        f"[bold green]Reindexing memories... {done}/{memory_count}"
+                    )
+                    last_update = now
+            
+            if not batch:
+                break
+            pending = (batch, future)
+        
+        qdrant.flush()
+    
+    # Cached consolidation pairs were computed from the old vectors
+    db.clear_similarity_cache(project_id)
     
     console.print(f"\n[green]✓ Reindexed {success_count} memories[/green]")
     if error_count > 0:
@@ -1746,7 +2059,7 @@ def graph(ctx: click.Context) -> None:
 def graph_view(ctx: click.Context, memory_id: str) -> None:
     """View memory relationships (graph view)."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.graph_builder import GraphBuilder
     
@@ -1811,7 +2124,7 @@ def graph_view(ctx: click.Context, memory_id: str) -> None:
 def graph_link(ctx: click.Context, source_id: str, target_id: str, relation_type: str) -> None:
     """Link two memories with a relationship."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.graph_builder import GraphBuilder
     from memoryforge.models import RelationType
@@ -1856,7 +2169,7 @@ def conflicts(ctx: click.Context) -> None:
 def conflicts_list(ctx: click.Context, memory_id: str) -> None:
     """List sync conflict history."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.conflict_resolver import ConflictResolver
     
@@ -1902,7 +2215,7 @@ def conflicts_list(ctx: click.Context, memory_id: str) -> None:
 def conflicts_show(ctx: click.Context, memory_id: str) -> None:
     """Show detailed conflict history for a memory."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.conflict_resolver import ConflictResolver
     
@@ -1948,7 +2261,7 @@ def confidence(ctx: click.Context) -> None:
 def confidence_show(ctx: click.Context, memory_id: str) -> None:
     """Show confidence score details for a memory."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.confidence_scorer import ConfidenceScorer
     
@@ -1989,7 +2302,7 @@ def confidence_show(ctx: click.Context, memory_id: str) -> None:
 def confidence_update(ctx: click.Context, memory_id: str) -> None:
     """Recalculate confidence score for a memory."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.confidence_scorer import ConfidenceScorer
     
@@ -2021,7 +2334,7 @@ def confidence_update(ctx: click.Context, memory_id: str) -> None:
 def confidence_low(ctx: click.Context, threshold: float) -> None:
     """List memories with low confidence scores."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.confidence_scorer import ConfidenceScorer
     
@@ -2042,7 +2355,7 @@ def confidence_low(ctx: click.Context, threshold: float) -> None:
         table.add_row(
             str(memory.id)[:8] + "...",
             f"{memory.confidence_score:.2f}",
-            memory.content[:38] + "..." if len(memory.content) > 40 else memory.content,
+            truncate(memory.content),
             memory.type.value,
         )
     
@@ -2056,7 +2369,7 @@ def confidence_low(ctx: click.Context, threshold: float) -> None:
 def confidence_refresh(ctx: click.Context) -> None:
     """Recalculate confidence scores for all memories in the project."""
     config: Config = ctx.obj["config"]
-    db, _, project_id = ensure_initialized(config)
+    db, project_id = ensure_project(config)
     
     from memoryforge.core.confidence_scorer import ConfidenceScorer
     
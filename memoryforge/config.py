@@ -7,6 +7,7 @@ Default location: ~/.memoryforge/config.yaml
 
 import os
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -20,6 +21,19 @@ def get_default_storage_path() -> Path:
     return Path.home() / ".memoryforge"
 
 
+# libyaml's loader and dumper when PyYAML was built with it, else the
+# pure-Python ones
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=4)
+def _load_yaml(config_path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a config file; cached per path until its mtime or size changes."""
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 class EmbeddingProvider(str, Enum):
     """Available embedding providers."""
     OPENAI = "openai"
@@ -78,12 +92,13 @@ class Config(BaseSettings):
         if config_path is None:
             config_path = get_default_storage_path() / "config.yaml"
         
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                data = yaml.safe_load(f) or {}
-            return cls(**data)
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            return cls()
         
-        return cls()
+        data = _load_yaml(config_path.resolve(), stat.st_mtime_ns, stat.st_size)
+        return cls(**data)
     
     def save(self, config_path: Optional[Path] = None) -> None:
         """Save configuration to YAML file."""
@@ -92,30 +107,14 @@ class Config(BaseSettings):
         
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        data = {
-            "project_name": self.project_name,
-            "project_root": self.project_root,
-            "storage_path": str(self.storage_path),
-            "embedding_provider": self.embedding_provider.value,
-            "openai_api_key": self.openai_api_key,
-            "openai_embedding_model": self.openai_embedding_model,
-            "local_embedding_model": self.local_embedding_model,
-            "max_results": self.max_results,
-            "min_score": self.min_score,
-            "mcp_host": self.mcp_host,
-            "mcp_port": self.mcp_port,
-            # v2 fields
-            "active_project_id": self.active_project_id,
-            "enable_git_integration": self.enable_git_integration,
-            "consolidation_threshold": self.consolidation_threshold,
-            # v2.1 fields
-            "sync_key": self.sync_key,
-            "sync_path": str(self.sync_path) if self.sync_path else None,
-            "sync_backend": self.sync_backend,
-        }
+        # JSON mode turns paths and enums into plain strings for YAML
+        data = self.model_dump(mode="json")
         
         with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+        
+        # Don't serve a stale parse if the rewrite keeps the same mtime and size
+        _load_yaml.cache_clear()
     
     @property
     def sqlite_path(self) -> Path:
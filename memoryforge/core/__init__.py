@@ -1,15 +1,23 @@
 """Core engine components for MemoryForge."""
 
-from memoryforge.core.memory_manager import MemoryManager
-from memoryforge.core.retrieval import RetrievalEngine
-from memoryforge.core.embedding_service import EmbeddingService
-from memoryforge.core.local_embedding_service import LocalEmbeddingService
-from memoryforge.core.embedding_factory import create_embedding_service, get_embedding_dimension
-from memoryforge.core.validation import ValidationLayer
-# v3 components
-from memoryforge.core.graph_builder import GraphBuilder
-from memoryforge.core.confidence_scorer import ConfidenceScorer
-from memoryforge.core.conflict_resolver import ConflictResolver, SyncConflict
+import importlib
+
+# Lazy imports: the embedding and vector store dependencies are heavy, so
+# submodules are only loaded when one of their names is first accessed.
+_EXPORTS = {
+    "MemoryManager": "memoryforge.core.memory_manager",
+    "RetrievalEngine": "memoryforge.core.retrieval",
+    "EmbeddingService": "memoryforge.core.embedding_service",
+    "LocalEmbeddingService": "memoryforge.core.local_embedding_service",
+    "create_embedding_service": "memoryforge.core.embedding_factory",
+    "get_embedding_dimension": "memoryforge.core.embedding_factory",
+    "ValidationLayer": "memoryforge.core.validation",
+    # v3
+    "GraphBuilder": "memoryforge.core.graph_builder",
+    "ConfidenceScorer": "memoryforge.core.confidence_scorer",
+    "ConflictResolver": "memoryforge.core.conflict_resolver",
+    "SyncConflict": "memoryforge.core.conflict_resolver",
+}
 
 __all__ = [
     "MemoryManager",
@@ -26,3 +34,10 @@ __all__ = [
     "SyncConflict",
 ]
 
+
+def __getattr__(name):
+    """Lazy import of core components."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
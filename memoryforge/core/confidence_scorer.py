@@ -8,13 +8,22 @@ Calculates and manages memory confidence scores based on:
 - Conflict history
 """
 
+import math
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
+import numpy as np
+
 from memoryforge.models import Memory
 from memoryforge.storage.sqlite_db import SQLiteDatabase
 
+# 0.5 ** x == exp(x * ln 0.5), and exp is cheaper than a general pow
+_LN_HALF = math.log(0.5)
+
+# Conflict score indexed by conflict count; four or more share the last entry
+_CONFLICT_SCORES = (1.0, 0.7, 0.5, 0.5, 0.3)
+
 
 class ConfidenceScorer:
     """Calculates and manages memory confidence scores."""
@@ -32,7 +41,7 @@ class ConfidenceScorer:
         """Initialize the confidence scorer."""
         self.db = db
     
-    def calculate_score(self, memory: Memory) -> float:
+    def calculate_score(self, memory: Memory, now: Optional[datetime] = None) -> float:
         """Calculate the confidence score for a memory.
         
         Score is based on:
@@ -41,13 +50,26 @@ class ConfidenceScorer:
         - Usage frequency (more accesses = higher, but diminishing returns)
         - Conflict history (more conflicts = lower)
         
+        Pass `now` when scoring several memories so they share one
+        reference time.
+        
         Returns a score between 0.0 and 1.0.
         """
-        confirmation_score = self._confirmation_score(memory)
-        recency_score = self._recency_score(memory)
-        usage_score = self._usage_score(memory)
-        conflict_score = self._conflict_score(memory.id)
-        
+        return self._weighted_score(
+            self._confirmation_score(memory),
+            self._recency_score(memory, now),
+            self._usage_score(memory),
+            self._conflict_score(memory.id),
+        )
+    
+    def _weighted_score(
+        self,
+        confirmation_score: float,
+        recency_score: float,
+        usage_score: float,
+        conflict_score: float,
+    ) -> float:
+        """Combine the sub-scores into the final score."""
         # Weighted average
         total = (
             confirmation_score * self.WEIGHT_CONFIRMATION +
@@ -62,9 +84,10 @@ class ConfidenceScorer:
         """Score based on confirmation status."""
         return 1.0 if memory.confirmed else 0.3
     
-    def _recency_score(self, memory: Memory) -> float:
+    def _recency_score(self, memory: Memory, now: Optional[datetime] = None) -> float:
         """Score based on how recently the memory was accessed/created."""
-        now = datetime.utcnow()
+        if now is None:
+            now = datetime.utcnow()
         
         # Use last_accessed if available, otherwise created_at
         reference_time = memory.last_accessed or memory.created_at
@@ -72,18 +95,13 @@ class ConfidenceScorer:
         days_since = (now - reference_time).days
         
         # Exponential decay
-        half_life = self.RECENCY_HALF_LIFE_DAYS
-        score = 0.5 ** (days_since / half_life)
-        
-        return score
+        return math.exp(days_since * (_LN_HALF / self.RECENCY_HALF_LIFE_DAYS))
     
     def _usage_score(self, memory: Memory) -> float:
         """Score based on usage frequency.
         
         Uses diminishing returns formula: 1 - (1 / (1 + log(accesses + 1)))
         """
-        import math
-        
         # If never accessed, return base score
         if not memory.last_accessed:
             return 0.5
@@ -94,17 +112,12 @@ class ConfidenceScorer:
     
     def _conflict_score(self, memory_id: UUID) -> float:
         """Score based on conflict history (more conflicts = lower score)."""
-        conflicts = self.db.get_conflict_history(memory_id)
-        conflict_count = len(conflicts)
-        
-        if conflict_count == 0:
-            return 1.0
-        elif conflict_count == 1:
-            return 0.7
-        elif conflict_count <= 3:
-            return 0.5
-        else:
-            return 0.3
+        return self._conflict_score_for_count(self.db.get_conflict_count(memory_id))
+    
+    @staticmethod
+    def _conflict_score_for_count(conflict_count: int) -> float:
+        """Map a number of logged conflicts to a score."""
+        return _CONFLICT_SCORES[min(conflict_count, len(_CONFLICT_SCORES) - 1)]
     
     def update_score(self, memory_id: UUID) -> float:
         """Recalculate and update the confidence score for a memory."""
@@ -120,15 +133,42 @@ class ConfidenceScorer:
     def batch_update_scores(self, project_id: UUID) -> dict[UUID, float]:
         """Recalculate scores for all memories in a project.
         
+        Reads the scoring inputs with one query, computes every score with
+        NumPy and writes them back in one transaction. Matches
+        calculate_score for each memory.
+        
         Returns a dict mapping memory_id -> new_score.
         """
-        memories = self.db.list_memories(project_id, confirmed_only=False, limit=10000)
-        results = {}
+        rows = self.db.get_scoring_columns(project_id)
+        if not rows:
+            return {}
+        
+        ids, confirmed, accessed, days_since, conflict_counts = zip(*rows)
+        confirmed = np.array(confirmed, dtype=bool)
+        accessed = np.array(accessed, dtype=bool)
+        # Whole days, as timedelta.days in _recency_score
+        days_since = np.floor(np.array(days_since, dtype=np.float64))
+        conflict_counts = np.array(conflict_counts)
+        
+        confirmation_scores = np.where(confirmed, 1.0, 0.3)
+        recency_scores = np.exp(days_since * (_LN_HALF / self.RECENCY_HALF_LIFE_DAYS))
+        usage_scores = np.where(accessed, 0.8, 0.5)
+        conflict_scores = np.take(
+            _CONFLICT_SCORES,
+            np.minimum(conflict_counts, len(_CONFLICT_SCORES) - 1),
+        )
+        
+        totals = np.clip(
+            confirmation_scores * self.WEIGHT_CONFIRMATION +
+            recency_scores * self.WEIGHT_RECENCY +
+            usage_scores * self.WEIGHT_USAGE +
+            conflict_scores * self.WEIGHT_CONFLICTS,
+            0.0,
+            1.0,
+        )
         
-        for memory in memories:
-            new_score = self.calculate_score(memory)
-            self.db.update_confidence_score(memory.id, new_score)
-            results[memory.id] = new_score
+        results = dict(zip(map(UUID, ids), totals.tolist()))
+        self.db.update_confidence_scores(list(results.items()))
         
         return results
     
@@ -146,28 +186,36 @@ class ConfidenceScorer:
         if not memory:
             raise ValueError(f"Memory {memory_id} not found")
         
-        conflicts = self.db.get_conflict_history(memory_id)
+        # Each sub-score is computed once, from one conflict lookup and
+        # one reference time, and reused for the total
+        conflict_count = self.db.get_conflict_count(memory_id)
+        confirmation_score = self._confirmation_score(memory)
+        recency_score = self._recency_score(memory, datetime.utcnow())
+        usage_score = self._usage_score(memory)
+        conflict_score = self._conflict_score_for_count(conflict_count)
         
         return {
             "memory_id": str(memory_id),
             "current_score": memory.confidence_score,
             "breakdown": {
                 "confirmation": {
-                    "score": self._confirmation_score(memory),
+                    "score": confirmation_score,
                     "confirmed": memory.confirmed,
                 },
                 "recency": {
-                    "score": self._recency_score(memory),
+                    "score": recency_score,
                     "last_accessed": memory.last_accessed.isoformat() if memory.last_accessed else None,
                     "created_at": memory.created_at.isoformat(),
                 },
                 "usage": {
-                    "score": self._usage_score(memory),
+                    "score": usage_score,
                 },
                 "conflicts": {
-                    "score": self._conflict_score(memory_id),
-                    "conflict_count": len(conflicts),
+                    "score": conflict_score,
+                    "conflict_count": conflict_count,
                 },
             },
-            "calculated_score": self.calculate_score(memory),
+            "calculated_score": self._weighted_score(
+                confirmation_score, recency_score, usage_score, conflict_score
+            ),
         }
@@ -46,20 +46,15 @@ class ConflictResolver:
     ) -> bool:
         """Check if there's a conflict between local and remote versions.
         
-        A conflict exists if:
-        - Both versions exist
-        - Content differs
-        - Remote was updated after local was last synced
+        A conflict exists if both versions exist and their content differs.
+        Timestamps only decide the winner: last-write-wins with a content
+        tiebreak gives the same result on every replica, so equal
+        timestamps need no special case.
         """
         if not local_memory:
             return False  # No conflict if local doesn't exist
         
-        if local_memory.content == remote_content:
-            return False  # No conflict if content is same
-        
-        # If both have been modified, it's a conflict
-        local_updated = local_memory.updated_at or local_memory.created_at
-        return remote_updated_at != local_updated
+        return local_memory.content != remote_content
     
     def resolve_last_write_wins(
         self,
@@ -69,18 +64,30 @@ class ConflictResolver:
         
         The version with the most recent update timestamp wins.
         """
-        local = conflict.local_memory
-        
-        if not local:
-            # No local version, remote wins by default
+        if self._remote_wins(conflict):
             return self._apply_remote(conflict, ConflictResolution.REMOTE_WINS)
+        return self._apply_local(conflict, ConflictResolution.LOCAL_WINS)
+    
+    def resolve_last_write_wins_batch(
+        self,
+        conflicts: list[SyncConflict],
+    ) -> list[ConflictLog]:
+        """Resolve many conflicts by last-write-wins in one transaction.
         
-        local_time = local.updated_at or local.created_at
+        Remote winners are written with a single batched update and every
+        resolution is logged with a single batched insert.
+        """
+        updates = []
+        logs = []
+        for conflict in conflicts:
+            if self._remote_wins(conflict):
+                updates.append((conflict.memory_id, conflict.remote_content))
+                logs.append(self._conflict_log(conflict, ConflictResolution.REMOTE_WINS))
+            else:
+                logs.append(self._conflict_log(conflict, ConflictResolution.LOCAL_WINS))
         
-        if conflict.remote_updated_at > local_time:
-            return self._apply_remote(conflict, ConflictResolution.REMOTE_WINS)
-        else:
-            return self._apply_local(conflict, ConflictResolution.LOCAL_WINS)
+        self.db.apply_conflict_resolutions(updates, logs)
+        return logs
     
     def resolve_manual(
         self,
@@ -89,17 +96,9 @@ class ConflictResolver:
         resolved_by: str = "user",
     ) -> ConflictLog:
         """Manually resolve a conflict with custom merged content."""
-        # Update the memory with merged content
-        self.db.update_memory(conflict.memory_id, merged_content)
-        
-        # Log the conflict
-        return self.db.log_conflict(
-            memory_id=conflict.memory_id,
-            local_content=conflict.local_memory.content if conflict.local_memory else None,
-            remote_content=conflict.remote_content,
-            resolution=ConflictResolution.MANUAL,
-            resolved_by=resolved_by,
-        )
+        log = self._conflict_log(conflict, ConflictResolution.MANUAL, resolved_by)
+        self.db.apply_conflict_resolutions([(conflict.memory_id, merged_content)], [log])
+        return log
     
     def resolve_keep_local(self, conflict: SyncConflict) -> ConflictLog:
         """Keep the local version, discard remote."""
@@ -109,37 +108,56 @@ class ConflictResolver:
         """Keep the remote version, discard local."""
         return self._apply_remote(conflict, ConflictResolution.REMOTE_WINS)
     
-    def _apply_local(
-        self,
+    @staticmethod
+    def _remote_wins(conflict: SyncConflict) -> bool:
+        """Whether the remote version is the last write.
+        
+        Versions are ordered by (timestamp, content), a last-writer-wins
+        register with the content as tiebreaker, so both sides of a sync
+        pick the same winner and re-applying a resolution changes nothing.
+        """
+        local = conflict.local_memory
+        if not local:
+            # No local version, remote wins by default
+            return True
+        local_key = (local.updated_at or local.created_at, local.content)
+        return (conflict.remote_updated_at, conflict.remote_content) > local_key
+    
+    @staticmethod
+    def _conflict_log(
         conflict: SyncConflict,
         resolution: ConflictResolution,
+        resolved_by: str = "system",
     ) -> ConflictLog:
-        """Apply local version and log the conflict."""
-        # Local is already the current state, just log the conflict
-        return self.db.log_conflict(
+        """Build the log entry for a resolved conflict."""
+        return ConflictLog(
             memory_id=conflict.memory_id,
             local_content=conflict.local_memory.content if conflict.local_memory else None,
             remote_content=conflict.remote_content,
             resolution=resolution,
-            resolved_by="system",
+            resolved_by=resolved_by,
         )
     
+    def _apply_local(
+        self,
+        conflict: SyncConflict,
+        resolution: ConflictResolution,
+    ) -> ConflictLog:
+        """Apply local version and log the conflict."""
+        # Local is already the current state, just log the conflict
+        log = self._conflict_log(conflict, resolution)
+        self.db.apply_conflict_resolutions([], [log])
+        return log
+    
     def _apply_remote(
         self,
         conflict: SyncConflict,
         resolution: ConflictResolution,
     ) -> ConflictLog:
         """Apply remote version and log the conflict."""
-        # Update to remote content
-        self.db.update_memory(conflict.memory_id, conflict.remote_content)
-        
-        return self.db.log_conflict(
-            memory_id=conflict.memory_id,
-            local_content=conflict.local_memory.content if conflict.local_memory else None,
-            remote_content=conflict.remote_content,
-            resolution=resolution,
-            resolved_by="system",
-        )
+        log = self._conflict_log(conflict, resolution)
+        self.db.apply_conflict_resolutions([(conflict.memory_id, conflict.remote_content)], [log])
+        return log
     
     def list_conflicts(
         self,
@@ -150,4 +168,4 @@ class ConflictResolver:
     
     def get_conflict_count(self, memory_id: UUID) -> int:
         """Get the number of conflicts for a memory."""
-        return len(self.db.get_conflict_history(memory_id))
+        return self.db.get_conflict_count(memory_id)
@@ -6,6 +6,7 @@ Supports both OpenAI (paid) and local sentence-transformers (free).
 """
 
 import logging
+from functools import lru_cache
 from typing import Protocol, Union
 
 from memoryforge.config import Config, EmbeddingProvider
@@ -27,6 +28,9 @@ def create_embedding_service(config: Config) -> EmbeddingServiceProtocol:
     """
     Create an embedding service based on configuration.
     
+    Services are shared per provider, model and key, so repeated calls in
+    one process (e.g. several MCP tool handlers) reuse the same client.
+    
     Args:
         config: MemoryForge configuration
         
@@ -34,52 +38,64 @@ def create_embedding_service(config: Config) -> EmbeddingServiceProtocol:
         An embedding service instance (OpenAI or Local)
     """
     if config.embedding_provider == EmbeddingProvider.OPENAI:
-        return _create_openai_service(config)
-    else:
-        return _create_local_service(config)
+        if not config.openai_api_key:
+            raise ValueError(
+                "OpenAI API key is required for OpenAI embeddings. "
+                "Set it in config or use 'local' embedding provider instead."
+            )
+        return _cached_service(
+            EmbeddingProvider.OPENAI, config.openai_embedding_model, config.openai_api_key
+        )
+    return _cached_service(EmbeddingProvider.LOCAL, config.local_embedding_model, "")
+
+
+@lru_cache(maxsize=4)
+def _cached_service(
+    provider: EmbeddingProvider,
+    model: str,
+    api_key: str,
+) -> EmbeddingServiceProtocol:
+    """Build the service for one provider/model/key combination."""
+    if provider == EmbeddingProvider.OPENAI:
+        return _create_openai_service(model, api_key)
+    return _create_local_service(model)
 
 
-def _create_openai_service(config: Config) -> EmbeddingServiceProtocol:
+def _create_openai_service(model: str, api_key: str) -> EmbeddingServiceProtocol:
     """Create OpenAI embedding service."""
     from memoryforge.core.embedding_service import EmbeddingService
     
-    if not config.openai_api_key:
-        raise ValueError(
-            "OpenAI API key is required for OpenAI embeddings. "
-            "Set it in config or use 'local' embedding provider instead."
-        )
-    
-    logger.info(f"Using OpenAI embeddings: {config.openai_embedding_model}")
-    return EmbeddingService(
-        api_key=config.openai_api_key,
-        model=config.openai_embedding_model,
-    )
+    logger.info(f"Using OpenAI embeddings: {model}")
+    return EmbeddingService(api_key=api_key, model=model)
 
 
-def _create_local_service(config: Config) -> EmbeddingServiceProtocol:
+def _create_local_service(model: str) -> EmbeddingServiceProtocol:
     """Create local sentence-transformers embedding service."""
     from memoryforge.core.local_embedding_service import LocalEmbeddingService
     
-    logger.info(f"Using local embeddings: {config.local_embedding_model}")
-    return LocalEmbeddingService(model_name=config.local_embedding_model)
+    logger.info(f"Using local embeddings: {model}")
+    return LocalEmbeddingService(model_name=model)
+
+
+# Common local model dimensions
+LOCAL_MODEL_DIMENSIONS = {
+    "all-MiniLM-L6-v2": 384,
+    "all-MiniLM-L12-v2": 384,
+    "all-mpnet-base-v2": 768,
+    "paraphrase-MiniLM-L6-v2": 384,
+    "multi-qa-MiniLM-L6-cos-v1": 384,
+}
 
 
+@lru_cache(maxsize=16)
 def get_embedding_dimension(provider: EmbeddingProvider, model: str = "") -> int:
     """
     Get the embedding dimension for a provider/model combination.
     
     This is needed for Qdrant collection setup before the service is created.
+    Resolved from a static table, so no model is ever loaded.
     """
     if provider == EmbeddingProvider.OPENAI:
         # OpenAI text-embedding-3-small/large both use 1536
         return 1536
-    else:
-        # Common local model dimensions
-        local_dimensions = {
-            "all-MiniLM-L6-v2": 384,
-            "all-MiniLM-L12-v2": 384,
-            "all-mpnet-base-v2": 768,
-            "paraphrase-MiniLM-L6-v2": 384,
-            "multi-qa-MiniLM-L6-cos-v1": 384,
-        }
-        return local_dimensions.get(model, 384)
+    return LOCAL_MODEL_DIMENSIONS.get(model, 384)
@@ -6,11 +6,17 @@ Includes retry logic and async-safe design.
 """
 
 import asyncio
+import hashlib
 import logging
+import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from openai import OpenAI, APIError, RateLimitError
+import numpy as np
+from openai import AsyncOpenAI, OpenAI, APIConnectionError, APIError, RateLimitError
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,19 @@ EMBEDDING_DIMENSION = 1536
 # Retry configuration
 MAX_RETRIES = 3
 BASE_DELAY = 1.0  # seconds
+MAX_RETRY_AFTER = 60.0  # longest server-requested wait honoured, in seconds
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})  # plus any 5xx
+
+# Concurrent single requests when a batch request fails
+FALLBACK_WORKERS = 8
+
+# Embeddings kept in memory per service, least recently used evicted first
+CACHE_MAX_ENTRIES = 10_000
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so concurrent retries spread out."""
+    return BASE_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5)
 
 
 class EmbeddingService:
@@ -31,6 +50,7 @@ class EmbeddingService:
     - Exponential backoff for retries
     - Rate limit handling
     - Batch embedding support
+    - In-memory cache of recent embeddings, keyed by text digest
     """
     
     def __init__(
@@ -44,19 +64,61 @@ class EmbeddingService:
         
         self.client = OpenAI(api_key=api_key)
         self.model = model
-        self._request_queue: asyncio.Queue = asyncio.Queue()
+        self._api_key = api_key
+        self._async_client: Optional[AsyncOpenAI] = None
+        # float32 vectors: a quarter of the size of float lists, and the
+        # precision Qdrant stores them at anyway
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Fixed-size digest of a text, so the cache does not hold the texts."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[list[float]]:
+        """Get a cached embedding as a new list and mark it recently used."""
+        with self._cache_lock:
+            embedding = self._cache.get(key)
+            if embedding is None:
+                return None
+            self._cache.move_to_end(key)
+        return embedding.tolist()
+    
+    def _cache_put(self, key: bytes, embedding: list[float]) -> list[float]:
+        """
+        Store an embedding, evicting the least recently used past the limit.
+        
+        Returns the embedding as stored, so a fresh result and a later
+        cache hit for the same text are the same float32-rounded vector.
+        """
+        stored = np.asarray(embedding, dtype=np.float32)
+        with self._cache_lock:
+            self._cache[key] = stored
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return stored.tolist()
     
     def generate(self, text: str) -> list[float]:
         """
         Generate an embedding for a single text.
         
+        Texts embedded recently by this service are answered from the
+        cache without an API call.
+        
         Args:
             text: The text to embed
             
         Returns:
             List of floats representing the embedding vector
         """
-        return self._generate_with_retry(text)
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(key, self._generate_with_retry(text))
     
     def _generate_with_retry(self, text: str) -> list[float]:
         """Generate embedding with exponential backoff retry."""
@@ -69,37 +131,59 @@ class EmbeddingService:
                     model=self.model,
                 )
                 return response.data[0].embedding
-                
-            except RateLimitError as e:
-                last_error = e
-                delay = BASE_DELAY * (2 ** attempt)
-                logger.warning(
-                    f"Rate limit hit, retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})"
-                )
-                time.sleep(delay)
-                
             except APIError as e:
-                last_error = e
-                if e.status_code and e.status_code >= 500:
-                    # Server error, retry
-                    delay = BASE_DELAY * (2 ** attempt)
-                    logger.warning(
-                        f"API server error, retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})"
-                    )
-                    time.sleep(delay)
-                else:
-                    # Client error, don't retry
+                if not self._is_retryable(e):
                     raise
+                last_error = e
+                if attempt + 1 < MAX_RETRIES:
+                    time.sleep(self._retry_delay(e, attempt))
         
         # All retries exhausted
         raise RuntimeError(
             f"Failed to generate embedding after {MAX_RETRIES} attempts: {last_error}"
         )
     
+    @staticmethod
+    def _is_retryable(error: APIError) -> bool:
+        """Whether a failed request may succeed if sent again."""
+        if isinstance(error, (RateLimitError, APIConnectionError)):
+            return True
+        status_code = getattr(error, "status_code", None) or 0
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    
+    @staticmethod
+    def _retry_delay(error: APIError, attempt: int) -> float:
+        """
+        Get the wait before retrying a failed request.
+        
+        A Retry-After sent with the error is honoured (up to
+        MAX_RETRY_AFTER); otherwise exponential backoff with jitter is used.
+        """
+        delay = _backoff_delay(attempt)
+        response = getattr(error, "response", None)
+        if response is not None:
+            headers = response.headers
+            try:
+                if "retry-after-ms" in headers:
+                    delay = float(headers["retry-after-ms"]) / 1000
+                elif "retry-after" in headers:
+                    delay = float(headers["retry-after"])
+            except ValueError:
+                pass  # HTTP-date form; keep the backoff
+            delay = min(max(delay, 0.0), MAX_RETRY_AFTER)
+        
+        reason = "Rate limit hit" if isinstance(error, RateLimitError) else "API request failed"
+        logger.warning(
+            f"{reason}, retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})"
+        )
+        return delay
+    
     def generate_batch(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embeddings for multiple texts.
         
+        Cached texts are not sent again; the rest go in one request.
+        
         Args:
             texts: List of texts to embed
             
@@ -109,27 +193,67 @@ class EmbeddingService:
         if not texts:
             return []
         
-        # OpenAI supports batch embeddings
+        keys = [self._cache_key(text) for text in texts]
+        results = [self._cache_get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(results) if embedding is None]
+        if not missing:
+            return results
+        
+        # Only texts not in the cache are sent; OpenAI supports batch embeddings
+        missing_texts = [texts[i] for i in missing]
         try:
             response = self.client.embeddings.create(
-                input=texts,
+                input=missing_texts,
                 model=self.model,
             )
-            return [item.embedding for item in response.data]
-        except Exception as e:
+            embeddings = [item.embedding for item in response.data]
+        except APIError as e:
+            # Permanent errors (auth, bad request, quota) would fail for
+            # every text too, so only transient ones fall back
+            if not self._is_retryable(e):
+                raise
             logger.error(f"Batch embedding failed: {e}")
-            # Fallback to individual embedding
-            return [self.generate(text) for text in texts]
+            # Fallback to individual embeddings, several requests in flight
+            with ThreadPoolExecutor(max_workers=min(FALLBACK_WORKERS, len(missing_texts))) as pool:
+                embeddings = list(pool.map(self._generate_with_retry, missing_texts))
+        
+        for i, embedding in zip(missing, embeddings):
+            results[i] = self._cache_put(keys[i], embedding)
+        return results
     
     async def generate_async(self, text: str) -> list[float]:
         """
-        Async wrapper for embedding generation.
+        Generate an embedding without blocking the event loop.
         
-        This runs the synchronous OpenAI call in a thread pool
-        to avoid blocking the event loop.
+        Uses the async OpenAI client directly, so waiting on the API holds
+        no executor thread.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.generate, text)
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+        
+        last_error: Optional[Exception] = None
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = await self._async_client.embeddings.create(
+                    input=text,
+                    model=self.model,
+                )
+                return self._cache_put(key, response.data[0].embedding)
+            except APIError as e:
+                if not self._is_retryable(e):
+                    raise
+                last_error = e
+                if attempt + 1 < MAX_RETRIES:
+                    await asyncio.sleep(self._retry_delay(e, attempt))
+        
+        raise RuntimeError(
+            f"Failed to generate embedding after {MAX_RETRIES} attempts: {last_error}"
+        )
     
     @property
     def dimension(self) -> int:
@@ -6,8 +6,11 @@ All git operations are read-only - human memories take precedence.
 """
 
 import logging
+import re
+import time
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from memoryforge.config import Config
@@ -17,6 +20,46 @@ from memoryforge.core.git_scanner import GitScanner, CommitInfo, GitNotAvailable
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched commit list is reused before git is asked again
+COMMIT_CACHE_TTL = 30.0
+
+# Significant words for commit matching: 4+ word characters
+KEYWORD_PATTERN = re.compile(r"\w{4,}")
+
+# Reason shown for an architectural commit, by the first keyword (in this
+# order, not by position in the message) that appears in it
+ARCHITECTURAL_REASONS = {
+    "refactor": "Refactoring change",
+    "migrate": "Migration",
+    "architecture": "Architecture change",
+    "design": "Design change",
+    "breaking": "Breaking change",
+    "rewrite": "Rewrite",
+    "restructure": "Restructuring",
+    "upgrade": "Upgrade",
+    "deprecate": "Deprecation",
+    "remove": "Removal",
+}
+
+# One lookahead per keyword, tried in table order, so a single match call
+# finds the highest-priority keyword anywhere in the message
+ARCHITECTURAL_REASON_PATTERN = re.compile(
+    "|".join(f"(?=.*?{kw})(?P<{kw}>)" for kw in ARCHITECTURAL_REASONS),
+    re.DOTALL,
+)
+
+# Common words ignored when matching memories to commits
+COMMON_WORDS = frozenset({
+    "the", "and", "for", "are", "but", "not", "you", "all",
+    "can", "had", "her", "was", "one", "our", "out", "has",
+    "have", "been", "were", "will", "with", "this", "that",
+    "from", "they", "what", "when", "make", "like", "time",
+    "just", "know", "take", "into", "year", "your", "good",
+    "some", "could", "them", "than", "look", "only", "come",
+    "over", "such", "also", "back", "after", "work", "first",
+    "well", "most", "must",
+})
+
 
 class GitIntegration:
     """
@@ -44,6 +87,10 @@ class GitIntegration:
         self.config = config
         self.project_id = project_id
         self._scanner: Optional[GitScanner] = None
+        # (fetched at, limit, commits, keyword -> indexes of commits using it)
+        self._commit_cache: Optional[
+            Tuple[float, int, List[CommitInfo], Dict[str, List[int]]]
+        ] = None
     
     def _get_scanner(self) -> Optional[GitScanner]:
         """Get or create the git scanner."""
@@ -66,6 +113,34 @@ class GitIntegration:
             logger.warning(f"Git not available: {e}")
             return None
     
+    def _recent_commits(
+        self,
+        scanner: GitScanner,
+        limit: int,
+    ) -> Tuple[List[CommitInfo], Dict[str, List[int]]]:
+        """
+        Get recent commits and a keyword index over their messages.
+        
+        The last fetch is reused for COMMIT_CACHE_TTL seconds so per-memory
+        lookups run git and build the index once. The index maps each
+        lowercased message word to the positions of the commits using it;
+        positions past the returned list belong to a larger cached fetch.
+        """
+        now = time.monotonic()
+        if self._commit_cache is not None:
+            fetched_at, cached_limit, commits, index = self._commit_cache
+            if now - fetched_at < COMMIT_CACHE_TTL and limit <= cached_limit:
+                return commits[:limit], index
+        
+        commits = scanner.get_recent_commits(limit)
+        index: Dict[str, List[int]] = defaultdict(list)
+        for position, commit in enumerate(commits):
+            for word in set(KEYWORD_PATTERN.findall(commit.message_lower)):
+                index[word].append(position)
+        index = dict(index)
+        self._commit_cache = (now, limit, commits, index)
+        return commits, index
+    
     def is_available(self) -> bool:
         """Check if git integration is available and enabled."""
         return self._get_scanner() is not None
@@ -198,38 +273,24 @@ class GitIntegration:
         if not scanner:
             return []
         
-        # Extract keywords from memory content
-        words = set(memory.content.lower().split())
-        
-        # Filter to significant words (>3 chars, not common)
-        common_words = {"the", "and", "for", "are", "but", "not", "you", "all", 
-                       "can", "had", "her", "was", "one", "our", "out", "has",
-                       "have", "been", "were", "will", "with", "this", "that",
-                       "from", "they", "what", "when", "make", "like", "time",
-                       "just", "know", "take", "into", "year", "your", "good",
-                       "some", "could", "them", "than", "look", "only", "come",
-                       "over", "such", "also", "back", "after", "work", "first",
-                       "well", "most", "must"}
-        keywords = [w for w in words if len(w) > 3 and w not in common_words]
+        # Extract significant words (4+ chars, not common) from memory content
+        keywords = set(KEYWORD_PATTERN.findall(memory.content.lower())) - COMMON_WORDS
         
         if not keywords:
             return []
         
-        # Get recent commits
-        commits = scanner.get_recent_commits(100)
-        
-        # Score each commit by keyword matches
-        scored = []
-        for commit in commits:
-            message_lower = commit.message.lower()
-            matches = sum(1 for kw in keywords if kw in message_lower)
-            if matches > 0:
-                score = matches / len(keywords)
-                scored.append((commit, score))
-        
-        # Sort by score and return top results
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:limit]
+        # Count keyword matches per recent commit through the word index
+        commits, index = self._recent_commits(scanner, 100)
+        matches: Counter = Counter()
+        for keyword in keywords:
+            matches.update(index.get(keyword, ()))
+        
+        # Best score first; ties keep the newest commit first
+        ranked = sorted(
+            (item for item in matches.items() if item[0] < len(commits)),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return [(commits[i], count / len(keywords)) for i, count in ranked[:limit]]
     
     def sync_architectural_commits(self) -> List[dict]:
         """
@@ -248,10 +309,12 @@ class GitIntegration:
         # Find architectural commits
         arch_commits = scanner.find_architectural_commits(limit=50)
         
+        # Check which commits are already linked to a memory in one query
+        memory_counts = self.db.get_commit_memory_counts([c.sha for c in arch_commits])
+        
         suggestions = []
         for commit in arch_commits:
-            # Check if already linked to a memory
-            linked_memories = self.db.get_memories_by_commit(commit.sha)
+            memory_count = memory_counts.get(commit.sha, 0)
             
             # Determine why this commit was flagged
             reason = self._get_architectural_reason(commit)
@@ -266,38 +329,18 @@ class GitIntegration:
                     "files_changed": len(commit.files_changed),
                 },
                 "reason": reason,
-                "has_memory": len(linked_memories) > 0,
-                "memory_count": len(linked_memories),
+                "has_memory": memory_count > 0,
+                "memory_count": memory_count,
             })
         
         return suggestions
     
     def _get_architectural_reason(self, commit: CommitInfo) -> str:
         """Determine why a commit was flagged as architectural."""
-        message_lower = commit.message.lower()
-        
-        if "refactor" in message_lower:
-            return "Refactoring change"
-        elif "migrate" in message_lower:
-            return "Migration"
-        elif "architecture" in message_lower:
-            return "Architecture change"
-        elif "design" in message_lower:
-            return "Design change"
-        elif "breaking" in message_lower:
-            return "Breaking change"
-        elif "rewrite" in message_lower:
-            return "Rewrite"
-        elif "restructure" in message_lower:
-            return "Restructuring"
-        elif "upgrade" in message_lower:
-            return "Upgrade"
-        elif "deprecate" in message_lower:
-            return "Deprecation"
-        elif "remove" in message_lower:
-            return "Removal"
-        else:
-            return "Architectural keyword detected"
+        match = ARCHITECTURAL_REASON_PATTERN.match(commit.message_lower)
+        if match:
+            return ARCHITECTURAL_REASONS[match.lastgroup]
+        return "Architectural keyword detected"
     
     def get_recent_activity(self, days: int = 7) -> dict:
         """
@@ -313,22 +356,18 @@ class GitIntegration:
         if not scanner:
             return {"available": False}
         
-        from datetime import datetime, timedelta
-        
-        commits = scanner.get_recent_commits(100)
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        commits, _ = self._recent_commits(scanner, 100)
+        cutoff = time.time() - days * 86400
         
-        recent_commits = [c for c in commits if c.date.replace(tzinfo=None) > cutoff]
+        recent_commits = [c for c in commits if c.date_epoch > cutoff]
         
         # Count files changed
-        all_files = set()
-        for commit in recent_commits:
-            all_files.update(commit.files_changed)
+        all_files = set().union(*(c.files_changed for c in recent_commits))
         
         return {
             "available": True,
             "days": days,
             "commit_count": len(recent_commits),
             "files_changed": len(all_files),
-            "authors": list(set(c.author for c in recent_commits)),
+            "authors": list({c.author for c in recent_commits}),
         }
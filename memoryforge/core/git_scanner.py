@@ -10,10 +10,12 @@ Requires: gitpython (optional dependency)
 
 import logging
 import subprocess
-from dataclasses import dataclass
-from datetime import datetime
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,23 @@ DEFAULT_ARCHITECTURAL_KEYWORDS = [
 ]
 
 
+# Control characters used to delimit `git log` output; they cannot appear
+# in commit subjects, author names or file names printed by git
+RECORD_SEPARATOR = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+
+
+@lru_cache(maxsize=1024)
+def _parse_git_date(date_str: str) -> datetime:
+    """
+    Parse a strict ISO 8601 date printed by git (%aI).
+    
+    Commits made in the same second share a timestamp, so parses are cached.
+    fromisoformat accepts a trailing "Z" on Python 3.11+.
+    """
+    return datetime.fromisoformat(date_str)
+
+
 @dataclass
 class CommitInfo:
     """Information about a git commit."""
@@ -41,16 +60,28 @@ class CommitInfo:
     author: str
     date: datetime
     files_changed: List[str]
+    # Commit time as UTC epoch seconds, for cheap comparisons
+    date_epoch: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Resolve the commit time once; naive dates are taken as UTC."""
+        date = self.date if self.date.tzinfo else self.date.replace(tzinfo=UTC)
+        self.date_epoch = date.timestamp()
     
     @property
     def short_sha(self) -> str:
         """Get short SHA (first 7 chars)."""
         return self.sha[:7]
     
-    @property
+    @cached_property
     def first_line(self) -> str:
         """Get first line of commit message."""
-        return self.message.split("\n")[0]
+        return self.message.partition("\n")[0]
+    
+    @cached_property
+    def message_lower(self) -> str:
+        """Lowercased message, computed once for keyword matching."""
+        return self.message.lower()
 
 
 class GitNotAvailableError(Exception):
@@ -79,6 +110,10 @@ class GitScanner:
         self.repo_path = Path(repo_path).resolve()
         self._validate_git_available()
         self._validate_git_repo()
+        
+        # Long-running `git cat-file --batch` for file reads, started on first use
+        self._catfile: Optional[subprocess.Popen] = None
+        self._catfile_lock = threading.Lock()
     
     def _validate_git_available(self) -> None:
         """Check if git command is available."""
@@ -135,6 +170,68 @@ class GitScanner:
             logger.error(f"git command error: {e}")
             return ""
     
+    def _stream_git(self, *args: str) -> Iterator[str]:
+        """
+        Run a git command and yield its output line by line.
+        
+        Parsing overlaps with git producing the output, and the whole
+        output is never held in memory at once. Yields nothing further
+        if the command fails.
+        
+        Args:
+            *args: Git command arguments
+            
+        Yields:
+            Output lines without trailing newlines
+        """
+        try:
+            proc = subprocess.Popen(
+                ["git", *args],
+                cwd=str(self.repo_path),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except Exception as e:
+            logger.error(f"git command error: {e}")
+            return
+        
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    yield line.rstrip("\n")
+            if proc.wait(timeout=30) != 0:
+                logger.warning(f"git command failed: git {' '.join(args)}")
+        except subprocess.TimeoutExpired:
+            logger.error(f"git command timed out: git {' '.join(args)}")
+        finally:
+            # Stop git if the caller gave up early
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+    
+    @staticmethod
+    def _parse_commit(header: str, files_changed: List[str]) -> Optional[CommitInfo]:
+        """Build a CommitInfo from a SHA/author/date/subject header line."""
+        parts = header.split(FIELD_SEPARATOR, 3)
+        if len(parts) < 4:
+            return None
+        
+        sha, author, date_str, message = parts
+        
+        try:
+            date = _parse_git_date(date_str)
+        except ValueError:
+            date = datetime.utcnow()
+        
+        return CommitInfo(
+            sha=sha,
+            message=message,
+            author=author,
+            date=date,
+            files_changed=files_changed,
+        )
+    
     def get_current_branch(self) -> Optional[str]:
         """Get the current branch name."""
         output = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
@@ -155,52 +252,48 @@ class GitScanner:
         Returns:
             List of CommitInfo objects, newest first
         """
-        # Format: SHA|author|date|subject
-        format_str = "%H|%an|%aI|%s"
-        output = self._run_git(
+        return self._log_commits(limit)
+    
+    def _log_commits(self, limit: int, *filters: str) -> List[CommitInfo]:
+        """
+        List non-merge commits with their changed files, newest first.
+        
+        Args:
+            limit: Maximum number of commits to return
+            *filters: Extra `git log` options selecting which commits to list
+            
+        Returns:
+            List of CommitInfo objects
+        """
+        # One git process for the whole range: each record starts with a
+        # record separator, followed by the header line and the file names
+        lines = self._stream_git(
             "log",
-            f"--format={format_str}",
-            f"-n{limit}",
+            "--format=%x1e%H%x1f%an%x1f%aI%x1f%s",
+            "--name-only",
+            f"--max-count={limit}",
             "--no-merges",
+            *filters,
         )
         
-        if not output:
-            return []
-        
         commits = []
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-            
-            parts = line.split("|", 3)
-            if len(parts) < 4:
-                continue
-            
-            sha, author, date_str, message = parts
-            
-            try:
-                # Parse ISO format date
-                date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            except ValueError:
-                date = datetime.utcnow()
-            
-            # Get files changed for this commit
-            files_output = self._run_git(
-                "diff-tree",
-                "--no-commit-id",
-                "--name-only",
-                "-r",
-                sha,
-            )
-            files_changed = [f for f in files_output.strip().split("\n") if f]
-            
-            commits.append(CommitInfo(
-                sha=sha,
-                message=message,
-                author=author,
-                date=date,
-                files_changed=files_changed,
-            ))
+        header = None
+        files_changed: List[str] = []
+        for line in lines:
+            if line.startswith(RECORD_SEPARATOR):
+                if header is not None:
+                    commit = self._parse_commit(header, files_changed)
+                    if commit:
+                        commits.append(commit)
+                header = line[1:]
+                files_changed = []
+            elif line:
+                files_changed.append(line)
+        
+        if header is not None:
+            commit = self._parse_commit(header, files_changed)
+            if commit:
+                commits.append(commit)
         
         return commits
     
@@ -214,11 +307,12 @@ class GitScanner:
         Returns:
             CommitInfo or None if not found
         """
-        # Format: SHA|author|date|subject
-        format_str = "%H|%an|%aI|%B"
+        # One git process: the header (full message last) ends with a
+        # record separator, followed by the changed file names
         output = self._run_git(
             "log",
-            f"--format={format_str}",
+            "--format=%H%x1f%an%x1f%aI%x1f%B%x1e",
+            "--name-only",
             "-n1",
             sha,
         )
@@ -226,34 +320,9 @@ class GitScanner:
         if not output:
             return None
         
-        parts = output.strip().split("|", 3)
-        if len(parts) < 4:
-            return None
-        
-        full_sha, author, date_str, message = parts
-        
-        try:
-            date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except ValueError:
-            date = datetime.utcnow()
-        
-        # Get files changed
-        files_output = self._run_git(
-            "diff-tree",
-            "--no-commit-id",
-            "--name-only",
-            "-r",
-            full_sha,
-        )
-        files_changed = [f for f in files_output.strip().split("\n") if f]
-        
-        return CommitInfo(
-            sha=full_sha,
-            message=message.strip(),
-            author=author,
-            date=date,
-            files_changed=files_changed,
-        )
+        header, _, files_output = output.partition(RECORD_SEPARATOR)
+        files_changed = [f for f in files_output.split("\n") if f]
+        return self._parse_commit(header.strip(), files_changed)
     
     def find_architectural_commits(
         self,
@@ -268,23 +337,23 @@ class GitScanner:
         
         Args:
             keywords: Keywords to search for (default: common architecture terms)
-            limit: Maximum commits to scan
+            limit: Maximum commits to return
             
         Returns:
-            Commits matching any of the keywords
+            Commits matching any of the keywords, newest first
         """
         if keywords is None:
             keywords = DEFAULT_ARCHITECTURAL_KEYWORDS
+        elif not keywords:
+            return []
         
-        all_commits = self.get_recent_commits(limit)
-        
-        matching = []
-        for commit in all_commits:
-            message_lower = commit.message.lower()
-            if any(kw.lower() in message_lower for kw in keywords):
-                matching.append(commit)
-        
-        return matching
+        # git filters the history itself; several --grep options match any
+        return self._log_commits(
+            limit,
+            "--regexp-ignore-case",
+            "--fixed-strings",
+            *(f"--grep={kw}" for kw in keywords),
+        )
     
     def find_commits_affecting_file(
         self,
@@ -301,42 +370,21 @@ class GitScanner:
         Returns:
             Commits that modified the file
         """
-        format_str = "%H|%an|%aI|%s"
-        output = self._run_git(
+        lines = self._stream_git(
             "log",
-            f"--format={format_str}",
+            "--format=%H%x1f%an%x1f%aI%x1f%s",
             f"-n{limit}",
             "--follow",
             "--",
             file_path,
         )
         
-        if not output:
-            return []
-        
         commits = []
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-            
-            parts = line.split("|", 3)
-            if len(parts) < 4:
-                continue
-            
-            sha, author, date_str, message = parts
-            
-            try:
-                date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            except ValueError:
-                date = datetime.utcnow()
-            
-            commits.append(CommitInfo(
-                sha=sha,
-                message=message,
-                author=author,
-                date=date,
-                files_changed=[file_path],  # We know it affected this file
-            ))
+        for line in lines:
+            # We know each commit affected this file
+            commit = self._parse_commit(line, [file_path]) if line else None
+            if commit:
+                commits.append(commit)
         
         return commits
     
@@ -351,8 +399,83 @@ class GitScanner:
         Returns:
             File contents or None if file didn't exist
         """
-        output = self._run_git("show", f"{sha}:{file_path}")
-        return output if output else None
+        spec = f"{sha}:{file_path}"
+        if "\n" in spec:
+            # The batch protocol is line-based
+            output = self._run_git("show", spec)
+            return output if output else None
+        
+        with self._catfile_lock:
+            try:
+                content = self._read_blob(spec)
+            except (OSError, ValueError) as e:
+                logger.warning(f"git cat-file failed, restarting: {e}")
+                self._close_catfile()
+                try:
+                    content = self._read_blob(spec)
+                except (OSError, ValueError) as e:
+                    logger.error(f"git cat-file error: {e}")
+                    self._close_catfile()
+                    return None
+        
+        return content if content else None
+    
+    def _read_blob(self, spec: str) -> Optional[str]:
+        """
+        Read one blob through the cat-file coprocess.
+        
+        Must be called with the cat-file lock held.
+        """
+        if self._catfile is None or self._catfile.poll() is not None:
+            self._catfile = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=str(self.repo_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        
+        proc = self._catfile
+        proc.stdin.write(f"{spec}\n".encode())
+        proc.stdin.flush()
+        
+        header = proc.stdout.readline().decode()
+        if not header:
+            raise ValueError("git cat-file exited")
+        
+        # "<spec> missing" / "<spec> ambiguous", where the spec may contain
+        # spaces, or "<sha> <type> <size>" followed by the content
+        header = header.rstrip("\n")
+        if header.endswith((" missing", " ambiguous")):
+            return None
+        
+        _, object_type, size_str = header.rsplit(" ", 2)
+        size = int(size_str)
+        data = proc.stdout.read(size + 1)[:size]
+        if object_type != "blob":
+            return None
+        return data.decode("utf-8", errors="replace")
+    
+    def _close_catfile(self) -> None:
+        """Stop the cat-file coprocess if it is running."""
+        proc, self._catfile = self._catfile, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        proc.stdout.close()
+    
+    def close(self) -> None:
+        """Release the background git process used for file reads."""
+        with self._catfile_lock:
+            self._close_catfile()
+    
+    def __del__(self) -> None:
+        if getattr(self, "_catfile", None) is not None:
+            self._close_catfile()
     
     def get_diff_stats(self, since_sha: str) -> dict:
         """
@@ -364,21 +487,11 @@ class GitScanner:
         Returns:
             Dict with files_changed, insertions, deletions
         """
-        output = self._run_git(
-            "diff",
-            "--stat",
-            "--numstat",
-            f"{since_sha}..HEAD",
-        )
-        
-        if not output:
-            return {"files_changed": 0, "insertions": 0, "deletions": 0}
-        
         insertions = 0
         deletions = 0
         files = set()
         
-        for line in output.strip().split("\n"):
+        for line in self._stream_git("diff", "--numstat", f"{since_sha}..HEAD"):
             parts = line.split("\t")
             if len(parts) >= 3:
                 try:
@@ -64,27 +64,16 @@ class GraphBuilder:
         if not memory:
             raise ValueError(f"Memory {memory_id} not found")
         
-        incoming_relations = self.db.get_memory_relations(memory_id, direction="incoming")
-        outgoing_relations = self.db.get_memory_relations(memory_id, direction="outgoing")
+        # Each direction is one query returning relations with their linked memories
+        incoming_memories = [
+            {"memory": mem, "relation_type": rel.relation_type.value}
+            for rel, mem in self.db.get_memory_relations_with_peers(memory_id, "incoming")
+        ]
         
-        # Fetch the actual memories
-        incoming_memories = []
-        for rel in incoming_relations:
-            mem = self.db.get_memory(rel.source_memory_id)
-            if mem:
-                incoming_memories.append({
-                    "memory": mem,
-                    "relation_type": rel.relation_type.value,
-                })
-        
-        outgoing_memories = []
-        for rel in outgoing_relations:
-            mem = self.db.get_memory(rel.target_memory_id)
-            if mem:
-                outgoing_memories.append({
-                    "memory": mem,
-                    "relation_type": rel.relation_type.value,
-                })
+        outgoing_memories = [
+            {"memory": mem, "relation_type": rel.relation_type.value}
+            for rel, mem in self.db.get_memory_relations_with_peers(memory_id, "outgoing")
+        ]
         
         causality_chain = self.db.get_causality_chain(memory_id)
         
@@ -110,34 +99,40 @@ class GraphBuilder:
         """
         visited: set[UUID] = set()
         result: list[Memory] = []
+        found: set[UUID] = set()
         current_level = {memory_id}
         
         for _ in range(max_depth):
             next_level: set[UUID] = set()
+            # Newly reached IDs in discovery order, fetched once per level
+            reached: dict[UUID, None] = {}
+            
+            layer = current_level - visited
+            visited |= layer
+            
+            # One query for the relations of the whole level
+            relations = self.db.get_relations_for_memories(
+                list(layer),
+                direction="both",
+                relation_types=relation_types,
+            )
             
-            for mid in current_level:
-                if mid in visited:
-                    continue
-                visited.add(mid)
-                
-                relations = self.db.get_memory_relations(mid, direction="both")
-                
-                for rel in relations:
-                    if relation_types and rel.relation_type not in relation_types:
-                        continue
-                    
-                    # Get the other memory in the relation
-                    other_id = (
-                        rel.target_memory_id
-                        if rel.source_memory_id == mid
-                        else rel.source_memory_id
-                    )
-                    
-                    if other_id not in visited:
+            for rel in relations:
+                # Get the other memory in the relation, from either end
+                for mid, other_id in (
+                    (rel.source_memory_id, rel.target_memory_id),
+                    (rel.target_memory_id, rel.source_memory_id),
+                ):
+                    if mid in layer and other_id not in visited:
                         next_level.add(other_id)
-                        mem = self.db.get_memory(other_id)
-                        if mem and mem not in result:
-                            result.append(mem)
+                        if other_id not in found:
+                            reached[other_id] = None
+            
+            memories = self.db.get_memories(list(reached))
+            for other_id in reached:
+                if other_id in memories:
+                    found.add(other_id)
+                    result.append(memories[other_id])
             
             current_level = next_level
         
@@ -153,12 +148,11 @@ class GraphBuilder:
         Finds memories with 'caused_by' relation pointing to this decision.
         """
         relations = self.db.get_memory_relations(decision_id, direction="incoming")
-        consequences = []
-        
-        for rel in relations:
-            if rel.relation_type == RelationType.CAUSED_BY:
-                mem = self.db.get_memory(rel.source_memory_id)
-                if mem:
-                    consequences.append(mem)
+        source_ids = [
+            rel.source_memory_id
+            for rel in relations
+            if rel.relation_type == RelationType.CAUSED_BY
+        ]
         
-        return consequences
+        memories = self.db.get_memories(source_ids)
+        return [memories[mid] for mid in source_ids if mid in memories]
@@ -5,7 +5,11 @@ Provides free, local embeddings without requiring an API key.
 Default model: all-MiniLM-L6-v2 (fast, good quality, 384 dimensions)
 """
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -13,6 +17,29 @@ logger = logging.getLogger(__name__)
 # Default local model - good balance of speed and quality
 DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
+# Texts encoded per forward pass; bounds peak memory for large batches
+DEFAULT_BATCH_SIZE = 64
+
+# Threads for async callers; the model already uses several cores per call
+ASYNC_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=8)
+def _load_model(model_name: str):
+    """Load a sentence-transformers model, once per process and name."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "sentence-transformers is required for local embeddings. "
+            "Install it with: pip install memoryforge[local]"
+        )
+    
+    logger.info(f"Loading local embedding model: {model_name}")
+    model = SentenceTransformer(model_name)
+    logger.info(f"Model loaded. Embedding dimension: {model.get_sentence_embedding_dimension()}")
+    return model
+
 
 class LocalEmbeddingService:
     """
@@ -30,35 +57,34 @@ class LocalEmbeddingService:
     - First load downloads the model (~90MB)
     """
     
-    _model = None  # Class-level cache for the model
-    
-    def __init__(self, model_name: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        normalize: bool = True,
+    ):
         """
         Initialize the local embedding service.
         
         Args:
             model_name: HuggingFace model name for sentence-transformers
+            batch_size: Texts encoded per forward pass
+            normalize: Return unit-length vectors, normalized by the model
         """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self._model = None
         self._dimension: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def _get_model(self):
-        """Lazy load the sentence-transformers model."""
-        if LocalEmbeddingService._model is None or self._dimension is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-            except ImportError:
-                raise ImportError(
-                    "sentence-transformers is required for local embeddings. "
-                    "Install it with: pip install memoryforge[local]"
-                )
-            
-            logger.info(f"Loading local embedding model: {self.model_name}")
-            LocalEmbeddingService._model = SentenceTransformer(self.model_name)
-            self._dimension = LocalEmbeddingService._model.get_sentence_embedding_dimension()
-            logger.info(f"Model loaded. Embedding dimension: {self._dimension}")
-        
-        return LocalEmbeddingService._model
+        """Lazy load the sentence-transformers model and bind it to this service."""
+        model = self._model
+        if model is None:
+            model = self._model = _load_model(self.model_name)
+            self._dimension = model.get_sentence_embedding_dimension()
+        return model
     
     def generate(self, text: str) -> list[float]:
         """
@@ -70,9 +96,7 @@ class LocalEmbeddingService:
         Returns:
             List of floats representing the embedding vector
         """
-        model = self._get_model()
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self._encode(text).tolist()
     
     def generate_batch(self, texts: list[str]) -> list[list[float]]:
         """
@@ -87,19 +111,37 @@ class LocalEmbeddingService:
         if not texts:
             return []
         
-        model = self._get_model()
-        embeddings = model.encode(texts, convert_to_numpy=True)
-        return [emb.tolist() for emb in embeddings]
+        # One conversion of the whole (N, D) array, not one per row
+        return self._encode(texts).tolist()
+    
+    def _encode(self, texts):
+        """Encode a text or list of texts into a NumPy array."""
+        return self._get_model().encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=self.normalize,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the bounded thread pool used by generate_async."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=ASYNC_WORKERS,
+                thread_name_prefix="local-embedding",
+            )
+        return self._executor
     
     async def generate_async(self, text: str) -> list[float]:
         """
         Async wrapper for embedding generation.
         
-        Runs synchronously since local models are fast enough.
+        Encoding runs on the service's own pool of at most ASYNC_WORKERS
+        threads, so bursts of async calls do not oversubscribe the CPU.
         """
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.generate, text)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.generate, text)
     
     @property
     def dimension(self) -> int:
@@ -20,6 +20,8 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from memoryforge.config import Config
 from memoryforge.models import Memory, MemoryType, MemorySource
 from memoryforge.storage.sqlite_db import SQLiteDatabase
@@ -105,12 +107,29 @@ class MemoryConsolidator:
         """
         Find memory pairs above similarity threshold.
         
+        Results are cached in SQLite until the project's active memories
+        change, so repeated runs skip Qdrant entirely.
+        
         Args:
             limit: Maximum pairs to return
             
         Returns:
             List of (memory1, memory2, similarity_score) tuples
         """
+        fingerprint = self.db.get_memory_fingerprint(self.project_id)
+        cached = self.db.get_cached_similar_pairs(
+            self.project_id, self.threshold, limit, fingerprint
+        )
+        if cached is not None:
+            by_id = self.db.get_memories(
+                list({memory_id for a, b, _ in cached for memory_id in (a, b)})
+            )
+            return [
+                (by_id[a], by_id[b], score)
+                for a, b, score in cached
+                if a in by_id and b in by_id
+            ]
+        
         # Get all confirmed, non-archived memories
         memories = self.db.list_memories(
             project_id=self.project_id,
@@ -122,49 +141,103 @@ class MemoryConsolidator:
         if len(memories) < 2:
             return []
         
-        similar_pairs = []
-        seen_pairs = set()
+        # Reuse the vectors already indexed in Qdrant; only memories
+        # without one are embedded again
+        stored = self.qdrant.get_vectors([m.id for m in memories])
+        
+        embedded_memories, embeddings = self._with_embeddings(memories, stored)
+        
+        if len(embedded_memories) < 2:
+            return []
+        
+        pairs = [
+            (embedded_memories[i], embedded_memories[j], score)
+            for i, j, score in self._pairwise_similarities(embeddings, limit)
+        ]
+        
+        # Only cache complete results; a failed embedding may succeed next time
+        if len(embedded_memories) == len(memories):
+            self.db.save_similar_pairs(
+                self.project_id,
+                self.threshold,
+                limit,
+                fingerprint,
+                [(a.id, b.id, score) for a, b, score in pairs],
+            )
         
-        for i, memory in enumerate(memories):
-            # Get embedding for this memory
+        return pairs
+    
+    def _with_embeddings(
+        self,
+        memories: List[Memory],
+        stored: dict,
+    ) -> Tuple[List[Memory], List[List[float]]]:
+        """
+        Pair memories with their stored vectors, embedding the rest in one
+        batch call.
+        
+        If the batch fails, each missing memory is embedded on its own and
+        memories that still fail are left out.
+        
+        Returns:
+            The memories that have an embedding, in their original order,
+            and those embeddings
+        """
+        embeddings = [stored.get(str(memory.id)) for memory in memories]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
             try:
-                embedding = self.embedding_service.generate(memory.content)
+                generated = self.embedding_service.generate_batch(
+                    [memories[i].content for i in missing]
+                )
             except Exception as e:
-                logger.warning(f"Failed to embed memory {memory.id}: {e}")
-                continue
-            
-            # Search for similar memories
-            results = self.qdrant.search(
-                embedding,
-                limit=10,
-                min_score=self.threshold,
-            )
-            
-            for result in results:
-                other_id = result.id
-                score = result.score
-                
-                # Skip self
-                if other_id == memory.id:
-                    continue
-                
-                # Skip already seen pairs
-                pair_key = tuple(sorted([str(memory.id), str(other_id)]))
-                if pair_key in seen_pairs:
-                    continue
-                seen_pairs.add(pair_key)
-                
-                # Get the other memory
-                other_memory = self.db.get_memory(other_id)
-                if not other_memory or other_memory.is_archived:
-                    continue
-                
-                similar_pairs.append((memory, other_memory, score))
+                logger.warning(f"Batch embedding failed, embedding one at a time: {e}")
+                generated = []
+                for i in missing:
+                    try:
+                        generated.append(self.embedding_service.generate(memories[i].content))
+                    except Exception as e:
+                        logger.warning(f"Failed to embed memory {memories[i].id}: {e}")
+                        generated.append(None)
+            for i, embedding in zip(missing, generated):
+                embeddings[i] = embedding
+        
+        kept = [i for i, embedding in enumerate(embeddings) if embedding is not None]
+        return [memories[i] for i in kept], [embeddings[i] for i in kept]
+    
+    def _pairwise_similarities(
+        self,
+        embeddings: List[List[float]],
+        limit: int,
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Find index pairs whose cosine similarity reaches the threshold.
+        
+        All pairs are scored with one normalized matrix product instead of
+        a vector search per memory.
+        
+        Returns:
+            Up to limit (i, j, score) tuples with i < j, highest score first
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        
+        similarities = matrix @ matrix.T
+        rows, cols = np.triu_indices(len(matrix), k=1)
+        scores = similarities[rows, cols]
+        
+        above = scores >= self.threshold
+        rows, cols, scores = rows[above], cols[above], scores[above]
         
-        # Sort by similarity score
-        similar_pairs.sort(key=lambda x: x[2], reverse=True)
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit)[:limit]
+            rows, cols, scores = rows[top], cols[top], scores[top]
         
-        return similar_pairs[:limit]
+        order = np.argsort(-scores, kind="stable")
+        return [(int(rows[k]), int(cols[k]), float(scores[k])) for k in order]
     
     def suggest_consolidations(
         self,
@@ -284,17 +357,6 @@ class MemoryConsolidator:
         if memory_type is None:
             memory_type = source_memories[0].type
         
-        # 2. Save versions of source memories for rollback
-        version_ids = []
-        for memory in source_memories:
-            version_num = self.db.get_next_version_number(memory.id)
-            version_id = self.db.save_memory_version(
-                memory_id=memory.id,
-                content=memory.content,
-                version=version_num,
-            )
-            version_ids.append(version_id)
-        
         # 3. Create new consolidated memory
         new_memory = Memory(
             id=uuid4(),
@@ -306,33 +368,33 @@ class MemoryConsolidator:
             created_at=datetime.utcnow(),
         )
         
-        self.db.save_memory(new_memory)
+        # 2, 4 & 5. Version the sources for rollback, save the new memory
+        # and archive the sources in a single transaction
+        version_ids = self.db.consolidate_memories(new_memory, source_memories)
         
         # Get embedding and index in Qdrant
         try:
             embedding = self.embedding_service.generate(merged_content)
-            self.qdrant.upsert(new_memory.id, embedding)
+            self.qdrant.upsert(
+                new_memory.id,
+                embedding,
+                new_memory.type.value,
+                new_memory.created_at.isoformat(),
+            )
         except Exception as e:
             logger.warning(f"Failed to index consolidated memory: {e}")
         
-        # 4 & 5. Archive source memories
-        archived_memories = []
-        for memory in source_memories:
-            self.db.archive_memory(
-                memory_id=memory.id,
-                consolidated_into=new_memory.id,
-            )
-            
-            # Remove from Qdrant (archived memories shouldn't be searched)
-            try:
-                self.qdrant.delete(memory.id)
-            except Exception as e:
-                logger.warning(f"Failed to remove archived memory from index: {e}")
-            
-            # Refresh to get updated state
-            archived = self.db.get_memory(memory.id)
-            if archived:
-                archived_memories.append(archived)
+        # Remove sources from Qdrant (archived memories shouldn't be searched)
+        try:
+            self.qdrant.delete_batch([memory.id for memory in source_memories])
+        except Exception as e:
+            logger.warning(f"Failed to remove archived memories from index: {e}")
+        
+        # Refresh to get updated state
+        archived = self.db.get_memories([memory.id for memory in source_memories])
+        archived_memories = [
+            archived[memory.id] for memory in source_memories if memory.id in archived
+        ]
         
         logger.info(
             f"Consolidated {len(source_memories)} memories into {new_memory.id}"
@@ -470,12 +532,11 @@ class MemoryConsolidator:
         
         cutoff = datetime.utcnow() - timedelta(days=days_unused)
         
-        # Get all confirmed memories
-        memories = self.db.list_memories(
+        # Stream all confirmed memories rather than loading them at once
+        memories = self.db.iter_memories(
             project_id=self.project_id,
             confirmed_only=True,
             include_archived=False,
-            limit=1000,
         )
         
         unused = []
@@ -496,23 +557,15 @@ class MemoryConsolidator:
         Returns:
             Dict with consolidation statistics
         """
-        memories = self.db.list_memories(
-            project_id=self.project_id,
-            confirmed_only=True,
-            include_archived=False,
-            limit=1000,
-        )
-        
-        archived = self.db.get_all_archived_memories(self.project_id)
-        stale = self.db.get_stale_memories(self.project_id)
+        counts = self.db.get_memory_state_counts(self.project_id)
         
         # Count similar pairs
         pairs = self.find_similar_pairs(limit=100)
         
         return {
-            "active_memories": len(memories),
-            "archived_memories": len(archived),
-            "stale_memories": len(stale),
+            "active_memories": counts["active"],
+            "archived_memories": counts["archived"],
+            "stale_memories": counts["stale"],
             "similar_pairs": len(pairs),
             "threshold": self.threshold,
         }
@@ -538,30 +591,36 @@ class MemoryConsolidator:
             List of ConsolidationSuggestion with stale memories
         """
         unused = self.find_unused_memories(days_unused)
-        suggestions = []
+        if not unused:
+            return []
         
-        for memory in unused:
-            # Find similar active memories
-            try:
-                embedding = self.embedding_service.generate(memory.content)
-            except Exception as e:
-                logger.warning(f"Failed to embed memory {memory.id}: {e}")
-                continue
-            
-            results = self.qdrant.search(
-                embedding,
-                limit=5,
-                min_score=min_similarity,
-            )
-            
+        # Query with the stored vectors where possible
+        stored = self.qdrant.get_vectors([m.id for m in unused])
+        
+        queried, embeddings = self._with_embeddings(unused, stored)
+        
+        # One batched vector search for every unused memory, then one
+        # query to load all candidate matches
+        all_results = self.qdrant.search_batch(
+            embeddings,
+            limit=5,
+            min_score=min_similarity,
+        )
+        candidates = self.db.get_memories(list({
+            UUID(result["memory_id"]) for results in all_results for result in results
+        }))
+        
+        suggestions = []
+        for memory, results in zip(queried, all_results):
             # Filter out self and archived
             similar_active = []
             for result in results:
-                if result.id == memory.id:
+                other_id = UUID(result["memory_id"])
+                if other_id == memory.id:
                     continue
-                other = self.db.get_memory(result.id)
+                other = candidates.get(other_id)
                 if other and not other.is_archived and not other.is_stale:
-                    similar_active.append((other, result.score))
+                    similar_active.append((other, result["score"]))
             
             if similar_active:
                 # Suggest merging stale memory into active one
@@ -16,7 +16,7 @@ from uuid import UUID
 from memoryforge.models import Memory, MemoryCreate, MemoryType, MemorySource, Project
 from memoryforge.storage.sqlite_db import SQLiteDatabase
 from memoryforge.storage.qdrant_store import QdrantStore
-from memoryforge.core.embedding_service import EmbeddingService
+from memoryforge.core.embedding_factory import EmbeddingServiceProtocol as EmbeddingService
 from memoryforge.core.validation import ValidationLayer, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -51,6 +51,7 @@ class MemoryManager:
         source: MemorySource = MemorySource.MANUAL,
         auto_confirm: bool = False,
         metadata: Optional[dict] = None,
+        flush: bool = True,
     ) -> Memory:
         """
         Create a new memory (unconfirmed by default).
@@ -64,6 +65,8 @@ class MemoryManager:
             source: Source of the memory
             auto_confirm: If True, automatically confirm and index
             metadata: Optional additional metadata
+            flush: Wait for the vector write when auto-confirming; callers
+                creating many memories can pass False and flush once at the end
             
         Returns:
             The created Memory object
@@ -94,12 +97,84 @@ class MemoryManager:
         
         # Auto-confirm if requested
         if auto_confirm:
-            self.confirm_memory(memory.id)
+            self.confirm_memory(memory.id, flush=flush)
             memory.confirmed = True
         
         return memory
     
-    def confirm_memory(self, memory_id: UUID) -> bool:
+    def create_memories_bulk(
+        self,
+        contents: list[str],
+        memory_type: MemoryType,
+        source: MemorySource = MemorySource.MANUAL,
+        auto_confirm: bool = False,
+        batch_size: int = 64,
+    ) -> list[Memory]:
+        """
+        Create many memories at once.
+        
+        Memories are validated individually, stored in one SQLite transaction
+        and, if auto_confirm is set, embedded with generate_batch and indexed
+        with one Qdrant upsert per batch.
+        
+        Args:
+            contents: The memory contents
+            memory_type: Type shared by all memories
+            source: Source of the memories
+            auto_confirm: If True, embed, index and confirm the memories
+            batch_size: Number of texts sent to the embedding service at once
+            
+        Returns:
+            The created Memory objects
+        """
+        memories = []
+        for content in contents:
+            content = self.validation.sanitize_content(content)
+            self.validation.validate_memory_create(
+                MemoryCreate(content=content, type=memory_type, source=source)
+            )
+            memories.append(Memory(
+                content=content,
+                type=memory_type,
+                source=source,
+                project_id=self.project_id,
+                confirmed=False,
+            ))
+        
+        self.db.create_memories(memories)
+        logger.info(f"Created {len(memories)} memories (unconfirmed)")
+        
+        if auto_confirm:
+            for start in range(0, len(memories), batch_size):
+                batch = memories[start:start + batch_size]
+                try:
+                    self._confirm_batch(batch)
+                except Exception as e:
+                    logger.error(f"Failed to confirm batch of {len(batch)} memories: {e}")
+            try:
+                self.vector_store.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush vector store after bulk confirm: {e}")
+        
+        return memories
+    
+    def _confirm_batch(self, memories: list[Memory]) -> None:
+        """Embed, index and confirm a batch of unconfirmed memories."""
+        embeddings = self.embedding_service.generate_batch([m.content for m in memories])
+        
+        vector_ids = self.vector_store.upsert_batch([
+            (m.id, embedding, m.type.value, m.created_at.isoformat())
+            for m, embedding in zip(memories, embeddings)
+        ], wait=False)
+        
+        self.db.confirm_indexed_memories(
+            [(m.id, vector_id) for m, vector_id in zip(memories, vector_ids)]
+        )
+        
+        for memory in memories:
+            memory.confirmed = True
+    
+    def confirm_memory(self, memory_id: UUID, flush: bool = True) -> bool:
         """
         Confirm a memory, making it eligible for retrieval.
         
@@ -110,6 +185,7 @@ class MemoryManager:
         
         Args:
             memory_id: The ID of the memory to confirm
+            flush: Wait for Qdrant to apply the write before returning
             
         Returns:
             True if successful, False otherwise
@@ -134,13 +210,11 @@ class MemoryManager:
                 embedding=embedding,
                 memory_type=memory.type.value,
                 created_at=memory.created_at.isoformat(),
+                wait=flush,
             )
             
-            # Save embedding reference
-            self.db.save_embedding_reference(memory.id, vector_id)
-            
-            # Mark as confirmed in SQLite
-            self.db.confirm_memory(memory_id)
+            # Save embedding reference and mark as confirmed in SQLite
+            self.db.confirm_indexed_memories([(memory.id, vector_id)])
             
             logger.info(f"Confirmed and indexed memory {memory_id}")
             return True
@@ -7,7 +7,7 @@ in config only (not in DB) as it's runtime state.
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
 from memoryforge.config import Config
@@ -159,6 +159,15 @@ class ProjectRouter:
         """
         return self.db.list_projects()
     
+    def list_projects_iter(self) -> Iterator[Project]:
+        """
+        Stream all projects without materializing the full list.
+        
+        Returns:
+            Iterator over all projects
+        """
+        return self.db.iter_projects()
+    
     def get_project(self, project_id: UUID) -> Optional[Project]:
         """
         Get a project by ID.
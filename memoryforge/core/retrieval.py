@@ -90,51 +90,9 @@ class RetrievalEngine:
                 min_score=min_score,
             )
             
-            if not vector_results:
-                logger.debug(f"No results found for query: {query[:50]}...")
-                return []
-            
-            # Fetch full memory objects from SQLite
-            results = []
-            for vr in vector_results:
-                memory = self.db.get_memory(UUID(vr["memory_id"]))
-                # v2: Skip archived memories and optionally stale memories
-                if memory and memory.confirmed and not memory.is_archived:
-                    if exclude_stale and memory.is_stale:
-                        continue
-                    results.append({
-                        "memory": memory,
-                        "score": vr["score"],
-                        "created_at": vr.get("created_at"),
-                    })
-            
-            # Re-rank with recency boost
-            results = self._rerank_results(results)
-            
-            # Limit final results
-            results = results[:limit]
-            
-            # v2: Update last_accessed for retrieved memories (staleness tracking)
-            for r in results:
-                try:
-                    self.db.update_last_accessed(r["memory"].id)
-                except Exception as e:
-                    logger.debug(f"Failed to update last_accessed: {e}")
-            
-            # Build search results with explanations
-            search_results = []
-            for r in results:
-                explanation = self._generate_explanation(
-                    query=query,
-                    memory=r["memory"],
-                    score=r["score"],
-                )
-                search_results.append(SearchResult(
-                    memory=r["memory"],
-                    score=r["score"],
-                    explanation=explanation,
-                ))
-            
+            search_results = self._build_search_results(
+                query, vector_results, limit, exclude_stale
+            )
             logger.info(f"Found {len(search_results)} results for query: {query[:50]}...")
             return search_results
             
@@ -143,6 +101,114 @@ class RetrievalEngine:
             # Fallback to keyword search in SQLite
             return self._fallback_keyword_search(query, memory_type, limit)
 
+    def search_many(
+        self,
+        queries: list[str],
+        memory_type: Optional[MemoryType] = None,
+        limit: Optional[int] = None,
+        min_score: Optional[float] = None,
+        exclude_stale: bool = False,
+    ) -> list[list[SearchResult]]:
+        """
+        Search for several queries at once.
+        
+        All queries are embedded with one generate_batch call and sent to
+        Qdrant in one batched request.
+        
+        Args:
+            queries: The search queries
+            memory_type: Optional filter by memory type
+            limit: Max results per query (defaults to max_results)
+            min_score: Minimum similarity score (defaults to min_score)
+            
+        Returns:
+            One list of SearchResult objects per query, in query order
+        """
+        for query in queries:
+            self.validation.validate_search_query(query)
+        
+        queries = [self._normalize_query(query) for query in queries]
+        
+        limit = min(limit or self.max_results, self.max_results)
+        min_score = min_score or self.min_score
+        
+        try:
+            query_embeddings = self.embedding_service.generate_batch(queries)
+            
+            vector_batches = self.vector_store.search_batch(
+                query_embeddings=query_embeddings,
+                limit=limit * 2,  # Fetch extra for re-ranking
+                memory_type=memory_type.value if memory_type else None,
+                min_score=min_score,
+            )
+            
+            return [
+                self._build_search_results(query, vector_results, limit, exclude_stale)
+                for query, vector_results in zip(queries, vector_batches)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            return [
+                self._fallback_keyword_search(query, memory_type, limit)
+                for query in queries
+            ]
+    
+    def _build_search_results(
+        self,
+        query: str,
+        vector_results: list[dict],
+        limit: int,
+        exclude_stale: bool,
+    ) -> list[SearchResult]:
+        """Hydrate, filter, re-rank and explain raw vector search results."""
+        if not vector_results:
+            logger.debug(f"No results found for query: {query[:50]}...")
+            return []
+        
+        # Fetch full memory objects from SQLite
+        results = []
+        for vr in vector_results:
+            memory = self.db.get_memory(UUID(vr["memory_id"]))
+            # v2: Skip archived memories and optionally stale memories
+            if memory and memory.confirmed and not memory.is_archived:
+                if exclude_stale and memory.is_stale:
+                    continue
+                results.append({
+                    "memory": memory,
+                    "score": vr["score"],
+                    "created_at": vr.get("created_at"),
+                })
+        
+        # Re-rank with recency boost
+        results = self._rerank_results(results)
+        
+        # Limit final results
+        results = results[:limit]
+        
+        # v2: Update last_accessed for retrieved memories (staleness tracking)
+        for r in results:
+            try:
+                self.db.update_last_accessed(r["memory"].id)
+            except Exception as e:
+                logger.debug(f"Failed to update last_accessed: {e}")
+        
+        # Build search results with explanations
+        search_results = []
+        for r in results:
+            explanation = self._generate_explanation(
+                query=query,
+                memory=r["memory"],
+                score=r["score"],
+            )
+            search_results.append(SearchResult(
+                memory=r["memory"],
+                score=r["score"],
+                explanation=explanation,
+            ))
+        
+        return search_results
+    
     def get_timeline(self, limit: int = 20) -> list[Memory]:
         """
         Get memories in chronological order (most recent first).
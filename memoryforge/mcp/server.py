@@ -465,13 +465,15 @@ async def _handle_list_projects(
     
     active_id = project_router.config.active_project_id
     
+    memory_counts = await loop.run_in_executor(
+        None,
+        lambda: sqlite_db.get_memory_counts(confirmed_only=True),
+    )
+    
     lines = [f"Projects ({len(projects)}):\n"]
     for proj in projects:
         is_active = "→ " if str(proj.id) == active_id else "  "
-        memory_count = await loop.run_in_executor(
-            None,
-            lambda p=proj: sqlite_db.get_memory_count(p.id, confirmed_only=True),
-        )
+        memory_count = memory_counts.get(proj.id, 0)
         lines.append(f"{is_active}{proj.name}")
         lines.append(f"   ID: {str(proj.id)[:8]}... | Memories: {memory_count}")
         lines.append("")
@@ -16,9 +16,10 @@ import glob
 import logging
 import shutil
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Generator, List, Optional, Tuple
 
 from memoryforge.config import Config
 from memoryforge.storage.sqlite_db import SQLiteDatabase
@@ -163,7 +164,8 @@ class Migrator:
         # 2. Get pre-migration counts for verification
         pre_counts = self._get_table_counts() if verify else {}
         
-        # 3. Backup
+        # 3. Backup (fold any WAL content into the main file first)
+        self._checkpoint()
         backup_path = self.backup_database()
         
         # 4. Run incremental migrations
@@ -177,6 +179,9 @@ class Migrator:
             if verify:
                 self._verify_migration(pre_counts)
             
+            # Reclaim the WAL and refresh planner statistics
+            self._checkpoint(optimize=True)
+            
             # 6. Cleanup old backups
             deleted = self.cleanup_old_backups()
             if deleted:
@@ -196,6 +201,45 @@ class Migrator:
             self.restore_backup(backup_path)
             return False, str(e)
     
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Open a connection that runs a whole migration step as one transaction.
+        
+        The sqlite3 module autocommits DDL statements individually, so each
+        CREATE/ALTER would otherwise pay its own journal sync. synchronous
+        stays at NORMAL so a crash cannot corrupt the database file.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+    
+    def _checkpoint(self, optimize: bool = False) -> None:
+        """
+        Checkpoint and truncate the write-ahead log.
+        
+        Args:
+            optimize: Also run PRAGMA optimize to refresh query planner stats
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if optimize:
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not checkpoint database: {e}")
+        finally:
+            conn.close()
+    
     def _perform_migration_step(self, from_version: int, to_version: int) -> None:
         """Perform a single migration step."""
         migration_method = getattr(self, f"_migrate_v{from_version}_to_v{to_version}", None)
@@ -218,7 +262,7 @@ class Migrator:
         - memory_tags table for performance
         - Performance indexes
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             # Create sync history table
@@ -254,8 +298,6 @@ class Migrator:
                 "INSERT INTO schema_version (version, applied_at) VALUES (3, ?)",
                 (datetime.utcnow().isoformat(),)
             )
-            
-            conn.commit()
     
     def _get_table_counts(self) -> dict:
         """Get row counts for all tables."""
@@ -341,7 +383,7 @@ class Migrator:
     
     def _perform_migration(self) -> None:
         """Execute migration SQL commands."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             # Use SQLiteDatabase internal method if available, or manual SQL
@@ -406,8 +448,6 @@ class Migrator:
                 "INSERT INTO schema_version (version, applied_at) VALUES (2, ?)",
                 (datetime.utcnow().isoformat(),)
             )
-            
-            conn.commit()
     
     def get_rollback_warning(self) -> Optional[str]:
         """
@@ -1,6 +1,13 @@
 """Storage layer for MemoryForge."""
 
 from memoryforge.storage.sqlite_db import SQLiteDatabase
-from memoryforge.storage.qdrant_store import QdrantStore
 
 __all__ = ["SQLiteDatabase", "QdrantStore"]
+
+
+def __getattr__(name):
+    """Lazy import so SQLite-only callers do not load qdrant-client."""
+    if name == "QdrantStore":
+        from memoryforge.storage.qdrant_store import QdrantStore
+        return QdrantStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
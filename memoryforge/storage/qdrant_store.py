@@ -93,10 +93,14 @@ class QdrantStore:
         embedding: list[float],
         memory_type: str,
         created_at: str,
+        wait: bool = True,
     ) -> str:
         """
         Insert or update a vector in the collection.
         
+        Pass wait=False to return before the write is applied; call flush()
+        once the batch of writes is done.
+        
         Returns the vector ID (same as memory_id string).
         """
         vector_id = str(memory_id)
@@ -114,11 +118,64 @@ class QdrantStore:
                     },
                 )
             ],
+            wait=wait,
         )
         
         logger.debug(f"Upserted vector for memory {memory_id}")
         return vector_id
     
+    def upsert_batch(
+        self,
+        points: list[tuple[UUID, list[float], str, str]],
+        wait: bool = True,
+    ) -> list[str]:
+        """
+        Insert or update many vectors in a single request.
+        
+        Args:
+            points: (memory_id, embedding, memory_type, created_at) tuples
+            wait: Block until the write is applied; see flush()
+        
+        Returns the vector IDs in the same order as points.
+        """
+        if not points:
+            return []
+        
+        vector_ids = [str(memory_id) for memory_id, _, _, _ in points]
+        
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=[
+                models.PointStruct(
+                    id=vector_id,
+                    vector=embedding,
+                    payload={
+                        "memory_id": vector_id,
+                        "memory_type": memory_type,
+                        "created_at": created_at,
+                    },
+                )
+                for vector_id, (_, embedding, memory_type, created_at) in zip(vector_ids, points)
+            ],
+            wait=wait,
+        )
+        
+        logger.debug(f"Upserted {len(vector_ids)} vectors")
+        return vector_ids
+    
+    def flush(self) -> None:
+        """
+        Block until all earlier writes to the collection have been applied.
+        
+        Updates are applied in order, so an empty upsert that waits returns
+        only after every upsert issued with wait=False has landed.
+        """
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=[],
+            wait=True,
+        )
+    
     def delete(self, memory_id: UUID) -> bool:
         """Delete a vector from the collection."""
         vector_id = str(memory_id)
@@ -136,6 +193,24 @@ class QdrantStore:
             logger.error(f"Failed to delete vector for memory {memory_id}: {e}")
             return False
     
+    def delete_batch(self, memory_ids: list[UUID]) -> bool:
+        """Delete many vectors from the collection in a single request."""
+        if not memory_ids:
+            return True
+        
+        try:
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(
+                    points=[str(memory_id) for memory_id in memory_ids],
+                ),
+            )
+            logger.debug(f"Deleted {len(memory_ids)} vectors")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete {len(memory_ids)} vectors: {e}")
+            return False
+    
     def search(
         self,
         query_embedding: list[float],
@@ -152,6 +227,28 @@ class QdrantStore:
         - memory_type: type of memory
         - created_at: creation timestamp
         """
+        return self.search_batch(
+            [query_embedding],
+            limit=limit,
+            memory_type=memory_type,
+            min_score=min_score,
+        )[0]
+    
+    def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 5,
+        memory_type: Optional[str] = None,
+        min_score: float = 0.5,
+    ) -> list[list[dict]]:
+        """
+        Search for several query vectors in a single request.
+        
+        Returns one list of result dicts (see search) per query, in order.
+        """
+        if not query_embeddings:
+            return []
+        
         # Build filter if memory_type is specified
         query_filter = None
         if memory_type:
@@ -164,24 +261,68 @@ class QdrantStore:
                 ]
             )
         
-        results = self.client.search(
-            collection_name=self.collection_name,
-            query_vector=query_embedding,
-            query_filter=query_filter,
-            limit=limit,
-            score_threshold=min_score,
-        )
+        if hasattr(self.client, "query_batch_points"):
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=embedding,
+                        filter=query_filter,
+                        limit=limit,
+                        score_threshold=min_score,
+                        with_payload=True,
+                    )
+                    for embedding in query_embeddings
+                ],
+            )
+            batches = [response.points for response in responses]
+        else:
+            # qdrant-client < 1.10
+            batches = self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=[
+                    models.SearchRequest(
+                        vector=embedding,
+                        filter=query_filter,
+                        limit=limit,
+                        score_threshold=min_score,
+                        with_payload=True,
+                    )
+                    for embedding in query_embeddings
+                ],
+            )
         
         return [
-            {
-                "memory_id": result.payload["memory_id"],
-                "score": result.score,
-                "memory_type": result.payload.get("memory_type"),
-                "created_at": result.payload.get("created_at"),
-            }
-            for result in results
+            [
+                {
+                    "memory_id": result.payload["memory_id"],
+                    "score": result.score,
+                    "memory_type": result.payload.get("memory_type"),
+                    "created_at": result.payload.get("created_at"),
+                }
+                for result in results
+            ]
+            for results in batches
         ]
     
+    def get_vectors(self, memory_ids: list[UUID]) -> dict[str, list[float]]:
+        """
+        Fetch stored vectors for several memories in a single request.
+        
+        Returns a dict mapping memory ID strings to vectors; memories that
+        are not indexed are missing from it.
+        """
+        if not memory_ids:
+            return {}
+        
+        points = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=[str(memory_id) for memory_id in memory_ids],
+            with_payload=False,
+            with_vectors=True,
+        )
+        return {str(point.id): point.vector for point in points if point.vector is not None}
+    
     def get_count(self) -> int:
         """Get the total number of vectors in the collection."""
         try:
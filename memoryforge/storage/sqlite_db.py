@@ -5,11 +5,14 @@ This is the source of truth for all memory data.
 Qdrant vectors are derived from this data.
 """
 
+import json
 import sqlite3
+import threading
+import weakref
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterator, Optional
 from uuid import UUID
 
 from memoryforge.models import (
@@ -20,47 +23,155 @@ from memoryforge.models import (
 # Current schema version
 SCHEMA_VERSION = 3
 
+INSERT_MEMORY_SQL = """
+    INSERT INTO memories 
+    (id, project_id, content, type, source, created_at, updated_at, confirmed, metadata,
+     is_stale, stale_reason, last_accessed, is_archived, consolidated_into, confidence_score)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Per-connection tuning applied on every open. journal_mode=WAL is persistent
+# in the database file, so it is only set once in __init__.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Prepared statements kept per connection; connections live as long as the
+# database object, so repeated queries skip SQLite's parse/compile step
+CACHED_STATEMENTS = 512
+
+# UPDATE ... FROM needs SQLite 3.33; older libraries fall back to executemany
+HAS_UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+
 
 class SQLiteDatabase:
     """SQLite database manager for memories and projects."""
     
+    # Instances handed out by open(), keyed by resolved path
+    _instances: "weakref.WeakValueDictionary[Path, SQLiteDatabase]" = weakref.WeakValueDictionary()
+    
+    @classmethod
+    def open(cls, db_path: Path) -> "SQLiteDatabase":
+        """
+        Get the database for a file, reusing an instance already open in
+        this process so WAL setup and schema checks run once per file.
+        
+        A cached instance is only reused while its file still exists; a
+        deleted database is created and set up again.
+        """
+        key = Path(db_path).resolve()
+        db = cls._instances.get(key)
+        if db is not None:
+            try:
+                if key.stat().st_ino == db._inode:
+                    return db
+            except FileNotFoundError:
+                pass
+        
+        db = cls(db_path)
+        db._inode = key.stat().st_ino
+        cls._instances[key] = db
+        return db
+    
     def __init__(self, db_path: Path):
         """Initialize the database connection."""
         self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._in_memory = str(db_path) == ":memory:"
+        self._local = threading.local()
+        if not self._in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._enable_wal()
         self._init_schema()
     
+    def _enable_wal(self) -> None:
+        """Switch the database file to write-ahead logging."""
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+    
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it on first use."""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), cached_statements=CACHED_STATEMENTS)
+            conn.row_factory = sqlite3.Row
+            if not self._in_memory:
+                for pragma in CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+            local.conn = conn
+            local.depth = 0
+        return conn
+    
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """
+        Get this thread's database connection with row factory.
+        
+        The connection is opened once per thread and reused, so pragmas run
+        once and prepared statements stay cached. Each outermost block
+        commits on success and rolls back on error or interruption; nested
+        blocks join the enclosing transaction.
+        """
+        conn = self._thread_connection()
+        local = self._local
+        
+        local.depth += 1
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
+            if local.depth == 1:
+                conn.commit()
+        except BaseException:
+            if local.depth == 1:
+                conn.rollback()
             raise
         finally:
+            local.depth -= 1
+    
+    @contextmanager
+    def _read_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """
+        Get a cursor for a streaming read on this thread's connection.
+        
+        Unlike _get_connection this does not open a block, so writes made
+        while a generator is paused on the cursor still commit on their own.
+        """
+        cursor = self._thread_connection().cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    
+    def close(self) -> None:
+        """Close the calling thread's connection; the next query reopens it."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
     
     def _init_schema(self) -> None:
         """Initialize the database schema."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Projects table
-            cursor.execute("""
+            # All tables and indexes are created by one script in a single
+            # transaction rather than one statement round trip each
+            conn.executescript("""
+                BEGIN;
+                
+                -- Projects table
                 CREATE TABLE IF NOT EXISTS projects (
                     id TEXT PRIMARY KEY,
                     name TEXT NOT NULL,
                     root_path TEXT NOT NULL,
                     created_at TEXT NOT NULL
-                )
-            """)
-            
-            # Memories table
-            cursor.execute("""
+                );
+                
+                -- Memories table
                 CREATE TABLE IF NOT EXISTS memories (
                     id TEXT PRIMARY KEY,
                     project_id TEXT NOT NULL,
@@ -72,45 +183,33 @@ class SQLiteDatabase:
                     confirmed INTEGER NOT NULL DEFAULT 0,
                     metadata TEXT NOT NULL DEFAULT '{}',
                     FOREIGN KEY (project_id) REFERENCES projects(id)
-                )
-            """)
-            
-            # Embeddings table (links memory to Qdrant vector)
-            cursor.execute("""
+                );
+                
+                -- Embeddings table (links memory to Qdrant vector)
                 CREATE TABLE IF NOT EXISTS embeddings (
                     memory_id TEXT PRIMARY KEY,
                     vector_id TEXT NOT NULL,
                     FOREIGN KEY (memory_id) REFERENCES memories(id)
-                )
-            """)
-            
-            # Create indexes for common queries
-            cursor.execute("""
+                );
+                
+                -- Create indexes for common queries
                 CREATE INDEX IF NOT EXISTS idx_memories_project_id 
-                ON memories(project_id)
-            """)
-            cursor.execute("""
+                ON memories(project_id);
                 CREATE INDEX IF NOT EXISTS idx_memories_confirmed 
-                ON memories(confirmed)
-            """)
-            cursor.execute("""
+                ON memories(confirmed);
                 CREATE INDEX IF NOT EXISTS idx_memories_type 
-                ON memories(type)
-            """)
-            
-            # ========== v2 Schema Additions ==========
-            
-            # Schema version tracking (for reversible migrations)
-            cursor.execute("""
+                ON memories(type);
+                
+                -- ========== v2 Schema Additions ==========
+                
+                -- Schema version tracking (for reversible migrations)
                 CREATE TABLE IF NOT EXISTS schema_version (
                     version INTEGER PRIMARY KEY,
                     applied_at TEXT NOT NULL,
                     description TEXT
-                )
-            """)
-            
-            # Memory versions (for consolidation history and rollback)
-            cursor.execute("""
+                );
+                
+                -- Memory versions (for consolidation history and rollback)
                 CREATE TABLE IF NOT EXISTS memory_versions (
                     id TEXT PRIMARY KEY,
                     memory_id TEXT NOT NULL,
@@ -118,11 +217,9 @@ class SQLiteDatabase:
                     version INTEGER NOT NULL,
                     created_at TEXT NOT NULL,
                     FOREIGN KEY (memory_id) REFERENCES memories(id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Memory links to git commits
-            cursor.execute("""
+                );
+                
+                -- Memory links to git commits
                 CREATE TABLE IF NOT EXISTS memory_links (
                     id TEXT PRIMARY KEY,
                     memory_id TEXT NOT NULL,
@@ -130,30 +227,19 @@ class SQLiteDatabase:
                     link_type TEXT NOT NULL,
                     created_at TEXT NOT NULL,
                     FOREIGN KEY (memory_id) REFERENCES memories(id) ON DELETE CASCADE
-                )
-            """)
-            
-            # v2 indexes
-            cursor.execute("""
+                );
+                
+                -- v2 indexes
                 CREATE INDEX IF NOT EXISTS idx_memory_versions_memory 
-                ON memory_versions(memory_id)
-            """)
-            cursor.execute("""
+                ON memory_versions(memory_id);
                 CREATE INDEX IF NOT EXISTS idx_memory_links_commit 
-                ON memory_links(commit_sha)
-            """)
-            cursor.execute("""
+                ON memory_links(commit_sha);
                 CREATE INDEX IF NOT EXISTS idx_memory_links_memory 
-                ON memory_links(memory_id)
-            """)
-            
-            # Add v2 columns to memories table if not exist
-            self._add_v2_columns(conn)
-            
-            # ========== v3 Schema Additions ==========
-            
-            # Memory relations (Graph Memory - memory-to-memory links)
-            cursor.execute("""
+                ON memory_links(memory_id);
+                
+                -- ========== v3 Schema Additions ==========
+                
+                -- Memory relations (Graph Memory - memory-to-memory links)
                 CREATE TABLE IF NOT EXISTS memory_relations (
                     id TEXT PRIMARY KEY,
                     source_memory_id TEXT NOT NULL,
@@ -163,11 +249,9 @@ class SQLiteDatabase:
                     created_by TEXT,
                     FOREIGN KEY (source_memory_id) REFERENCES memories(id) ON DELETE CASCADE,
                     FOREIGN KEY (target_memory_id) REFERENCES memories(id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Conflict log (Team Sync conflicts)
-            cursor.execute("""
+                );
+                
+                -- Conflict log (Team Sync conflicts)
                 CREATE TABLE IF NOT EXISTS conflict_log (
                     id TEXT PRIMARY KEY,
                     memory_id TEXT NOT NULL,
@@ -177,24 +261,33 @@ class SQLiteDatabase:
                     resolved_at TEXT NOT NULL,
                     resolved_by TEXT,
                     FOREIGN KEY (memory_id) REFERENCES memories(id) ON DELETE CASCADE
-                )
-            """)
-            
-            # v3 indexes
-            cursor.execute("""
+                );
+                
+                -- v3 indexes
                 CREATE INDEX IF NOT EXISTS idx_memory_relations_source 
-                ON memory_relations(source_memory_id)
-            """)
-            cursor.execute("""
+                ON memory_relations(source_memory_id);
                 CREATE INDEX IF NOT EXISTS idx_memory_relations_target 
-                ON memory_relations(target_memory_id)
-            """)
-            cursor.execute("""
+                ON memory_relations(target_memory_id);
                 CREATE INDEX IF NOT EXISTS idx_conflict_log_memory 
-                ON conflict_log(memory_id)
+                ON conflict_log(memory_id);
+                
+                -- Cached consolidation pairs, valid while the fingerprint of
+                -- the project's active memories is unchanged
+                CREATE TABLE IF NOT EXISTS similarity_cache (
+                    project_id TEXT NOT NULL,
+                    threshold REAL NOT NULL,
+                    pair_limit INTEGER NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    pairs TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (project_id, threshold, pair_limit)
+                );
+                
+                COMMIT;
             """)
             
-            # Add v3 columns to memories table if not exist
+            # Add v2 and v3 columns to memories table if not exist
+            self._add_v2_columns(conn)
             self._add_v3_columns(conn)
     
     # ========== Project Operations ==========
@@ -259,20 +352,21 @@ class SQLiteDatabase:
     
     def list_projects(self) -> list[Project]:
         """List all projects."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        return list(self.iter_projects())
+    
+    def iter_projects(self, batch_size: int = 64) -> Iterator[Project]:
+        """Stream all projects, newest first, fetching rows in batches."""
+        with self._read_cursor() as cursor:
             cursor.execute("SELECT * FROM projects ORDER BY created_at DESC")
-            rows = cursor.fetchall()
             
-            return [
-                Project(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    root_path=row["root_path"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield Project(
+                        id=UUID(row["id"]),
+                        name=row["name"],
+                        root_path=row["root_path"],
+                        created_at=datetime.fromisoformat(row["created_at"]),
+                    )
     
     # ========== Memory Operations ==========
     
@@ -280,33 +374,37 @@ class SQLiteDatabase:
         """Create a new memory (unconfirmed by default)."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO memories 
-                (id, project_id, content, type, source, created_at, updated_at, confirmed, metadata,
-                 is_stale, stale_reason, last_accessed, is_archived, consolidated_into, confidence_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(memory.id),
-                    str(memory.project_id),
-                    memory.content,
-                    memory.type.value,
-                    memory.source.value,
-                    memory.created_at.isoformat(),
-                    memory.updated_at.isoformat() if memory.updated_at else None,
-                    1 if memory.confirmed else 0,
-                    str(memory.metadata),
-                    1 if memory.is_stale else 0,
-                    memory.stale_reason,
-                    memory.last_accessed.isoformat() if memory.last_accessed else None,
-                    1 if memory.is_archived else 0,
-                    str(memory.consolidated_into) if memory.consolidated_into else None,
-                    memory.confidence_score,
-                ),
-            )
+            cursor.execute(INSERT_MEMORY_SQL, self._memory_to_row(memory))
         return memory
     
+    def create_memories(self, memories: list[Memory]) -> list[Memory]:
+        """Create many memories in a single transaction."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(INSERT_MEMORY_SQL, [self._memory_to_row(m) for m in memories])
+        return memories
+    
+    @staticmethod
+    def _memory_to_row(memory: Memory) -> tuple:
+        """Convert a Memory to the parameter tuple for INSERT_MEMORY_SQL."""
+        return (
+            str(memory.id),
+            str(memory.project_id),
+            memory.content,
+            memory.type.value,
+            memory.source.value,
+            memory.created_at.isoformat(),
+            memory.updated_at.isoformat() if memory.updated_at else None,
+            1 if memory.confirmed else 0,
+            str(memory.metadata),
+            1 if memory.is_stale else 0,
+            memory.stale_reason,
+            memory.last_accessed.isoformat() if memory.last_accessed else None,
+            1 if memory.is_archived else 0,
+            str(memory.consolidated_into) if memory.consolidated_into else None,
+            memory.confidence_score,
+        )
+    
     def save_memory(self, memory: Memory) -> Memory:
         """Save a memory (alias for create_memory, used by sync)."""
         return self.create_memory(memory)
@@ -326,6 +424,22 @@ class SQLiteDatabase:
             
             return self._row_to_memory(row)
     
+    def get_memories(self, memory_ids: list[UUID]) -> dict[UUID, Memory]:
+        """Get many memories by ID, keyed by ID; missing IDs are left out."""
+        ids = [str(memory_id) for memory_id in memory_ids]
+        memories = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay well under SQLite's bound parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT * FROM memories WHERE id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    memory = self._row_to_memory(row)
+                    memories[memory.id] = memory
+        return memories
+    
     def _row_to_memory(self, row: sqlite3.Row) -> Memory:
         """Convert a database row to a Memory object."""
         # Get row keys for safe access to v2/v3 columns
@@ -388,6 +502,70 @@ class SQLiteDatabase:
             
             return [self._row_to_memory(row) for row in rows]
     
+    def iter_memories(
+        self,
+        project_id: UUID,
+        confirmed_only: bool = True,
+        include_archived: bool = False,
+        batch_size: int = 256,
+    ) -> Iterator[Memory]:
+        """
+        Stream every matching memory of a project newest first, fetching
+        rows in batches.
+        
+        Unlike list_memories there is no row limit, and only batch_size rows
+        are held in memory at a time.
+        """
+        query = "SELECT * FROM memories WHERE project_id = ?"
+        if confirmed_only:
+            query += " AND confirmed = 1"
+        if not include_archived:
+            query += " AND (is_archived = 0 OR is_archived IS NULL)"
+        query += " ORDER BY created_at DESC"
+        
+        with self._read_cursor() as cursor:
+            cursor.execute(query, (str(project_id),))
+            
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield self._row_to_memory(row)
+    
+    def list_memories_summary(
+        self,
+        project_id: UUID,
+        confirmed_only: bool = True,
+        memory_type: Optional[MemoryType] = None,
+        limit: int = 100,
+    ) -> Iterator[tuple[str, str, str, bool, str]]:
+        """
+        Stream lightweight memory rows for display, newest first.
+        
+        Yields (id, type, content, confirmed, created_at) tuples straight from
+        the cursor without building Memory objects.
+        """
+        query = (
+            "SELECT id, type, content, confirmed, created_at FROM memories "
+            "WHERE project_id = ? AND (is_archived = 0 OR is_archived IS NULL)"
+        )
+        params: list = [str(project_id)]
+        
+        if confirmed_only:
+            query += " AND confirmed = 1"
+        
+        if memory_type:
+            query += " AND type = ?"
+            params.append(memory_type.value)
+        
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        
+        with self._read_cursor() as cursor:
+            # Plain tuples on this cursor only; the connection is shared
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            for memory_id, mem_type, content, confirmed, created_at in cursor:
+                yield memory_id, mem_type, content, bool(confirmed), created_at
+    
     def confirm_memory(self, memory_id: UUID) -> bool:
         """Confirm a memory (makes it eligible for indexing and retrieval)."""
         with self._get_connection() as conn:
@@ -402,6 +580,17 @@ class SQLiteDatabase:
             )
             return cursor.rowcount > 0
     
+    def confirm_memories(self, memory_ids: list[UUID]) -> int:
+        """Confirm many memories in a single transaction."""
+        now = datetime.utcnow().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE memories SET confirmed = 1, updated_at = ? WHERE id = ?",
+                [(now, str(memory_id)) for memory_id in memory_ids],
+            )
+            return cursor.rowcount
+    
     def update_memory(self, memory_id: UUID, content: str) -> bool:
         """Update memory content."""
         with self._get_connection() as conn:
@@ -435,6 +624,15 @@ class SQLiteDatabase:
             
             return cursor.rowcount > 0
     
+    def delete_memories(self, memory_ids: list[UUID]) -> int:
+        """Delete many memories and their embedding references in one transaction."""
+        params = [(str(memory_id),) for memory_id in memory_ids]
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("DELETE FROM embeddings WHERE memory_id = ?", params)
+            cursor.executemany("DELETE FROM memories WHERE id = ?", params)
+            return cursor.rowcount
+    
     def get_confirmed_memory_ids(self, project_id: UUID) -> list[UUID]:
         """Get all confirmed memory IDs for a project."""
         with self._get_connection() as conn:
@@ -463,6 +661,44 @@ class SQLiteDatabase:
                 (str(memory_id), vector_id),
             )
     
+    def save_embedding_references(self, references: list[tuple[UUID, str]]) -> None:
+        """Save many memory-to-vector references in a single transaction."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings (memory_id, vector_id)
+                VALUES (?, ?)
+                """,
+                [(str(memory_id), vector_id) for memory_id, vector_id in references],
+            )
+    
+    def confirm_indexed_memories(self, references: list[tuple[UUID, str]]) -> int:
+        """
+        Save vector references and confirm the memories in one transaction.
+        
+        Args:
+            references: (memory_id, vector_id) pairs for freshly indexed memories
+            
+        Returns:
+            Number of memories confirmed
+        """
+        now = datetime.utcnow().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings (memory_id, vector_id)
+                VALUES (?, ?)
+                """,
+                [(str(memory_id), vector_id) for memory_id, vector_id in references],
+            )
+            cursor.executemany(
+                "UPDATE memories SET confirmed = 1, updated_at = ? WHERE id = ?",
+                [(now, str(memory_id)) for memory_id, _ in references],
+            )
+            return cursor.rowcount
+    
     def get_embedding_reference(self, memory_id: UUID) -> Optional[str]:
         """Get the Qdrant vector ID for a memory."""
         with self._get_connection() as conn:
@@ -498,6 +734,35 @@ class SQLiteDatabase:
             row = cursor.fetchone()
             return row["count"] if row else 0
     
+    def get_memory_state_counts(self, project_id: UUID) -> dict[str, int]:
+        """Count a project's active, archived and stale memories in one pass."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT
+                    COALESCE(SUM(confirmed = 1 AND COALESCE(is_archived, 0) = 0), 0) AS active,
+                    COALESCE(SUM(is_archived = 1), 0) AS archived,
+                    COALESCE(SUM(is_stale = 1), 0) AS stale
+                FROM memories WHERE project_id = ?
+                """,
+                (str(project_id),),
+            )
+            return dict(cursor.fetchone())
+    
+    def get_memory_counts(self, confirmed_only: bool = True) -> dict[UUID, int]:
+        """Get memory counts for all projects in a single grouped query."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            query = "SELECT project_id, COUNT(*) as count FROM memories"
+            
+            if confirmed_only:
+                query += " WHERE confirmed = 1"
+            
+            query += " GROUP BY project_id"
+            cursor.execute(query)
+            return {UUID(row["project_id"]): row["count"] for row in cursor.fetchall()}
+    
     # ========== v2 Operations ==========
     
     def _add_v2_columns(self, conn: sqlite3.Connection) -> None:
@@ -654,6 +919,27 @@ class SQLiteDatabase:
             rows = cursor.fetchall()
             return [self._row_to_memory(row) for row in rows]
     
+    def get_commit_memory_counts(self, commit_shas: list[str]) -> dict[str, int]:
+        """Count linked memories per commit; commits without links are left out."""
+        counts = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay well under SQLite's bound parameter limit
+            for start in range(0, len(commit_shas), 500):
+                chunk = commit_shas[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT ml.commit_sha, COUNT(*) FROM memory_links ml
+                    INNER JOIN memories m ON m.id = ml.memory_id
+                    WHERE ml.commit_sha IN ({placeholders})
+                    GROUP BY ml.commit_sha
+                    """,
+                    chunk,
+                )
+                counts.update(cursor.fetchall())
+        return counts
+    
     def get_memory_links(self, memory_id: UUID) -> list[MemoryLink]:
         """Get all git links for a memory."""
         with self._get_connection() as conn:
@@ -766,6 +1052,62 @@ class SQLiteDatabase:
             )
             return cursor.rowcount > 0
     
+    def consolidate_memories(
+        self,
+        consolidated: Memory,
+        sources: list[Memory],
+    ) -> list[MemoryVersion]:
+        """
+        Store a consolidated memory and archive its sources in one transaction.
+        
+        A version of each source's current content is saved first so the
+        consolidation can be rolled back.
+        
+        Returns:
+            The saved source versions, in the order of sources
+        """
+        from uuid import uuid4
+        
+        now = datetime.utcnow()
+        versions = []
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(INSERT_MEMORY_SQL, self._memory_to_row(consolidated))
+            for source in sources:
+                cursor.execute(
+                    "SELECT MAX(version) AS max_v FROM memory_versions WHERE memory_id = ?",
+                    (str(source.id),),
+                )
+                version = MemoryVersion(
+                    id=uuid4(),
+                    memory_id=source.id,
+                    content=source.content,
+                    version=(cursor.fetchone()["max_v"] or 0) + 1,
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO memory_versions (id, memory_id, content, version, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        str(version.id),
+                        str(version.memory_id),
+                        version.content,
+                        version.version,
+                        version.created_at.isoformat(),
+                    ),
+                )
+                versions.append(version)
+            cursor.executemany(
+                """
+                UPDATE memories 
+                SET is_archived = 1, consolidated_into = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                [(str(consolidated.id), now.isoformat(), str(m.id)) for m in sources],
+            )
+        return versions
+    
     def restore_archived_memory(self, memory_id: UUID) -> bool:
         """Restore an archived memory."""
         with self._get_connection() as conn:
@@ -810,6 +1152,92 @@ class SQLiteDatabase:
             rows = cursor.fetchall()
             return [self._row_to_memory(row) for row in rows]
     
+    # ========== Similarity Cache Operations ==========
+    
+    def get_memory_fingerprint(self, project_id: UUID) -> str:
+        """
+        Summarize the project's active memories into a cheap change marker.
+        
+        Inserts, deletes, confirmations, edits, archiving and staleness
+        changes all move at least one of the aggregates.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT COUNT(*), MAX(rowid), TOTAL(rowid), MAX(COALESCE(updated_at, created_at))
+                FROM memories
+                WHERE project_id = ? AND confirmed = 1
+                AND (is_archived = 0 OR is_archived IS NULL)
+                """,
+                (str(project_id),),
+            )
+            return ":".join(str(value) for value in cursor.fetchone())
+    
+    def get_cached_similar_pairs(
+        self,
+        project_id: UUID,
+        threshold: float,
+        limit: int,
+        fingerprint: str,
+        max_age: timedelta = timedelta(hours=24),
+    ) -> Optional[list[tuple[UUID, UUID, float]]]:
+        """Get cached (memory_id, memory_id, score) pairs if still valid."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT pairs FROM similarity_cache
+                WHERE project_id = ? AND threshold = ? AND pair_limit = ?
+                AND fingerprint = ? AND created_at >= ?
+                """,
+                (
+                    str(project_id),
+                    threshold,
+                    limit,
+                    fingerprint,
+                    (datetime.utcnow() - max_age).isoformat(),
+                ),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return [(UUID(a), UUID(b), score) for a, b, score in json.loads(row["pairs"])]
+    
+    def save_similar_pairs(
+        self,
+        project_id: UUID,
+        threshold: float,
+        limit: int,
+        fingerprint: str,
+        pairs: list[tuple[UUID, UUID, float]],
+    ) -> None:
+        """Cache similar pairs computed for the given memory fingerprint."""
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO similarity_cache
+                (project_id, threshold, pair_limit, fingerprint, pairs, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(project_id),
+                    threshold,
+                    limit,
+                    fingerprint,
+                    json.dumps([[str(a), str(b), score] for a, b, score in pairs]),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+    
+    def clear_similarity_cache(self, project_id: UUID) -> None:
+        """Drop cached similar pairs, e.g. after vectors were rebuilt."""
+        with self._get_connection() as conn:
+            conn.execute(
+                "DELETE FROM similarity_cache WHERE project_id = ?",
+                (str(project_id),),
+            )
+    
     # ========== Schema Version Operations ==========
     
     def get_schema_version(self) -> int:
@@ -922,17 +1350,107 @@ class SQLiteDatabase:
                 )
             
             rows = cursor.fetchall()
-            return [
-                MemoryRelation(
-                    id=UUID(row["id"]),
-                    source_memory_id=UUID(row["source_memory_id"]),
-                    target_memory_id=UUID(row["target_memory_id"]),
-                    relation_type=RelationType(row["relation_type"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    created_by=row["created_by"],
-                )
-                for row in rows
-            ]
+            return [self._row_to_relation(row) for row in rows]
+    
+    def get_memory_relations_with_peers(
+        self,
+        memory_id: UUID,
+        direction: str,
+    ) -> list[tuple[MemoryRelation, Memory]]:
+        """Get a memory's relations joined with the memory at the other end.
+        
+        Relations whose other memory no longer exists are left out.
+        
+        Args:
+            memory_id: The memory ID to query
+            direction: 'outgoing' (peer is the target) or 'incoming' (peer is the source)
+        """
+        if direction == "outgoing":
+            own_column, peer_column = "source_memory_id", "target_memory_id"
+        elif direction == "incoming":
+            own_column, peer_column = "target_memory_id", "source_memory_id"
+        else:
+            raise ValueError(f"Unsupported direction: {direction}")
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT r.*, m.*
+                FROM memory_relations r
+                JOIN memories m ON m.id = r.{peer_column}
+                WHERE r.{own_column} = ?
+                ORDER BY r.rowid
+                """,
+                (str(memory_id),),
+            )
+            
+            # Both tables have id and created_at columns, so the row is split
+            # where the memory's columns start and each half mapped on its own
+            names = [column[0] for column in cursor.description]
+            split = names.index("id", 1)
+            pairs = []
+            for row in cursor.fetchall():
+                values = tuple(row)
+                pairs.append((
+                    self._row_to_relation(dict(zip(names[:split], values[:split]))),
+                    self._row_to_memory(dict(zip(names[split:], values[split:]))),
+                ))
+            return pairs
+    
+    def get_relations_for_memories(
+        self,
+        memory_ids: list[UUID],
+        direction: str = "both",
+        relation_types: Optional[list[RelationType]] = None,
+    ) -> list[MemoryRelation]:
+        """Get the relations of many memories at once, each relation listed once.
+        
+        Args:
+            memory_ids: The memory IDs to query
+            direction: 'outgoing' (source), 'incoming' (target), or 'both'
+            relation_types: Only return these relation types (None = all)
+        """
+        ids = [str(memory_id) for memory_id in memory_ids]
+        types = [t.value for t in relation_types] if relation_types else []
+        
+        if direction == "outgoing":
+            columns = ["source_memory_id"]
+        elif direction == "incoming":
+            columns = ["target_memory_id"]
+        else:  # both
+            columns = ["source_memory_id", "target_memory_id"]
+        
+        relations = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay under SQLite's bound parameter limit with every column bound
+            for start in range(0, len(ids), 400):
+                chunk = ids[start:start + 400]
+                placeholders = ", ".join("?" * len(chunk))
+                where = " OR ".join(f"{column} IN ({placeholders})" for column in columns)
+                params = chunk * len(columns)
+                if types:
+                    where = f"({where}) AND relation_type IN ({', '.join('?' * len(types))})"
+                    params += types
+                
+                cursor.execute(f"SELECT * FROM memory_relations WHERE {where}", params)
+                for row in cursor.fetchall():
+                    relation = self._row_to_relation(row)
+                    relations[relation.id] = relation
+        
+        return list(relations.values())
+    
+    def _row_to_relation(self, row: sqlite3.Row) -> MemoryRelation:
+        """Convert a database row to a MemoryRelation object."""
+        return MemoryRelation(
+            id=UUID(row["id"]),
+            source_memory_id=UUID(row["source_memory_id"]),
+            target_memory_id=UUID(row["target_memory_id"]),
+            relation_type=RelationType(row["relation_type"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            created_by=row["created_by"],
+        )
     
     def delete_memory_relation(self, relation_id: UUID) -> bool:
         """Delete a memory relation."""
@@ -983,35 +1501,58 @@ class SQLiteDatabase:
         resolved_by: Optional[str] = None,
     ) -> ConflictLog:
         """Log a sync conflict and its resolution."""
-        from uuid import uuid4
-        
         conflict = ConflictLog(
-            id=uuid4(),
             memory_id=memory_id,
             local_content=local_content,
             remote_content=remote_content,
             resolution=resolution,
             resolved_by=resolved_by,
         )
+        self.apply_conflict_resolutions([], [conflict])
+        return conflict
+    
+    def apply_conflict_resolutions(
+        self,
+        updates: list[tuple[UUID, str]],
+        conflicts: list[ConflictLog],
+    ) -> None:
+        """
+        Write resolved memory contents and their conflict log entries in one
+        transaction.
         
+        Args:
+            updates: (memory_id, new content) for memories whose content changes
+            conflicts: Conflict log entries to record
+        """
+        now = datetime.utcnow().isoformat()
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(
+                """
+                UPDATE memories 
+                SET content = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                [(content, now, str(memory_id)) for memory_id, content in updates],
+            )
+            cursor.executemany(
                 """
                 INSERT INTO conflict_log (id, memory_id, local_content, remote_content, resolution, resolved_at, resolved_by)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    str(conflict.id),
-                    str(conflict.memory_id),
-                    conflict.local_content,
-                    conflict.remote_content,
-                    conflict.resolution.value,
-                    conflict.resolved_at.isoformat(),
-                    conflict.resolved_by,
-                ),
+                [
+                    (
+                        str(conflict.id),
+                        str(conflict.memory_id),
+                        conflict.local_content,
+                        conflict.remote_content,
+                        conflict.resolution.value,
+                        conflict.resolved_at.isoformat(),
+                        conflict.resolved_by,
+                    )
+                    for conflict in conflicts
+                ],
             )
-        return conflict
     
     def get_conflict_history(self, memory_id: Optional[UUID] = None) -> list[ConflictLog]:
         """Get conflict history, optionally filtered by memory."""
@@ -1040,6 +1581,16 @@ class SQLiteDatabase:
                 for row in rows
             ]
     
+    def get_conflict_count(self, memory_id: UUID) -> int:
+        """Count logged conflicts for a memory without loading them."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM conflict_log WHERE memory_id = ?",
+                (str(memory_id),),
+            )
+            return cursor.fetchone()[0]
+    
     # ========== Confidence Score Operations ==========
     
     def update_confidence_score(self, memory_id: UUID, score: float) -> bool:
@@ -1056,6 +1607,74 @@ class SQLiteDatabase:
             )
             return cursor.rowcount > 0
     
+    def update_confidence_scores(self, scores: list[tuple[UUID, float]]) -> int:
+        """
+        Update many confidence scores in a single statement.
+        
+        The scores are passed as one JSON parameter and joined through
+        json_each, so SQLite prepares and runs one UPDATE for the batch.
+        """
+        now = datetime.utcnow().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            if not HAS_UPDATE_FROM:
+                cursor.executemany(
+                    """
+                    UPDATE memories 
+                    SET confidence_score = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    [(score, now, str(memory_id)) for memory_id, score in scores],
+                )
+                return cursor.rowcount
+            
+            cursor.execute(
+                """
+                UPDATE memories 
+                SET confidence_score = v.score, updated_at = ?
+                FROM (
+                    SELECT json_extract(value, '$[0]') AS id,
+                           json_extract(value, '$[1]') AS score
+                    FROM json_each(?)
+                ) AS v
+                WHERE memories.id = v.id
+                """,
+                (now, json.dumps([[str(memory_id), score] for memory_id, score in scores])),
+            )
+            return cursor.rowcount
+    
+    def get_scoring_columns(
+        self,
+        project_id: UUID,
+    ) -> list[tuple[str, bool, bool, float, int]]:
+        """
+        Get the inputs of the confidence score for every active memory.
+        
+        Returns:
+            (memory_id, confirmed, accessed, days since last access or
+            creation, conflict count) per memory
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT m.id, m.confirmed, m.last_accessed IS NOT NULL,
+                       julianday('now') - julianday(COALESCE(m.last_accessed, m.created_at)),
+                       COALESCE(c.conflict_count, 0)
+                FROM memories m
+                LEFT JOIN (
+                    SELECT memory_id, COUNT(*) AS conflict_count
+                    FROM conflict_log GROUP BY memory_id
+                ) c ON c.memory_id = m.id
+                WHERE m.project_id = ? AND m.is_archived = 0
+                """,
+                (str(project_id),),
+            )
+            return [
+                (row[0], bool(row[1]), bool(row[2]), row[3], row[4])
+                for row in cursor.fetchall()
+            ]
+    
     def get_low_confidence_memories(
         self, project_id: UUID, threshold: float = 0.5
     ) -> list[Memory]:
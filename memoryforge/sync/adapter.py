@@ -19,6 +19,10 @@ class SyncAdapterProtocol(Protocol):
         """List all available memory files in the backend."""
         ...
         
+    def count_files(self) -> int:
+        """Count memory files in the backend."""
+        ...
+        
     def read_file(self, filename: str) -> Optional[str]:
         """
         Read content of a file.
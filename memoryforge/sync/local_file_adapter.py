@@ -8,7 +8,7 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from memoryforge.sync.adapter import SyncAdapterProtocol
 
@@ -29,29 +29,52 @@ class LocalFileAdapter:
         """Create the sync directory if it doesn't exist."""
         self.sync_path.mkdir(parents=True, exist_ok=True)
         
+    def _iter_json_files(self) -> Iterator[str]:
+        """
+        Yield names of visible .json files in the sync directory.
+        
+        os.scandir reports the file type from the directory entry itself,
+        so no per-file stat or Path object is needed.
+        """
+        with os.scandir(self.sync_path) as entries:
+            for entry in entries:
+                if (
+                    entry.name.endswith(".json")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ):
+                    yield entry.name
+    
     def list_files(self) -> List[str]:
         """List all .json files in the sync directory."""
         if not self.sync_path.exists():
             return []
         
-        return [
-            f.name for f in self.sync_path.glob("*.json")
-            if f.is_file()
-        ]
+        return list(self._iter_json_files())
+    
+    def count_files(self) -> int:
+        """Count .json files in the sync directory without listing them."""
+        if not self.sync_path.exists():
+            return 0
+        
+        return sum(1 for _ in self._iter_json_files())
         
     def read_file(self, filename: str) -> Optional[str]:
         """Read content of a file."""
-        file_path = self.sync_path / filename
-        if not file_path.exists():
+        # Opening directly saves an exists() stat per file on pull and push
+        try:
+            return (self.sync_path / filename).read_text(encoding="utf-8")
+        except FileNotFoundError:
             return None
-            
-        return file_path.read_text(encoding="utf-8")
         
     def write_file(self, filename: str, content: str) -> None:
         """Write content to a file."""
-        self.initialize()  # Ensure dir exists
         file_path = self.sync_path / filename
-        file_path.write_text(content, encoding="utf-8")
+        try:
+            file_path.write_text(content, encoding="utf-8")
+        except FileNotFoundError:
+            self.initialize()  # Directory was removed; recreate and retry
+            file_path.write_text(content, encoding="utf-8")
         
     def delete_file(self, filename: str) -> None:
         """Delete a file."""
@@ -61,9 +84,9 @@ class LocalFileAdapter:
             
     def get_last_modified(self, filename: str) -> Optional[datetime]:
         """Get last modified timestamp."""
-        file_path = self.sync_path / filename
-        if not file_path.exists():
+        try:
+            timestamp = (self.sync_path / filename).stat().st_mtime
+        except FileNotFoundError:
             return None
             
-        timestamp = file_path.stat().st_mtime
         return datetime.fromtimestamp(timestamp)
@@ -13,6 +13,8 @@ v2.1: Added conflict detection and integrity verification.
 import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
@@ -27,6 +29,9 @@ from memoryforge.sync.encryption import EncryptionLayer
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for sync worker threads (encryption and file I/O)
+MAX_SYNC_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
 
 class SyncConflictError(Exception):
     """Raised when a sync conflict is detected."""
@@ -63,6 +68,7 @@ class SyncMetadata(BaseModel):
 class SyncResult(BaseModel):
     """Result of a sync operation."""
     exported: int = 0
+    unchanged: int = 0
     imported: int = 0
     conflicts: List[str] = []
     errors: List[str] = []
@@ -94,12 +100,17 @@ class SyncManager:
         self.encryption = encryption
         self.project_id = project_id
     
-    def export_memories(self, force: bool = False) -> SyncResult:
+    def export_memories(self, force: bool = False, workers: Optional[int] = None) -> SyncResult:
         """
         Export local memories to sync backend with conflict detection.
         
+        Each memory is serialized, encrypted and written on a thread pool;
+        Fernet runs in OpenSSL and file writes are independent, so both
+        overlap across memories.
+        
         Args:
             force: If True, overwrite all remote files (skip conflict check)
+            workers: Number of worker threads (default: MAX_SYNC_WORKERS)
             
         Returns:
             SyncResult with counts and any conflicts/errors
@@ -114,34 +125,60 @@ class SyncManager:
             limit=10000,
         )
         
-        for memory in memories:
-            filename = f"{memory.id}.json"
-            
-            try:
-                # Check for conflicts unless force mode
-                if not force:
-                    conflict = self._check_conflict(memory, filename)
-                    if conflict:
-                        result.conflicts.append(str(conflict))
-                        continue
-                
-                # Serialize and encrypt with integrity checksum
-                payload = self._create_payload(memory)
-                self.adapter.write_file(filename, payload)
-                result.exported += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to export memory {memory.id}: {e}")
-                result.errors.append(f"Export failed for {memory.id}: {e}")
+        with ThreadPoolExecutor(max_workers=self._pool_size(workers, len(memories))) as pool:
+            outcomes = pool.map(lambda m: self._export_memory(m, force), memories)
+            for memory, (status, message) in zip(memories, outcomes):
+                if status == "exported":
+                    result.exported += 1
+                elif status == "unchanged":
+                    result.unchanged += 1
+                elif status == "conflict":
+                    result.conflicts.append(message)
+                else:
+                    logger.error(f"Failed to export memory {memory.id}: {message}")
+                    result.errors.append(f"Export failed for {memory.id}: {message}")
                 
         return result
     
-    def import_memories(self, force: bool = False) -> SyncResult:
+    def _export_memory(self, memory: Memory, force: bool) -> Tuple[str, Optional[str]]:
+        """Export one memory, returning (status, message) for the caller to tally."""
+        filename = f"{memory.id}.json"
+        
+        try:
+            json_data = memory.model_dump_json()
+            checksum = self._checksum(json_data)
+            
+            # Check for conflicts unless force mode
+            if not force:
+                remote_content = self.adapter.read_file(filename)
+                conflict = self._check_conflict(memory, filename, remote_content)
+                if conflict:
+                    return "conflict", str(conflict)
+                
+                # Skip re-encrypting and rewriting files whose content
+                # is already in the backend
+                if self._remote_checksum(remote_content) == checksum:
+                    return "unchanged", None
+            
+            # Serialize and encrypt with integrity checksum
+            payload = self._create_payload(memory, json_data, checksum)
+            self.adapter.write_file(filename, payload)
+            return "exported", None
+            
+        except Exception as e:
+            return "error", str(e)
+    
+    def import_memories(self, force: bool = False, workers: Optional[int] = None) -> SyncResult:
         """
         Import remote memories to local DB with conflict detection.
         
+        Files are read and decrypted on a thread pool; database writes stay
+        on the calling thread and new memories are inserted in one
+        transaction.
+        
         Args:
             force: If True, overwrite local memories (skip conflict check)
+            workers: Number of worker threads (default: MAX_SYNC_WORKERS)
             
         Returns:
             SyncResult with counts and any conflicts/errors
@@ -149,21 +186,26 @@ class SyncManager:
         result = SyncResult()
         remote_files = self.adapter.list_files()
         
-        for filename in remote_files:
+        with ThreadPoolExecutor(max_workers=self._pool_size(workers, len(remote_files))) as pool:
+            parsed = list(pool.map(self._read_remote, remote_files))
+        
+        remote: List[Tuple[Memory, datetime]] = []
+        for filename, outcome in zip(remote_files, parsed):
+            if isinstance(outcome, SyncIntegrityError):
+                result.errors.append(str(outcome))
+            elif isinstance(outcome, Exception):
+                logger.error(f"Failed to import {filename}: {outcome}")
+                result.errors.append(f"Import failed for {filename}: {outcome}")
+            elif outcome is not None and outcome[0].project_id == self.project_id:
+                # Only memories that belong to the current project
+                remote.append(outcome)
+        
+        existing_memories = self.db.get_memories([memory.id for memory, _ in remote])
+        new_memories: Dict[UUID, Memory] = {}
+        
+        for memory, remote_updated in remote:
             try:
-                content = self.adapter.read_file(filename)
-                if not content:
-                    continue
-                
-                # Parse and verify integrity
-                memory, remote_updated = self._parse_payload(content)
-                
-                # Check if it belongs to current project
-                if memory.project_id != self.project_id:
-                    continue
-                
-                # Check if exists locally
-                existing = self.db.get_memory(memory.id)
+                existing = existing_memories.get(memory.id)
                 if existing:
                     # Check for conflicts unless force mode
                     if not force:
@@ -182,20 +224,55 @@ class SyncManager:
                     self._merge_memory(existing, memory, remote_updated)
                 else:
                     # New memory from remote
-                    self.db.save_memory(memory)
-                    result.imported += 1
+                    new_memories.setdefault(memory.id, memory)
                     
-            except SyncIntegrityError as e:
-                result.errors.append(str(e))
             except Exception as e:
-                logger.error(f"Failed to import {filename}: {e}")
-                result.errors.append(f"Import failed for {filename}: {e}")
+                logger.error(f"Failed to import {memory.id}.json: {e}")
+                result.errors.append(f"Import failed for {memory.id}.json: {e}")
+        
+        if new_memories:
+            try:
+                self.db.create_memories(list(new_memories.values()))
+                result.imported += len(new_memories)
+            except Exception as e:
+                # The batch is rolled back as a whole; save one at a time so
+                # only the memories that fail are reported and left out
+                logger.warning(f"Batch save failed, saving memories one at a time: {e}")
+                for memory in new_memories.values():
+                    try:
+                        self.db.create_memory(memory)
+                        result.imported += 1
+                    except Exception as e:
+                        logger.error(f"Failed to import {memory.id}.json: {e}")
+                        result.errors.append(f"Import failed for {memory.id}.json: {e}")
                 
         return result
     
-    def _check_conflict(self, memory: Memory, filename: str) -> Optional[SyncConflictError]:
+    def _read_remote(self, filename: str) -> Tuple[Memory, datetime] | Exception | None:
+        """Read and decrypt one remote file; errors are returned, not raised."""
+        try:
+            content = self.adapter.read_file(filename)
+            if not content:
+                return None
+            
+            # Parse and verify integrity
+            return self._parse_payload(content)
+        except Exception as e:
+            return e
+    
+    @staticmethod
+    def _pool_size(workers: Optional[int], items: int) -> int:
+        """Clamp the requested worker count to MAX_SYNC_WORKERS and the workload."""
+        requested = workers if workers is not None else MAX_SYNC_WORKERS
+        return max(1, min(requested, MAX_SYNC_WORKERS, items))
+    
+    def _check_conflict(
+        self,
+        memory: Memory,
+        filename: str,
+        remote_content: Optional[str],
+    ) -> Optional[SyncConflictError]:
         """Check if there's a conflict with remote version."""
-        remote_content = self.adapter.read_file(filename)
         if not remote_content:
             return None  # No remote version, no conflict
         
@@ -254,13 +331,35 @@ class SyncManager:
         if changed:
             logger.info(f"Merged changes for memory {local.id}")
     
-    def _create_payload(self, memory: Memory) -> str:
+    @staticmethod
+    def _checksum(json_data: str) -> str:
+        """SHA256 integrity checksum of a serialized memory."""
+        return hashlib.sha256(json_data.encode()).hexdigest()[:32]
+    
+    @staticmethod
+    def _remote_checksum(remote_content: Optional[str]) -> Optional[str]:
+        """Read the checksum from a remote wrapper without decrypting it."""
+        if not remote_content:
+            return None
+        try:
+            return json.loads(remote_content).get("checksum")
+        except (ValueError, AttributeError):
+            return None
+    
+    def _create_payload(
+        self,
+        memory: Memory,
+        json_data: Optional[str] = None,
+        checksum: Optional[str] = None,
+    ) -> str:
         """Create encrypted JSON payload with integrity checksum."""
         # Dump full memory to JSON
-        json_data = memory.model_dump_json()
+        if json_data is None:
+            json_data = memory.model_dump_json()
         
         # Calculate checksum for integrity verification
-        checksum = hashlib.sha256(json_data.encode()).hexdigest()[:32]
+        if checksum is None:
+            checksum = self._checksum(json_data)
         
         # Encrypt
         encrypted_data = self.encryption.encrypt(json_data)
@@ -269,7 +368,7 @@ class SyncManager:
         wrapper = {
             "id": str(memory.id),
             "project_id": str(memory.project_id),
-            "updated_at": (memory.updated_at or datetime.utcnow()).isoformat(),
+            "updated_at": (memory.updated_at or memory.created_at).isoformat(),
             "checksum": checksum,
             "encrypted_data": encrypted_data,
         }
@@ -295,7 +394,7 @@ class SyncManager:
         
         # Verify integrity if checksum present
         if expected_checksum:
-            actual_checksum = hashlib.sha256(decrypted_json.encode()).hexdigest()[:32]
+            actual_checksum = self._checksum(decrypted_json)
             if actual_checksum != expected_checksum:
                 memory_id = UUID(wrapper["id"])
                 raise SyncIntegrityError(memory_id, "Checksum mismatch - data may be corrupted")
@@ -8,6 +8,7 @@ Tests memory creation, search, and consolidation with various memory counts.
 import statistics
 import tempfile
 import time
+from datetime import datetime
 from pathlib import Path
 from typing import Callable
 from uuid import uuid4
@@ -69,8 +70,8 @@ def run_benchmarks(memory_counts: list = [100, 1000, 5000, 10000]):
             print(f"\n--- Benchmarking with {count} memories ---\n")
             
             # Clear previous data
-            for mem in db.get_memories(project.id, limit=count + 1000):
-                db.delete_memory(mem.id)
+            existing = db.list_memories(project.id, confirmed_only=False, limit=count + 1000)
+            db.delete_memories([mem.id for mem in existing])
             
             # Benchmark: Memory Creation
             created_ids = []
@@ -90,9 +91,22 @@ def run_benchmarks(memory_counts: list = [100, 1000, 5000, 10000]):
             results.append(result)
             print(f"  Create: {result['mean_ms']:.2f}ms mean, {result['stdev_ms']:.2f}ms stdev")
             
-            # Bulk create to reach target count
-            for _ in range(count - len(created_ids)):
-                create_memory()
+            # Bulk create to reach target count in a single transaction,
+            # sharing one timestamp across the seeded rows
+            now = datetime.utcnow()
+            seed = [
+                Memory(
+                    content=f"Test memory {i} with content about software architecture and design patterns",
+                    type=MemoryType.NOTE,
+                    source=MemorySource.MANUAL,
+                    project_id=project.id,
+                    confirmed=False,
+                    created_at=now,
+                )
+                for i in range(count - len(created_ids))
+            ]
+            db.create_memories(seed)
+            created_ids.extend(mem.id for mem in seed)
             
             # Benchmark: Memory Retrieval by ID
             test_ids = created_ids[:10]
@@ -107,7 +121,7 @@ def run_benchmarks(memory_counts: list = [100, 1000, 5000, 10000]):
             
             # Benchmark: List memories
             def list_memories():
-                db.get_memories(project.id, limit=50)
+                db.list_memories(project.id, confirmed_only=False, limit=50)
             
             result = benchmark(f"List 50 memories ({count} total)", list_memories, 10)
             results.append(result)
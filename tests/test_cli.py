@@ -0,0 +1,371 @@
+"""
+Tests for the command-line interface.
+"""
+
+import subprocess
+import sys
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from click.testing import CliRunner
+
+import memoryforge.cli as cli_module
+from memoryforge.cli import event_loop_factory, main, truncate
+from memoryforge.config import Config, EmbeddingProvider
+from memoryforge.models import Memory, MemoryType, MemorySource, Project
+from memoryforge.storage.sqlite_db import SQLiteDatabase
+
+
+@pytest.fixture
+def cli_env(tmp_path):
+    """Create a config file, database and active project for CLI tests."""
+    config = Config(storage_path=tmp_path / "store", project_name="cli-project")
+    config.ensure_directories()
+    db = SQLiteDatabase(config.sqlite_path)
+    project = db.create_project(Project(name="cli-project", root_path=str(tmp_path)))
+    config.active_project_id = str(project.id)
+    config_path = tmp_path / "config.yaml"
+    config.save(config_path)
+    return config_path, db, project
+
+
+def add_memory(db, project, content, confirmed=True, memory_type=MemoryType.NOTE):
+    """Store a memory directly in the database."""
+    memory = Memory(
+        content=content,
+        type=memory_type,
+        source=MemorySource.MANUAL,
+        project_id=project.id,
+        confirmed=confirmed,
+    )
+    return db.create_memory(memory)
+
+
+class TestStartup:
+    """Tests for CLI import cost."""
+    
+    def test_cli_import_skips_heavy_dependencies(self):
+        """Test that importing the CLI does not load Qdrant, embeddings or MCP."""
+        code = (
+            "import sys, memoryforge.cli; "
+            "heavy = ['qdrant_client', 'openai', 'sentence_transformers', 'mcp']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        
+        assert result.stdout.strip() == ""
+
+
+class TestListCommands:
+    """Tests for the list and timeline commands."""
+    
+    def test_list_shows_confirmed_memories(self, cli_env):
+        """Test that list renders confirmed memories only by default."""
+        config_path, db, project = cli_env
+        add_memory(db, project, "We use FastAPI")
+        add_memory(db, project, "Maybe switch to Litestar", confirmed=False)
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "list"])
+        
+        assert result.exit_code == 0, result.output
+        assert "We use FastAPI" in result.output
+        assert "Litestar" not in result.output
+    
+    def test_list_keeps_long_memory_on_one_row(self, cli_env, monkeypatch):
+        """Test that a long memory is cut to the Content column and never wraps."""
+        config_path, db, project = cli_env
+        memory = add_memory(db, project, "The billing service retries failed charges " * 4)
+        monkeypatch.setattr(cli_module.console, "_width", 160)
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "list"])
+        
+        assert result.exit_code == 0, result.output
+        rows = [line for line in result.output.splitlines() if "billing" in line]
+        assert len(rows) == 1
+        assert memory.content[:47] + "..." in rows[0]
+        assert str(memory.id) in rows[0]
+    
+    def test_read_only_commands_do_not_open_qdrant(self, cli_env, tmp_path):
+        """Test that list and timeline never create the Qdrant store."""
+        config_path, db, project = cli_env
+        add_memory(db, project, "We use FastAPI")
+        
+        for command in (["list"], ["timeline"]):
+            result = CliRunner().invoke(main, ["--config", str(config_path), *command])
+            assert result.exit_code == 0, result.output
+        
+        assert not (tmp_path / "store" / "qdrant" / "meta.json").exists()
+    
+    def test_commands_without_vector_work_do_not_open_qdrant(self, cli_env, tmp_path):
+        """Test that Qdrant is only opened once a command actually uses it."""
+        config_path, db, project = cli_env
+        
+        for command in (["add", "Pending note", "--no-confirm"], ["stale", "unused"]):
+            result = CliRunner().invoke(main, ["--config", str(config_path), *command])
+            assert result.exit_code == 0, result.output
+        
+        assert not (tmp_path / "store" / "qdrant" / "meta.json").exists()
+    
+    def test_commands_without_embeddings_need_no_api_key(self, cli_env):
+        """Test that stale unused works with OpenAI configured but no key set."""
+        config_path, db, project = cli_env
+        config = Config.load(config_path)
+        config.embedding_provider = EmbeddingProvider.OPENAI
+        config.save(config_path)
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "stale", "unused"])
+        
+        assert result.exit_code == 0, result.output
+        assert "No memories unused" in result.output
+    
+    def test_timeline_shows_recent_memories(self, cli_env):
+        """Test that timeline renders type and timestamp for each memory."""
+        config_path, db, project = cli_env
+        memory = add_memory(db, project, "Use PostgreSQL", memory_type=MemoryType.DECISION)
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "timeline"])
+        
+        assert result.exit_code == 0, result.output
+        assert "DECISION" in result.output
+        assert memory.created_at.strftime("%Y-%m-%d %H:%M") in result.output
+    
+    def test_timeline_prints_content_literally(self, cli_env):
+        """Test that brackets in memory content are not treated as markup."""
+        config_path, db, project = cli_env
+        add_memory(db, project, "Use list[str] and [bold]not markup[/bold]")
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "timeline"])
+        
+        assert result.exit_code == 0, result.output
+        assert "Use list[str] and [bold]not markup[/bold]" in result.output
+
+
+class TestTruncate:
+    """Tests for table cell truncation."""
+    
+    def test_short_text_is_unchanged(self):
+        """Test that text within the width is returned as is."""
+        assert truncate("x" * 40) == "x" * 40
+    
+    def test_long_text_is_shortened(self):
+        """Test that long text is cut to exactly width characters, ellipsis included."""
+        assert truncate("x" * 41) == "x" * 37 + "..."
+        assert truncate("y" * 50, 35) == "y" * 32 + "..."
+        assert len(truncate("z" * 100, 50)) == 50
+
+
+class TestEventLoopFactory:
+    """Tests for picking the event loop used by serve."""
+    
+    def test_default_loop_without_uvloop(self, monkeypatch):
+        """Test that asyncio's own loop is used when uvloop is missing."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        
+        assert event_loop_factory() is None
+    
+    def test_uvloop_when_installed(self, monkeypatch):
+        """Test that uvloop's loop factory is used when it can be imported."""
+        fake_uvloop = Mock()
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        
+        assert event_loop_factory() is fake_uvloop.new_event_loop
+
+
+class TestProjectCommands:
+    """Tests for project subcommands."""
+    
+    def test_project_list_shows_counts(self, cli_env):
+        """Test that project list shows confirmed memory counts per project."""
+        config_path, db, project = cli_env
+        db.create_project(Project(name="second-project", root_path="/second"))
+        for i in range(3):
+            add_memory(db, project, f"Memory {i}")
+        add_memory(db, project, "Pending", confirmed=False)
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "project", "list"])
+        
+        assert result.exit_code == 0, result.output
+        rows = {line.split("│")[2].strip(): line for line in result.output.splitlines()
+                if line.count("│") > 4}
+        assert rows["cli-project"].split("│")[4].strip() == "3"
+        assert rows["second-project"].split("│")[4].strip() == "0"
+    
+    def test_project_delete_yes_skips_prompt(self, cli_env):
+        """Test that project delete --yes runs without reading stdin."""
+        config_path, db, project = cli_env
+        other = db.create_project(Project(name="other-project", root_path="/other"))
+        
+        result = CliRunner().invoke(
+            main, ["--config", str(config_path), "project", "delete", "other-project", "-y"]
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert db.get_project(other.id) is None
+
+
+class TestAddBatch:
+    """Tests for the add-batch command."""
+    
+    def test_add_batch_from_stdin_without_confirm(self, cli_env):
+        """Test that add-batch stores one memory per non-blank line."""
+        config_path, db, project = cli_env
+        
+        result = CliRunner().invoke(
+            main,
+            ["--config", str(config_path), "add-batch", "--no-confirm", "-t", "decision"],
+            input="Use FastAPI\n\nUse PostgreSQL\n",
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert "Added 2 memories" in result.output
+        rows = list(db.list_memories_summary(project.id, confirmed_only=False))
+        assert sorted(row[2] for row in rows) == ["Use FastAPI", "Use PostgreSQL"]
+        assert {row[1] for row in rows} == {"decision"}
+
+
+class TestDelete:
+    """Tests for the delete command."""
+    
+    def test_delete_multiple_memories(self, cli_env):
+        """Test deleting several memories in one invocation."""
+        config_path, db, project = cli_env
+        first = add_memory(db, project, "First", confirmed=False)
+        second = add_memory(db, project, "Second", confirmed=False)
+        keep = add_memory(db, project, "Keep", confirmed=False)
+        
+        result = CliRunner().invoke(
+            main,
+            ["--config", str(config_path), "delete", str(first.id), str(second.id)],
+            input="y\n",
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert "2 memories deleted" in result.output
+        assert db.get_memory(first.id) is None
+        assert db.get_memory(second.id) is None
+        assert db.get_memory(keep.id) is not None
+        # Only unconfirmed memories were deleted, so Qdrant was never opened
+        assert not (config_path.parent / "store" / "qdrant" / "meta.json").exists()
+    
+    def test_delete_yes_skips_prompt(self, cli_env):
+        """Test that delete --yes runs without reading stdin."""
+        config_path, db, project = cli_env
+        memory = add_memory(db, project, "Scripted", confirmed=False)
+        
+        result = CliRunner().invoke(
+            main, ["--config", str(config_path), "delete", "--yes", str(memory.id)]
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert db.get_memory(memory.id) is None
+    
+    def test_delete_unknown_memory_deletes_nothing(self, cli_env):
+        """Test that a missing ID aborts before anything is deleted."""
+        config_path, db, project = cli_env
+        memory = add_memory(db, project, "Still here", confirmed=False)
+        
+        result = CliRunner().invoke(
+            main,
+            ["--config", str(config_path), "delete", str(memory.id), str(uuid4())],
+            input="y\n",
+        )
+        
+        assert result.exit_code == 1
+        assert db.get_memory(memory.id) is not None
+
+
+class TestConsolidateSuggest:
+    """Tests for the consolidate suggest command."""
+    
+    def test_suggestions_render_content_literally(self, cli_env, monkeypatch):
+        """Test that every suggestion is shown and content is not parsed as markup."""
+        from memoryforge.core.memory_consolidator import ConsolidationSuggestion
+        
+        config_path, db, project = cli_env
+        pairs = [
+            (
+                add_memory(db, project, f"Use [red]uv[/red] {i}"),
+                add_memory(db, project, f"Use uv {i}"),
+            )
+            for i in range(3)
+        ]
+        suggestions = [
+            ConsolidationSuggestion(
+                source_memories=list(pair),
+                similarity_score=0.95,
+                suggested_content=pair[0].content,
+                memory_type=MemoryType.NOTE,
+            )
+            for pair in pairs
+        ]
+        monkeypatch.setattr(
+            "memoryforge.core.embedding_factory.create_embedding_service",
+            lambda config: Mock(),
+        )
+        monkeypatch.setattr(
+            "memoryforge.core.memory_consolidator.MemoryConsolidator.suggest_consolidations",
+            lambda self, max_suggestions: suggestions,
+        )
+        
+        result = CliRunner().invoke(main, ["--config", str(config_path), "consolidate", "suggest"])
+        
+        assert result.exit_code == 0, result.output
+        assert "Suggestion 3" in result.output
+        assert "Use [red]uv[/red] 0" in result.output
+
+
+class TestReindex:
+    """Tests for the reindex command."""
+    
+    def test_reindex_embeds_in_batches(self, cli_env, monkeypatch):
+        """Test that reindex embeds and indexes memories one batch at a time."""
+        config_path, db, project = cli_env
+        memories = [add_memory(db, project, f"Memory {i}") for i in range(5)]
+        add_memory(db, project, "Pending", confirmed=False)
+        
+        embedding_service = Mock()
+        embedding_service.generate_batch.side_effect = lambda texts: [[0.1] * 384 for _ in texts]
+        monkeypatch.setattr(
+            "memoryforge.core.embedding_factory.create_embedding_service",
+            lambda config: embedding_service,
+        )
+        
+        result = CliRunner().invoke(
+            main, ["--config", str(config_path), "reindex", "--force", "-b", "2"]
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert "Reindexed 5 memories" in result.output
+        assert embedding_service.generate_batch.call_count == 3
+        embedding_service.generate.assert_not_called()
+        assert all(db.get_embedding_reference(m.id) == str(m.id) for m in memories)
+    
+    def test_reindex_continues_after_failed_batch(self, cli_env, monkeypatch):
+        """Test that a failed embedding batch is counted and later batches still run."""
+        config_path, db, project = cli_env
+        for i in range(4):
+            add_memory(db, project, f"Memory {i}")
+        
+        embedding_service = Mock()
+        embedding_service.generate_batch.side_effect = [
+            RuntimeError("provider unavailable"),
+            [[0.1] * 384, [0.2] * 384],
+        ]
+        monkeypatch.setattr(
+            "memoryforge.core.embedding_factory.create_embedding_service",
+            lambda config: embedding_service,
+        )
+        
+        result = CliRunner().invoke(
+            main, ["--config", str(config_path), "reindex", "--force", "-b", "2"]
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert "Reindexed 2 memories" in result.output
+        assert "2 memories failed" in result.output
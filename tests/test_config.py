@@ -0,0 +1,61 @@
+"""
+Tests for configuration loading and saving.
+"""
+
+from unittest.mock import patch
+
+from memoryforge import config as config_module
+from memoryforge.config import Config, EmbeddingProvider
+
+
+class TestConfigLoad:
+    """Tests for Config.load."""
+    
+    def test_missing_file_gives_defaults(self, tmp_path):
+        """Test that a missing config file falls back to defaults."""
+        config = Config.load(tmp_path / "missing.yaml")
+        
+        assert config.project_name == "default"
+    
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test that saved settings are read back."""
+        config_path = tmp_path / "config.yaml"
+        Config(
+            storage_path=tmp_path,
+            project_name="roundtrip",
+            embedding_provider=EmbeddingProvider.OPENAI,
+            sync_path=tmp_path / "sync",
+        ).save(config_path)
+        
+        config = Config.load(config_path)
+        
+        assert config.project_name == "roundtrip"
+        assert config.embedding_provider == EmbeddingProvider.OPENAI
+        assert config.storage_path == tmp_path
+        assert config.sync_path == tmp_path / "sync"
+        assert config.sync_key is None
+    
+    def test_repeated_loads_parse_once(self, tmp_path):
+        """Test that an unchanged file is parsed only once."""
+        config_path = tmp_path / "config.yaml"
+        Config(storage_path=tmp_path, project_name="cached").save(config_path)
+        
+        with patch.object(config_module.yaml, "load", wraps=config_module.yaml.load) as load:
+            first = Config.load(config_path)
+            second = Config.load(config_path)
+        
+        assert load.call_count == 1
+        assert first.project_name == second.project_name == "cached"
+        assert first is not second
+    
+    def test_save_invalidates_cached_parse(self, tmp_path):
+        """Test that rewriting the file is picked up by the next load."""
+        config_path = tmp_path / "config.yaml"
+        config = Config(storage_path=tmp_path, project_name="before")
+        config.save(config_path)
+        Config.load(config_path)
+        
+        config.project_name = "after_"
+        config.save(config_path)
+        
+        assert Config.load(config_path).project_name == "after_"
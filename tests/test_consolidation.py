@@ -44,6 +44,7 @@ def mock_embedding_service():
     """Create a mock embedding service."""
     mock = Mock()
     mock.generate.return_value = [0.1] * 384  # Fake embedding
+    mock.generate_batch.side_effect = lambda texts: [[0.1] * 384 for _ in texts]
     return mock
 
 
@@ -52,6 +53,7 @@ def mock_qdrant():
     """Create a mock Qdrant store."""
     mock = Mock(spec=QdrantStore)
     mock.search.return_value = []
+    mock.get_vectors.return_value = {}
     mock.upsert.return_value = "vector-id"
     mock.delete.return_value = True
     return mock
@@ -73,7 +75,7 @@ class TestSimilaritySearch:
     """Tests for similarity search."""
     
     def test_uses_correct_embedding_method(self, consolidator, mock_embedding_service, temp_db, project):
-        """Verify generate() is called, not embed()."""
+        """Verify the protocol's batch method is called, not embed()."""
         # Create two test memories so similarity search has something to compare
         memory1 = Memory(
             content="Test memory content one",
@@ -96,13 +98,44 @@ class TestSimilaritySearch:
         # Run similarity search
         consolidator.find_similar_pairs()
         
-        # Verify generate was called (needs at least 2 memories to compare)
-        mock_embedding_service.generate.assert_called()
+        # Memories without stored vectors are embedded in one batch call
+        mock_embedding_service.generate_batch.assert_called_once()
+        (texts,), _ = mock_embedding_service.generate_batch.call_args
+        assert sorted(texts) == ["Test memory content one", "Test memory content two"]
         
         # Ensure embed() was NOT called (it shouldn't exist or shouldn't be called)
         if hasattr(mock_embedding_service, 'embed'):
             mock_embedding_service.embed.assert_not_called()
     
+    def test_batch_failure_embeds_one_at_a_time(
+        self, consolidator, mock_embedding_service, temp_db, project
+    ):
+        """Test that memories are embedded singly when the batch call fails."""
+        for content in ("First memory", "Second memory", "Broken memory"):
+            temp_db.create_memory(Memory(
+                content=content,
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            ))
+        
+        def generate(text):
+            if text == "Broken memory":
+                raise RuntimeError("cannot embed")
+            return [0.1] * 384
+        
+        mock_embedding_service.generate_batch.side_effect = RuntimeError("batch down")
+        mock_embedding_service.generate.side_effect = generate
+        
+        pairs = consolidator.find_similar_pairs()
+        
+        assert mock_embedding_service.generate.call_count == 3
+        assert [(a.content, b.content) for a, b, _ in pairs] in (
+            [("First memory", "Second memory")],
+            [("Second memory", "First memory")],
+        )
+    
     def test_find_similar_pairs_empty_db(self, consolidator):
         """Test find_similar_pairs with empty database."""
         pairs = consolidator.find_similar_pairs()
@@ -121,6 +154,92 @@ class TestSimilaritySearch:
         
         pairs = consolidator.find_similar_pairs()
         assert pairs == []  # Need at least 2 memories
+    
+    def test_find_similar_pairs_uses_stored_vectors(
+        self, consolidator, mock_qdrant, mock_embedding_service, temp_db, project
+    ):
+        """Test that pairs are scored from indexed vectors without re-embedding."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(3)
+        ]
+        temp_db.create_memories(memories)
+        mock_qdrant.get_vectors.return_value = {
+            str(memories[0].id): [1.0, 0.0, 0.0],
+            str(memories[1].id): [0.99, 0.05, 0.0],
+            str(memories[2].id): [0.0, 1.0, 0.0],
+        }
+        
+        pairs = consolidator.find_similar_pairs()
+        
+        assert len(pairs) == 1
+        first, second, score = pairs[0]
+        assert {first.id, second.id} == {memories[0].id, memories[1].id}
+        assert score > 0.99
+        mock_embedding_service.generate.assert_not_called()
+    
+    def test_find_similar_pairs_cached_until_memories_change(
+        self, consolidator, mock_qdrant, temp_db, project
+    ):
+        """Test that repeated searches reuse cached pairs until a memory is added."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(2)
+        ]
+        temp_db.create_memories(memories)
+        mock_qdrant.get_vectors.return_value = {str(m.id): [1.0, 0.0] for m in memories}
+        
+        first = consolidator.find_similar_pairs()
+        second = consolidator.find_similar_pairs()
+        
+        assert mock_qdrant.get_vectors.call_count == 1
+        assert [(a.id, b.id, s) for a, b, s in second] == [(a.id, b.id, s) for a, b, s in first]
+        
+        another = temp_db.create_memory(Memory(
+            content="Another memory",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        ))
+        mock_qdrant.get_vectors.return_value[str(another.id)] = [0.0, 1.0]
+        consolidator.find_similar_pairs()
+        
+        assert mock_qdrant.get_vectors.call_count == 2
+    
+    def test_find_similar_pairs_respects_limit(self, consolidator, mock_qdrant, temp_db, project):
+        """Test that only the highest scoring pairs are returned."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(4)
+        ]
+        temp_db.create_memories(memories)
+        mock_qdrant.get_vectors.return_value = {
+            str(m.id): [1.0, 0.01 * i] for i, m in enumerate(memories)
+        }
+        
+        pairs = consolidator.find_similar_pairs(limit=2)
+        
+        assert len(pairs) == 2
+        assert pairs[0][2] >= pairs[1][2]
 
 
 class TestConsolidation:
@@ -352,3 +471,54 @@ class TestStaleness:
         
         assert len(unused) == 1
         assert unused[0].id == old_memory.id
+    
+    def test_suggest_stale_for_consolidation_batches_search(
+        self, consolidator, mock_qdrant, mock_embedding_service, temp_db, project
+    ):
+        """Test that unused memories are matched with one batched search."""
+        old = datetime.utcnow() - timedelta(days=60)
+        stale_match = Memory(
+            content="Old FastAPI note",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+            created_at=old,
+        )
+        stale_unique = Memory(
+            content="Old unrelated note",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+            created_at=old,
+        )
+        active = Memory(
+            content="We use FastAPI",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        temp_db.create_memories([stale_match, stale_unique, active])
+        
+        mock_qdrant.get_vectors.return_value = {
+            str(stale_match.id): [1.0, 0.0],
+            str(stale_unique.id): [0.0, 1.0],
+        }
+        mock_qdrant.search_batch.return_value = [
+            [
+                {"memory_id": str(stale_match.id), "score": 1.0},
+                {"memory_id": str(active.id), "score": 0.93},
+            ],
+            [{"memory_id": str(stale_unique.id), "score": 1.0}],
+        ]
+        
+        suggestions = consolidator.suggest_stale_for_consolidation(days_unused=30)
+        
+        mock_qdrant.search_batch.assert_called_once()
+        mock_embedding_service.generate.assert_not_called()
+        assert len(suggestions) == 1
+        assert suggestions[0].source_ids == [stale_match.id, active.id]
+        assert suggestions[0].similarity_score == 0.93
+        assert temp_db.get_memory(stale_unique.id).is_stale is True
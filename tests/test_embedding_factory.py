@@ -0,0 +1,146 @@
+"""
+Tests for the embedding factory.
+"""
+
+import os
+import sys
+import types
+from unittest.mock import Mock
+
+import pytest
+
+from memoryforge.config import Config, EmbeddingProvider
+from memoryforge.core.embedding_factory import (
+    _cached_service,
+    create_embedding_service,
+    get_embedding_dimension,
+)
+from memoryforge.core.local_embedding_service import LocalEmbeddingService, _load_model
+
+
+class TestEmbeddingDimension:
+    """Tests for resolving embedding dimensions."""
+    
+    def test_known_dimensions(self):
+        """Test dimensions for known providers and models."""
+        assert get_embedding_dimension(EmbeddingProvider.OPENAI, "text-embedding-3-small") == 1536
+        assert get_embedding_dimension(EmbeddingProvider.LOCAL, "all-MiniLM-L6-v2") == 384
+        assert get_embedding_dimension(EmbeddingProvider.LOCAL, "all-mpnet-base-v2") == 768
+    
+    def test_unknown_local_model_defaults(self):
+        """Test that unknown local models fall back to 384."""
+        assert get_embedding_dimension(EmbeddingProvider.LOCAL, "custom-model") == 384
+    
+    def test_dimension_is_cached_and_loads_no_model(self):
+        """Test that repeated lookups hit the cache without importing models."""
+        get_embedding_dimension.cache_clear()
+        
+        get_embedding_dimension(EmbeddingProvider.LOCAL, "all-MiniLM-L6-v2")
+        get_embedding_dimension(EmbeddingProvider.LOCAL, "all-MiniLM-L6-v2")
+        
+        assert get_embedding_dimension.cache_info().hits == 1
+        assert "sentence_transformers" not in sys.modules
+
+
+class TestLocalModelCache:
+    """Tests for sharing loaded local models between service instances."""
+    
+    def test_model_loaded_once_per_name(self, monkeypatch):
+        """Test that new services reuse the loaded model for the same name."""
+        loaded = []
+        
+        def load_model(name):
+            loaded.append(name)
+            model = Mock()
+            model.get_sentence_embedding_dimension.return_value = 384
+            return model
+        
+        fake_module = types.ModuleType("sentence_transformers")
+        fake_module.SentenceTransformer = load_model
+        monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+        _load_model.cache_clear()
+        _cached_service.cache_clear()
+        
+        config = Config(embedding_provider=EmbeddingProvider.LOCAL)
+        first = create_embedding_service(config)
+        second = create_embedding_service(config)
+        other = LocalEmbeddingService(model_name="all-mpnet-base-v2")
+        
+        assert first._get_model() is second._get_model()
+        assert second.dimension == 384
+        other._get_model()
+        
+        assert loaded == ["all-MiniLM-L6-v2", "all-mpnet-base-v2"]
+        assert other._get_model() is not first._get_model()
+        _load_model.cache_clear()
+    
+    def test_batch_returns_float_lists(self):
+        """Test that a batch of encoded vectors comes back as lists of floats."""
+        import numpy as np
+        
+        service = LocalEmbeddingService()
+        service._model = Mock()
+        service._model.encode.return_value = np.array([[0.5, 1.0], [2.0, 0.0]], dtype=np.float32)
+        
+        embeddings = service.generate_batch(["a", "b"])
+        
+        assert embeddings == [[0.5, 1.0], [2.0, 0.0]]
+        assert isinstance(embeddings[0], list) and isinstance(embeddings[0][0], float)
+        assert service.generate_batch([]) == []
+        assert service._model.encode.call_args.kwargs == {
+            "batch_size": 64,
+            "normalize_embeddings": True,
+            "convert_to_numpy": True,
+            "show_progress_bar": False,
+        }
+    
+    async def test_async_runs_on_bounded_pool(self):
+        """Test that async generation uses one capped per-service thread pool."""
+        import threading
+        
+        import numpy as np
+        
+        threads = []
+        service = LocalEmbeddingService()
+        service._model = Mock()
+        
+        def encode(text, **kwargs):
+            threads.append(threading.current_thread().name)
+            return np.array([float(len(text))])
+        
+        service._model.encode.side_effect = encode
+        
+        assert await service.generate_async("abc") == [3.0]
+        executor = service._executor
+        assert await service.generate_async("abcd") == [4.0]
+        
+        assert service._executor is executor
+        assert executor._max_workers == min(4, os.cpu_count() or 1)
+        assert all(name.startswith("local-embedding") for name in threads)
+        executor.shutdown()
+
+
+class TestServiceCache:
+    """Tests for sharing embedding services within a process."""
+    
+    def test_same_settings_share_a_service(self):
+        """Test that equal provider/model settings return one instance."""
+        _cached_service.cache_clear()
+        
+        first = create_embedding_service(Config(embedding_provider=EmbeddingProvider.LOCAL))
+        second = create_embedding_service(Config(embedding_provider=EmbeddingProvider.LOCAL))
+        other = create_embedding_service(Config(
+            embedding_provider=EmbeddingProvider.LOCAL,
+            local_embedding_model="all-mpnet-base-v2",
+        ))
+        
+        assert first is second
+        assert other is not first
+        assert other.model_name == "all-mpnet-base-v2"
+    
+    def test_openai_without_key_is_rejected(self):
+        """Test that a missing OpenAI key still fails before any caching."""
+        config = Config(embedding_provider=EmbeddingProvider.OPENAI, openai_api_key="")
+        
+        with pytest.raises(ValueError, match="API key"):
+            create_embedding_service(config)
@@ -0,0 +1,204 @@
+"""
+Tests for the OpenAI embedding service.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("openai")
+
+import openai
+
+from memoryforge.core import embedding_service
+from memoryforge.core.embedding_service import EmbeddingService
+
+
+def make_service(create):
+    """Create a service whose API calls go to the given function."""
+    service = EmbeddingService(api_key="test-key")
+    service.client = Mock()
+    service.client.embeddings.create.side_effect = create
+    return service
+
+
+def fake_create(input, model):
+    """Embed each text as its length, like a single or batch API response."""
+    texts = input if isinstance(input, list) else [input]
+    return Mock(data=[Mock(embedding=[float(len(t))]) for t in texts])
+
+
+class TestBatchFallback:
+    """Tests for the per-text fallback when a batch request fails."""
+
+    def test_fallback_requests_overlap_and_keep_order(self):
+        """Test that single requests run concurrently and results stay in order."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def create(input, model):
+            nonlocal in_flight, peak
+            if isinstance(input, list):
+                raise api_error(openai.InternalServerError, 503)
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return Mock(data=[Mock(embedding=[float(len(input))])])
+
+        service = make_service(create)
+
+        texts = ["a" * n for n in range(1, 9)]
+
+        assert service.generate_batch(texts) == [[float(n)] for n in range(1, 9)]
+        assert peak > 1
+
+    def test_permanent_batch_error_is_raised_without_fallback(self):
+        """Test that a non-retryable batch error is not retried text by text."""
+        service = make_service(Mock(side_effect=api_error(openai.AuthenticationError, 401)))
+
+        with pytest.raises(openai.AuthenticationError):
+            service.generate_batch(["a", "bb", "ccc"])
+
+        assert service.client.embeddings.create.call_count == 1
+
+
+class TestEmbeddingCache:
+    """Tests for reusing embeddings of texts seen before."""
+
+    def test_repeated_text_is_not_requested_again(self):
+        """Test that a second generate for the same text hits the cache."""
+        service = make_service(fake_create)
+
+        first = service.generate("hello")
+        first.append(99.0)
+        second = service.generate("hello")
+
+        assert second == [5.0]
+        assert service.client.embeddings.create.call_count == 1
+
+    def test_batch_only_sends_uncached_texts(self):
+        """Test that a batch requests just the texts missing from the cache."""
+        service = make_service(fake_create)
+        service.generate("cached")
+
+        results = service.generate_batch(["new", "cached", "other"])
+
+        assert results == [[3.0], [6.0], [5.0]]
+        assert service.client.embeddings.create.call_args.kwargs["input"] == ["new", "other"]
+        assert service.generate_batch(["other", "new"]) == [[5.0], [3.0]]
+        assert service.client.embeddings.create.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        """Test that the cache stays within its size limit."""
+        monkeypatch.setattr(embedding_service, "CACHE_MAX_ENTRIES", 2)
+        service = make_service(fake_create)
+
+        service.generate("a")
+        service.generate("bb")
+        service.generate("a")
+        service.generate("ccc")
+        service.generate("a")
+        service.generate("bb")
+
+        assert service.client.embeddings.create.call_count == 4
+
+    def test_fresh_and_cached_results_match(self):
+        """Test that the first call returns the same vector as a later cache hit."""
+        service = make_service(lambda input, model: Mock(data=[Mock(embedding=[0.1, 1 / 3])]))
+
+        first = service.generate("text")
+        second = service.generate("text")
+        (batched,) = service.generate_batch(["other"])
+
+        assert first == second
+        assert first != [0.1, 1 / 3]
+        assert batched == first
+
+    def test_cached_vectors_are_compact_float32(self):
+        """Test that cached vectors are float32 arrays returned as float lists."""
+        service = make_service(
+            lambda input, model: Mock(data=[Mock(embedding=[0.1] * 1536)])
+        )
+
+        service.generate("text")
+        cached = service.generate("text")
+
+        (stored,) = service._cache.values()
+        assert stored.dtype.name == "float32"
+        assert stored.nbytes == 1536 * 4
+        assert isinstance(cached, list) and isinstance(cached[0], float)
+        assert cached[0] == pytest.approx(0.1)
+
+
+class TestGenerateAsync:
+    """Tests for embedding through the async OpenAI client."""
+
+    async def test_uses_async_client_and_cache(self):
+        """Test that async generation awaits the API once per new text."""
+        calls = []
+
+        async def create(input, model):
+            calls.append(input)
+            return Mock(data=[Mock(embedding=[float(len(input))])])
+
+        service = make_service(fake_create)
+        service._async_client = Mock()
+        service._async_client.embeddings.create.side_effect = create
+
+        assert await service.generate_async("four") == [4.0]
+        assert await service.generate_async("four") == [4.0]
+        assert service.generate("four") == [4.0]
+        assert calls == ["four"]
+        assert service.client.embeddings.create.call_count == 0
+
+
+def api_error(error_class, status_code, headers=None):
+    """Build an OpenAI status error with the given response headers."""
+    import httpx
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_class("failed", response=response, body=None)
+
+
+class TestRetries:
+    """Tests for retrying failed embedding requests."""
+
+    def test_rate_limit_honours_retry_after(self, monkeypatch):
+        """Test that the server's Retry-After is used and no sleep follows the last try."""
+        sleeps = []
+        monkeypatch.setattr(embedding_service.time, "sleep", sleeps.append)
+        error = api_error(openai.RateLimitError, 429, {"retry-after": "2"})
+        service = make_service(Mock(side_effect=error))
+
+        with pytest.raises(RuntimeError, match="after 3 attempts"):
+            service.generate("text")
+
+        assert sleeps == [2.0, 2.0]
+
+    def test_client_error_fails_fast(self, monkeypatch):
+        """Test that a 400 is raised at once without retrying."""
+        sleeps = []
+        monkeypatch.setattr(embedding_service.time, "sleep", sleeps.append)
+        service = make_service(Mock(side_effect=api_error(openai.BadRequestError, 400)))
+
+        with pytest.raises(openai.BadRequestError):
+            service.generate("text")
+
+        assert service.client.embeddings.create.call_count == 1
+        assert sleeps == []
+
+    def test_server_error_retries_then_succeeds(self, monkeypatch):
+        """Test that a 5xx is retried with backoff."""
+        monkeypatch.setattr(embedding_service.time, "sleep", lambda delay: None)
+        responses = [api_error(openai.InternalServerError, 503), fake_create("abc", None)]
+        service = make_service(Mock(side_effect=responses))
+
+        assert service.generate("abc") == [3.0]
+        assert service.client.embeddings.create.call_count == 2
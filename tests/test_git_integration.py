@@ -2,6 +2,8 @@
 Tests for Git integration.
 """
 
+import shutil
+import subprocess
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +18,7 @@ from memoryforge.storage.sqlite_db import SQLiteDatabase
 # Check if git dependencies are available
 try:
     from memoryforge.core.git_integration import GitIntegration
+    from memoryforge.core.git_scanner import GitScanner
     HAS_GIT = True
 except ImportError:
     HAS_GIT = False
@@ -158,6 +161,23 @@ class TestMemoryLinking:
         
         assert len(links) == 2
         assert {l.commit_sha for l in links} == {"commit1", "commit2"}
+    
+    def test_get_commit_memory_counts(self, temp_db, project):
+        """Test counting linked memories for many commits at once."""
+        for i in range(2):
+            memory = Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.GIT,
+                project_id=project.id,
+                confirmed=True,
+            )
+            temp_db.create_memory(memory)
+            temp_db.create_memory_link(memory.id, "commit1", LinkType.RELATED_TO)
+        
+        counts = temp_db.get_commit_memory_counts(["commit1", "commit2"])
+        
+        assert counts == {"commit1": 2}
 
 
 @pytest.mark.skipif(not HAS_GIT, reason="git dependencies not installed")
@@ -202,6 +222,243 @@ class TestCommitAnalysis:
             assert has_keyword or "feat" in msg.lower()
 
 
+def git(repo, *args):
+    """Run a git command in a test repository."""
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestGitScanner:
+    """Tests for the subprocess-based git scanner."""
+    
+    def test_get_recent_commits_reads_files_in_one_pass(self, tmp_path):
+        """Test that commits are parsed with their changed files, newest first."""
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "config", "user.email", "dev@example.com")
+        git(tmp_path, "config", "user.name", "Dev")
+        (tmp_path / "a.py").write_text("a")
+        git(tmp_path, "add", "a.py")
+        git(tmp_path, "commit", "-q", "-m", "Initial commit")
+        (tmp_path / "b.py").write_text("b")
+        (tmp_path / "c.py").write_text("c")
+        git(tmp_path, "add", "b.py", "c.py")
+        git(tmp_path, "commit", "-q", "-m", "refactor: Split modules | tidy")
+        
+        scanner = GitScanner(tmp_path)
+        
+        with patch.object(scanner, "_stream_git", wraps=scanner._stream_git) as stream_git:
+            commits = scanner.get_recent_commits(10)
+        
+        assert stream_git.call_count == 1
+        assert [c.message for c in commits] == ["refactor: Split modules | tidy", "Initial commit"]
+        assert commits[0].files_changed == ["b.py", "c.py"]
+        assert commits[1].files_changed == ["a.py"]
+        assert commits[0].author == "Dev"
+        assert [c.message for c in scanner.find_architectural_commits()] == [
+            "refactor: Split modules | tidy"
+        ]
+        assert [c.message for c in scanner.find_architectural_commits(["INITIAL", "a|b"])] == [
+            "Initial commit"
+        ]
+        assert scanner.find_architectural_commits([]) == []
+        
+        with patch.object(scanner, "_stream_git", wraps=scanner._stream_git) as stream_git:
+            assert scanner.find_architectural_commits(["split"], limit=1)[0].files_changed == [
+                "b.py",
+                "c.py",
+            ]
+        
+        assert "--grep=split" in stream_git.call_args.args
+        assert scanner.get_diff_stats(commits[1].sha) == {
+            "files_changed": 2,
+            "insertions": 2,
+            "deletions": 0,
+        }
+    
+    def test_get_commit_reads_message_and_files_in_one_call(self, tmp_path):
+        """Test that a single commit lookup runs git once, root commits included."""
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "config", "user.email", "dev@example.com")
+        git(tmp_path, "config", "user.name", "Dev | Ops")
+        (tmp_path / "a.py").write_text("a")
+        (tmp_path / "b.py").write_text("b")
+        git(tmp_path, "add", "a.py", "b.py")
+        git(tmp_path, "commit", "-q", "-m", "Initial commit\n\nWith a body.")
+        
+        scanner = GitScanner(tmp_path)
+        
+        with patch.object(scanner, "_run_git", wraps=scanner._run_git) as run_git:
+            commit = scanner.get_commit("HEAD")
+        
+        assert run_git.call_count == 1
+        assert commit.message == "Initial commit\n\nWith a body."
+        assert commit.author == "Dev | Ops"
+        assert commit.files_changed == ["a.py", "b.py"]
+        assert commit.date.tzinfo is not None
+        assert [c.author for c in scanner.find_commits_affecting_file("a.py")] == ["Dev | Ops"]
+    
+    def test_get_file_at_commit_reuses_one_git_process(self, tmp_path):
+        """Test that file reads go through one long-running cat-file process."""
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "config", "user.email", "dev@example.com")
+        git(tmp_path, "config", "user.name", "Dev")
+        (tmp_path / "a.py").write_text("first\n")
+        git(tmp_path, "add", "a.py")
+        git(tmp_path, "commit", "-q", "-m", "Add a")
+        (tmp_path / "a.py").write_text("second\n")
+        (tmp_path / "empty.py").write_text("")
+        git(tmp_path, "add", "a.py", "empty.py")
+        git(tmp_path, "commit", "-q", "-m", "Change a")
+        
+        scanner = GitScanner(tmp_path)
+        first_sha = scanner.get_commit("HEAD~1").sha
+        
+        with patch.object(scanner, "_run_git") as run_git:
+            assert scanner.get_file_at_commit("a.py", first_sha) == "first\n"
+            process = scanner._catfile
+            assert scanner.get_file_at_commit("a.py", "HEAD") == "second\n"
+            assert scanner.get_file_at_commit("missing.py", "HEAD") is None
+            assert scanner.get_file_at_commit("no such.py", "HEAD") is None
+            assert scanner.get_file_at_commit("empty.py", "HEAD") is None
+            assert scanner.get_file_at_commit("a.py", first_sha) == "first\n"
+        
+        assert run_git.call_count == 0
+        assert scanner._catfile is process
+        
+        scanner.close()
+        
+        assert scanner._catfile is None
+        assert process.poll() is not None
+
+
+@pytest.mark.skipif(not HAS_GIT, reason="git dependencies not installed")
+class TestCommitCache:
+    """Tests for reusing fetched commits across lookups."""
+    
+    def test_relevant_commits_fetch_once(self, temp_db, project, mock_config):
+        """Test that matching several memories runs git log once."""
+        from memoryforge.core.git_scanner import CommitInfo as ScannedCommit
+        
+        commits = [
+            ScannedCommit(
+                sha="a" * 40,
+                message="Switch storage to PostgreSQL",
+                author="Dev",
+                date=datetime.utcnow(),
+                files_changed=["db.py"],
+            ),
+            ScannedCommit(
+                sha="b" * 40,
+                message="Add Redis caching layer",
+                author="Dev",
+                date=datetime.utcnow(),
+                files_changed=["cache.py"],
+            ),
+        ]
+        scanner = Mock()
+        scanner.get_recent_commits.return_value = commits
+        integration = GitIntegration(temp_db, mock_config, project.id)
+        integration._scanner = scanner
+        
+        first = integration.find_relevant_commits(Memory(
+            content="We use postgresql for storage",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+        ))
+        second = integration.find_relevant_commits(Memory(
+            content="Redis handles caching",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+        ))
+        activity = integration.get_recent_activity(days=7)
+        
+        assert [c.sha for c, _ in first] == ["a" * 40]
+        assert [c.sha for c, _ in second] == ["b" * 40]
+        assert activity["commit_count"] == 2
+        assert scanner.get_recent_commits.call_count == 1
+    
+    def test_relevant_commits_ranked_by_matching_words(self, temp_db, project, mock_config):
+        """Test scoring by whole-word matches, best first, newest on ties."""
+        from memoryforge.core.git_scanner import CommitInfo as ScannedCommit
+        
+        messages = [
+            "Tune redis timeouts",
+            "Move sessions into redis",
+            "Store sessions in redis, drop memcached",
+            "Fix typo",
+        ]
+        scanner = Mock()
+        scanner.get_recent_commits.return_value = [
+            ScannedCommit(
+                sha=str(i) * 40,
+                message=message,
+                author="Dev",
+                date=datetime.utcnow(),
+                files_changed=[],
+            )
+            for i, message in enumerate(messages)
+        ]
+        integration = GitIntegration(temp_db, mock_config, project.id)
+        integration._scanner = scanner
+        
+        results = integration.find_relevant_commits(Memory(
+            content="Sessions are in Redis.",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+        ), limit=3)
+        
+        assert [(c.message, score) for c, score in results] == [
+            ("Move sessions into redis", 1.0),
+            ("Store sessions in redis, drop memcached", 1.0),
+            ("Tune redis timeouts", 0.5),
+        ]
+    
+    def test_architectural_reason_uses_keyword_priority(self, temp_db, project, mock_config):
+        """Test that the highest-priority keyword wins wherever it appears."""
+        from memoryforge.core.git_scanner import CommitInfo as ScannedCommit
+        
+        integration = GitIntegration(temp_db, mock_config, project.id)
+        
+        def reason(message):
+            return integration._get_architectural_reason(
+                ScannedCommit(sha="a" * 40, message=message, author="Dev",
+                              date=datetime.utcnow(), files_changed=[])
+            )
+        
+        assert reason("Remove legacy client\n\nPart of the REFACTOR") == "Refactoring change"
+        assert reason("Upgrade and deprecate v1") == "Upgrade"
+        assert reason("Switch to gRPC") == "Architectural keyword detected"
+    
+    def test_recent_activity_compares_commit_times_in_utc(self, temp_db, project, mock_config):
+        """Test that commits with a UTC offset are windowed by their real time."""
+        from datetime import timedelta, timezone
+        
+        from memoryforge.core.git_scanner import CommitInfo as ScannedCommit
+        
+        # Inside the window in UTC, but outside it by local wall-clock time
+        eastern = timezone(timedelta(hours=-5))
+        inside = datetime.now(eastern) - timedelta(days=7) + timedelta(hours=1)
+        outside = datetime.utcnow() - timedelta(days=8)
+        scanner = Mock()
+        scanner.get_recent_commits.return_value = [
+            ScannedCommit(sha="a" * 40, message="Recent", author="Ann",
+                          date=inside, files_changed=["a.py", "b.py"]),
+            ScannedCommit(sha="b" * 40, message="Old", author="Bob",
+                          date=outside, files_changed=["c.py"]),
+        ]
+        integration = GitIntegration(temp_db, mock_config, project.id)
+        integration._scanner = scanner
+        
+        activity = integration.get_recent_activity(days=7)
+        
+        assert activity["commit_count"] == 1
+        assert activity["files_changed"] == 2
+        assert activity["authors"] == ["Ann"]
+
+
 @pytest.mark.skipif(not HAS_GIT, reason="git dependencies not installed")
 class TestGitActivity:
     """Tests for git activity commands."""
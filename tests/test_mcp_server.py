@@ -0,0 +1,35 @@
+"""
+Tests for MCP server tool handlers.
+"""
+
+from unittest.mock import Mock
+
+from memoryforge.models import Memory, MemoryType, MemorySource, Project
+from memoryforge.mcp.server import _handle_list_projects
+
+
+class TestListProjects:
+    """Tests for the list_projects tool."""
+    
+    async def test_list_projects_uses_single_count_query(self, temp_db, temp_project):
+        """Test that memory counts are fetched once for all projects."""
+        other = temp_db.create_project(Project(name="other-project", root_path="/other"))
+        for i in range(2):
+            temp_db.create_memory(Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=temp_project.id,
+                confirmed=True,
+            ))
+        
+        router = Mock()
+        router.list_projects.return_value = [temp_project, other]
+        router.config.active_project_id = str(temp_project.id)
+        
+        result = await _handle_list_projects(router, temp_db)
+        
+        text = result[0].text
+        assert "→ test-project" in text
+        assert "Memories: 2" in text
+        assert "Memories: 0" in text
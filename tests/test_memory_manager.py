@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 
 from memoryforge.models import Memory, MemoryType, MemorySource, Project
 from memoryforge.storage.sqlite_db import SQLiteDatabase
@@ -238,3 +239,77 @@ class TestMemoryListing:
         count = memory_manager.get_memory_count()
         
         assert count == 5
+
+
+class TestBulkCreation:
+    """Tests for creating many memories at once."""
+    
+    def test_create_memories_bulk_unconfirmed(self, memory_manager, mock_embedding_service):
+        """Test bulk creation without confirmation skips embeddings."""
+        memories = memory_manager.create_memories_bulk(
+            ["We use Redis", "We use Celery"],
+            memory_type=MemoryType.STACK,
+        )
+        
+        assert len(memories) == 2
+        assert all(not m.confirmed for m in memories)
+        assert memory_manager.get_memory_count(confirmed_only=False) == 2
+        mock_embedding_service.generate_batch.assert_not_called()
+    
+    def test_create_memories_bulk_auto_confirm(self, memory_manager, mock_embedding_service):
+        """Test bulk creation embeds and indexes in batches."""
+        mock_embedding_service.generate_batch.side_effect = (
+            lambda texts: [[0.1] * 1536 for _ in texts]
+        )
+        memory_manager.vector_store.upsert_batch.side_effect = (
+            lambda points, wait=True: [str(p[0]) for p in points]
+        )
+        
+        memories = memory_manager.create_memories_bulk(
+            ["One", "Two", "Three"],
+            memory_type=MemoryType.NOTE,
+            auto_confirm=True,
+            batch_size=2,
+        )
+        
+        assert all(m.confirmed for m in memories)
+        assert mock_embedding_service.generate_batch.call_count == 2
+        assert memory_manager.get_memory_count(confirmed_only=True) == 3
+        assert memory_manager.db.get_embedding_reference(memories[0].id) == str(memories[0].id)
+        
+        # Batches are pipelined and flushed once at the end
+        for call in memory_manager.vector_store.upsert_batch.call_args_list:
+            assert call.kwargs["wait"] is False
+        memory_manager.vector_store.flush.assert_called_once()
+    
+    def test_create_memories_bulk_flush_failure_is_logged(
+        self, memory_manager, mock_embedding_service, caplog
+    ):
+        """Test that a failed flush is reported like a failed batch, not raised."""
+        mock_embedding_service.generate_batch.side_effect = (
+            lambda texts: [[0.1] * 1536 for _ in texts]
+        )
+        memory_manager.vector_store.upsert_batch.side_effect = (
+            lambda points, wait=True: [str(p[0]) for p in points]
+        )
+        memory_manager.vector_store.flush.side_effect = RuntimeError("qdrant down")
+        
+        memories = memory_manager.create_memories_bulk(
+            ["One", "Two"],
+            memory_type=MemoryType.NOTE,
+            auto_confirm=True,
+        )
+        
+        assert len(memories) == 2
+        assert "Failed to flush vector store" in caplog.text
+    
+    def test_create_memories_bulk_validates_before_writing(self, memory_manager):
+        """Test that one invalid entry aborts the whole batch."""
+        # Pydantic raises ValidationError first for empty content
+        with pytest.raises(PydanticValidationError):
+            memory_manager.create_memories_bulk(
+                ["Valid memory", ""],
+                memory_type=MemoryType.NOTE,
+            )
+        
+        assert memory_manager.get_memory_count(confirmed_only=False) == 0
@@ -22,21 +22,23 @@ def create_v1_database(db_path: Path) -> None:
     """Create a v1-style database at the given path."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    conn = sqlite3.connect(str(db_path))
+    # Autocommit mode with one explicit transaction around the whole setup;
+    # the journal lives in memory since this database is throwaway.
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
     try:
         cursor = conn.cursor()
-        
-        # Create v1 tables (without v2 columns)
-        cursor.execute("""
+        cursor.executescript("""
+            PRAGMA journal_mode=MEMORY;
+            BEGIN;
+            
+            -- Create v1 tables (without v2 columns)
             CREATE TABLE projects (
                 id TEXT PRIMARY KEY,
                 name TEXT NOT NULL,
                 root_path TEXT NOT NULL,
                 created_at TEXT NOT NULL
-            )
-        """)
-        
-        cursor.execute("""
+            );
+            
             CREATE TABLE memories (
                 id TEXT PRIMARY KEY,
                 project_id TEXT NOT NULL,
@@ -48,43 +50,35 @@ def create_v1_database(db_path: Path) -> None:
                 confirmed INTEGER NOT NULL DEFAULT 0,
                 metadata TEXT NOT NULL DEFAULT '{}',
                 FOREIGN KEY (project_id) REFERENCES projects(id)
-            )
-        """)
-        
-        cursor.execute("""
+            );
+            
             CREATE TABLE embeddings (
                 memory_id TEXT PRIMARY KEY,
                 vector_id TEXT NOT NULL,
                 FOREIGN KEY (memory_id) REFERENCES memories(id)
-            )
+            );
         """)
         
         # Create a project
         project_id = str(uuid4())
+        now = datetime.utcnow().isoformat()
         cursor.execute(
             "INSERT INTO projects (id, name, root_path, created_at) VALUES (?, ?, ?, ?)",
-            (project_id, "test-project", "/test", datetime.utcnow().isoformat())
+            (project_id, "test-project", "/test", now)
         )
         
         # Create some memories
-        for i in range(5):
-            cursor.execute(
-                """INSERT INTO memories 
-                   (id, project_id, content, type, source, created_at, confirmed, metadata)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(uuid4()),
-                    project_id,
-                    f"Memory {i}",
-                    "note",
-                    "manual",
-                    datetime.utcnow().isoformat(),
-                    1,
-                    "{}",
-                )
-            )
+        cursor.executemany(
+            """INSERT INTO memories 
+               (id, project_id, content, type, source, created_at, confirmed, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (str(uuid4()), project_id, f"Memory {i}", "note", "manual", now, 1, "{}")
+                for i in range(5)
+            ],
+        )
         
-        conn.commit()
+        cursor.execute("COMMIT")
     finally:
         conn.close()
 
@@ -223,7 +217,42 @@ class TestMigrationV1ToV2:
         
         # Still at v3 (latest)
         assert migrator._get_schema_version() == 3
+    
+    def test_migration_step_is_atomic(self, v1_database):
+        """Test that a failing migration step leaves no partial schema changes."""
+        migrator = Migrator(v1_database)
+        
+        with pytest.raises(sqlite3.OperationalError):
+            with migrator._transaction() as conn:
+                conn.execute("ALTER TABLE memories ADD COLUMN is_stale BOOLEAN DEFAULT 0")
+                conn.execute("SELECT * FROM missing_table")
+        
+        conn = sqlite3.connect(str(v1_database.sqlite_path))
+        try:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(memories)")]
+        finally:
+            conn.close()
+        
+        assert "is_stale" not in columns
 
+    
+    def test_checkpoint_truncates_wal(self, v1_database):
+        """Test that checkpointing empties the WAL while a reader holds it open."""
+        db_path = v1_database.sqlite_path
+        wal_path = Path(f"{db_path}-wal")
+        
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("UPDATE memories SET content = content || '!'")
+            conn.commit()
+            assert wal_path.stat().st_size > 0
+            
+            Migrator(v1_database)._checkpoint(optimize=True)
+            
+            assert wal_path.stat().st_size == 0
+        finally:
+            conn.close()
 
 class TestMigrationRollback:
     """Tests for migration rollback."""
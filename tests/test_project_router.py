@@ -118,6 +118,17 @@ class TestProjectRetrieval:
         projects = project_router.list_projects()
         
         assert len(projects) == 3
+    
+    def test_list_projects_iter(self, project_router):
+        """Test streaming projects matches the materialized list."""
+        for i in range(3):
+            path = os.path.join(tempfile.gettempdir(), f"iter_test_{i}")
+            project_router.create_project(name=f"project-{i}", root_path=path)
+        
+        streamed = project_router.list_projects_iter()
+        
+        assert not isinstance(streamed, list)
+        assert [p.id for p in streamed] == [p.id for p in project_router.list_projects()]
 
 
 class TestProjectSwitching:
@@ -0,0 +1,76 @@
+"""
+Tests for the Qdrant vector store.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from memoryforge.storage.qdrant_store import QdrantStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create an embedded Qdrant store with small vectors."""
+    store = QdrantStore(tmp_path / "qdrant", embedding_dimension=3)
+    yield store
+    store.close()
+
+
+class TestBatchOperations:
+    """Tests for batched upsert, search and delete."""
+    
+    def test_upsert_batch_and_search_batch(self, store):
+        """Test that batched searches return one result list per query."""
+        ids = [uuid4(), uuid4()]
+        vector_ids = store.upsert_batch([
+            (ids[0], [1.0, 0.0, 0.0], "stack", "2026-01-01T00:00:00"),
+            (ids[1], [0.0, 1.0, 0.0], "decision", "2026-01-02T00:00:00"),
+        ])
+        
+        assert vector_ids == [str(i) for i in ids]
+        assert store.get_count() == 2
+        
+        results = store.search_batch([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], limit=1)
+        assert [r[0]["memory_id"] for r in results] == vector_ids
+        assert results[1][0]["memory_type"] == "decision"
+    
+    def test_search_filters_by_type(self, store):
+        """Test that single search honours the memory type filter."""
+        stack_id, note_id = uuid4(), uuid4()
+        store.upsert_batch([
+            (stack_id, [1.0, 0.0, 0.0], "stack", "2026-01-01T00:00:00"),
+            (note_id, [0.9, 0.1, 0.0], "note", "2026-01-01T00:00:00"),
+        ])
+        
+        results = store.search([1.0, 0.0, 0.0], limit=5, memory_type="note")
+        
+        assert [r["memory_id"] for r in results] == [str(note_id)]
+    
+    def test_delete_batch(self, store):
+        """Test deleting several vectors in one request."""
+        ids = [uuid4(), uuid4(), uuid4()]
+        store.upsert_batch([(i, [1.0, 0.0, 0.0], "note", "2026-01-01T00:00:00") for i in ids])
+        
+        assert store.delete_batch(ids[:2]) is True
+        assert store.get_count() == 1
+    
+    def test_unawaited_upserts_visible_after_flush(self, store):
+        """Test that writes issued with wait=False are applied by flush."""
+        ids = [uuid4(), uuid4()]
+        store.upsert(ids[0], [1.0, 0.0, 0.0], "note", "2026-01-01T00:00:00", wait=False)
+        store.upsert_batch([(ids[1], [0.0, 1.0, 0.0], "note", "2026-01-01T00:00:00")], wait=False)
+        
+        store.flush()
+        
+        assert store.get_count() == 2
+    
+    def test_get_vectors(self, store):
+        """Test fetching stored vectors for several memories at once."""
+        indexed, missing = uuid4(), uuid4()
+        store.upsert(indexed, [1.0, 0.0, 0.0], "note", "2026-01-01T00:00:00")
+        
+        vectors = store.get_vectors([indexed, missing])
+        
+        assert list(vectors) == [str(indexed)]
+        assert vectors[str(indexed)] == pytest.approx([1.0, 0.0, 0.0])
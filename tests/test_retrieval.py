@@ -331,3 +331,63 @@ class TestFallback:
         # Should still get results via keyword fallback
         assert len(results) >= 1
         assert "keyword" in results[0].explanation.lower()
+
+
+class TestSearchMany:
+    """Tests for batched multi-query search."""
+    
+    def test_search_many_batches_embeddings_and_vectors(
+        self, retrieval_engine, temp_db, project, mock_qdrant, mock_embedding_service
+    ):
+        """Test that several queries share one embedding and one vector call."""
+        stack = Memory(
+            content="We use FastAPI",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        decision = Memory(
+            content="We chose PostgreSQL",
+            type=MemoryType.DECISION,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        temp_db.create_memory(stack)
+        temp_db.create_memory(decision)
+        
+        mock_embedding_service.generate_batch.return_value = [[0.1] * 384, [0.2] * 384]
+        mock_qdrant.search_batch.return_value = [
+            [{"memory_id": str(stack.id), "score": 0.9}],
+            [{"memory_id": str(decision.id), "score": 0.8}],
+        ]
+        
+        results = retrieval_engine.search_many(["framework", "database"])
+        
+        mock_embedding_service.generate_batch.assert_called_once_with(["framework", "database"])
+        mock_qdrant.search_batch.assert_called_once()
+        assert [r.memory.id for r in results[0]] == [stack.id]
+        assert [r.memory.id for r in results[1]] == [decision.id]
+    
+    def test_search_many_falls_back_per_query(
+        self, retrieval_engine, temp_db, project, mock_qdrant, mock_embedding_service
+    ):
+        """Test keyword fallback for every query when vector search fails."""
+        memory = Memory(
+            content="We use FastAPI for the API",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        temp_db.create_memory(memory)
+        
+        mock_embedding_service.generate_batch.return_value = [[0.1] * 384, [0.2] * 384]
+        mock_qdrant.search_batch.side_effect = Exception("Qdrant unavailable")
+        
+        results = retrieval_engine.search_many(["FastAPI", "Django"])
+        
+        assert len(results) == 2
+        assert [r.memory.id for r in results[0]] == [memory.id]
+        assert results[1] == []
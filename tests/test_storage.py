@@ -209,6 +209,73 @@ class TestMemoryOperations:
         assert len(stack_memories) == 1
         assert stack_memories[0].type == MemoryType.STACK
     
+    def test_list_memories_summary(self, temp_db, project):
+        """Test listing lightweight memory rows."""
+        confirmed = Memory(
+            content="Confirmed memory",
+            type=MemoryType.STACK,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        pending = Memory(
+            content="Pending memory",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+        )
+        temp_db.create_memory(confirmed)
+        temp_db.create_memory(pending)
+        
+        rows = list(temp_db.list_memories_summary(project.id))
+        assert rows == [(
+            str(confirmed.id), "stack", "Confirmed memory", True,
+            confirmed.created_at.isoformat(),
+        )]
+        
+        all_rows = list(temp_db.list_memories_summary(project.id, confirmed_only=False))
+        assert len(all_rows) == 2
+        
+        # Later queries on the same connection still get named rows
+        assert temp_db.get_memory(pending.id).content == "Pending memory"
+    
+    def test_get_memories(self, temp_db, project):
+        """Test loading several memories by ID in one call."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+            )
+            for i in range(3)
+        ]
+        temp_db.create_memories(memories)
+        
+        found = temp_db.get_memories([memories[0].id, memories[2].id, uuid4()])
+        
+        assert set(found) == {memories[0].id, memories[2].id}
+        assert found[memories[2].id].content == "Memory 2"
+    
+    def test_iter_memories_streams_past_batch_size(self, temp_db, project):
+        """Test that iter_memories yields every confirmed memory across batches."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=i != 0,
+            )
+            for i in range(5)
+        ]
+        temp_db.create_memories(memories)
+        
+        streamed = temp_db.iter_memories(project.id, batch_size=2)
+        
+        assert not isinstance(streamed, list)
+        assert {m.id for m in streamed} == {m.id for m in memories[1:]}
+    
     def test_get_memory_count(self, temp_db, project):
         """Test counting memories."""
         # Create some memories
@@ -226,6 +293,125 @@ class TestMemoryOperations:
         
         assert count == 3
 
+    
+    def test_get_memory_counts(self, temp_db, project):
+        """Test counting memories for all projects at once."""
+        other = temp_db.create_project(Project(name="other", root_path="/other"))
+        empty = temp_db.create_project(Project(name="empty", root_path="/empty"))
+        
+        for i, (proj, confirmed) in enumerate(
+            [(project, True), (project, True), (project, False), (other, True)]
+        ):
+            temp_db.create_memory(Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=proj.id,
+                confirmed=confirmed,
+            ))
+        
+        counts = temp_db.get_memory_counts()
+        assert counts == {project.id: 2, other.id: 1}
+        assert empty.id not in counts
+        
+        all_counts = temp_db.get_memory_counts(confirmed_only=False)
+        assert all_counts[project.id] == 3
+    
+    def test_delete_memories(self, temp_db, project):
+        """Test deleting several memories and their references at once."""
+        memories = [
+            temp_db.create_memory(Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+            ))
+            for i in range(3)
+        ]
+        temp_db.save_embedding_reference(memories[0].id, "vector-0")
+        
+        temp_db.delete_memories([memories[0].id, memories[1].id])
+        
+        assert temp_db.get_memory(memories[0].id) is None
+        assert temp_db.get_memory(memories[1].id) is None
+        assert temp_db.get_memory(memories[2].id) is not None
+        assert temp_db.get_embedding_reference(memories[0].id) is None
+    
+    def test_get_memory_state_counts(self, temp_db, project):
+        """Test counting active, archived and stale memories together."""
+        assert temp_db.get_memory_state_counts(project.id) == {
+            "active": 0, "archived": 0, "stale": 0,
+        }
+        memories = [
+            temp_db.create_memory(Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=i != 3,
+            ))
+            for i in range(4)
+        ]
+        temp_db.archive_memory(memories[0].id, memories[1].id)
+        temp_db.mark_stale(memories[1].id, "outdated")
+        
+        assert temp_db.get_memory_state_counts(project.id) == {
+            "active": 2, "archived": 1, "stale": 1,
+        }
+    
+    def test_consolidate_memories(self, temp_db, project):
+        """Test saving a consolidation, versions and archive flags together."""
+        sources = [
+            temp_db.create_memory(Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            ))
+            for i in range(2)
+        ]
+        temp_db.save_memory_version(sources[0].id, "Older content", 1)
+        merged = Memory(
+            content="Merged",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        
+        versions = temp_db.consolidate_memories(merged, sources)
+        
+        assert [v.version for v in versions] == [2, 1]
+        assert temp_db.get_memory(merged.id).content == "Merged"
+        for source in sources:
+            archived = temp_db.get_memory(source.id)
+            assert archived.is_archived is True
+            assert archived.consolidated_into == merged.id
+        assert temp_db.get_memory_versions(sources[1].id)[0].content == "Memory 1"
+    
+    @pytest.mark.parametrize("update_from", [True, False])
+    def test_update_confidence_scores(self, temp_db, project, monkeypatch, update_from):
+        """Test batch score updates with and without UPDATE ... FROM."""
+        monkeypatch.setattr("memoryforge.storage.sqlite_db.HAS_UPDATE_FROM", update_from)
+        memories = [
+            temp_db.create_memory(Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+            ))
+            for i in range(3)
+        ]
+        
+        updated = temp_db.update_confidence_scores(
+            [(memories[0].id, 0.25), (memories[2].id, 0.75), (uuid4(), 0.5)]
+        )
+        
+        assert updated == 2
+        assert temp_db.get_memory(memories[0].id).confidence_score == 0.25
+        assert temp_db.get_memory(memories[1].id).confidence_score == 1.0
+        assert temp_db.get_memory(memories[2].id).confidence_score == 0.75
 
 class TestEmbeddingReferences:
     """Tests for embedding reference operations."""
@@ -260,6 +446,56 @@ class TestEmbeddingReferences:
         
         assert success is True
         assert temp_db.get_embedding_reference(memory.id) is None
+    
+    def test_confirm_indexed_memories(self, temp_db, project):
+        """Test saving references and confirming in one call."""
+        memories = [
+            Memory(
+                content=f"Test {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+            )
+            for i in range(2)
+        ]
+        temp_db.create_memories(memories)
+        
+        temp_db.confirm_indexed_memories([(m.id, f"vector-{i}") for i, m in enumerate(memories)])
+        
+        for i, memory in enumerate(memories):
+            assert temp_db.get_embedding_reference(memory.id) == f"vector-{i}"
+            assert temp_db.get_memory(memory.id).confirmed is True
+
+
+class TestSimilarityCache:
+    """Tests for cached consolidation pairs."""
+    
+    def test_cache_round_trip_and_invalidation(self, temp_db, project):
+        """Test that cached pairs are only returned for the same fingerprint."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(2)
+        ]
+        temp_db.create_memories(memories)
+        fingerprint = temp_db.get_memory_fingerprint(project.id)
+        pairs = [(memories[0].id, memories[1].id, 0.95)]
+        
+        temp_db.save_similar_pairs(project.id, 0.9, 50, fingerprint, pairs)
+        
+        assert temp_db.get_cached_similar_pairs(project.id, 0.9, 50, fingerprint) == pairs
+        assert temp_db.get_cached_similar_pairs(project.id, 0.8, 50, fingerprint) is None
+        
+        temp_db.mark_stale(memories[0].id, "outdated")
+        assert temp_db.get_memory_fingerprint(project.id) != fingerprint
+        
+        temp_db.clear_similarity_cache(project.id)
+        assert temp_db.get_cached_similar_pairs(project.id, 0.9, 50, fingerprint) is None
 
 
 class TestRestartRecovery:
@@ -298,3 +534,127 @@ class TestRestartRecovery:
             assert retrieved_memory is not None
             assert retrieved_memory.content == "This should persist"
             assert retrieved_memory.confirmed is True
+
+
+class TestConnectionTuning:
+    """Tests for SQLite connection pragmas."""
+    
+    def test_wal_journal_mode(self, temp_db):
+        """Test that the database file is switched to WAL."""
+        with temp_db._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert mode == "wal"
+    
+    def test_connection_pragmas_applied(self, temp_db):
+        """Test that per-connection pragmas are applied on open."""
+        with temp_db._get_connection() as conn:
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+            busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+        assert busy_timeout == 5000
+    
+    def test_connection_reused_per_thread(self, temp_db):
+        """Test that one thread keeps its connection and others get their own."""
+        import threading
+        
+        with temp_db._get_connection() as first:
+            pass
+        with temp_db._get_connection() as second:
+            pass
+        
+        other = []
+        
+        def open_connection():
+            with temp_db._get_connection() as conn:
+                other.append(conn)
+        
+        thread = threading.Thread(target=open_connection)
+        thread.start()
+        thread.join()
+        
+        assert first is second
+        assert other[0] is not first
+    
+    def test_nested_block_rolls_back_with_outer(self, temp_db, project):
+        """Test that a failing outer block also undoes nested writes."""
+        memory = Memory(
+            content="Test",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+        )
+        
+        with pytest.raises(RuntimeError):
+            with temp_db._get_connection():
+                temp_db.create_memory(memory)
+                raise RuntimeError("abort")
+        
+        assert temp_db.get_memory(memory.id) is None
+    
+    def test_writes_while_streaming_commit_immediately(self, temp_db, project):
+        """Test that writes made while iterating are visible to other connections."""
+        import sqlite3
+        
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(3)
+        ]
+        temp_db.create_memories(memories)
+        
+        other = sqlite3.connect(str(temp_db.db_path), timeout=0)
+        try:
+            streamed = temp_db.iter_memories(project.id, batch_size=1)
+            first = next(streamed)
+            temp_db.save_embedding_references([(first.id, "vector-1")])
+            
+            # Committed, and the write lock is released mid-iteration
+            assert other.execute("SELECT vector_id FROM embeddings").fetchall() == [("vector-1",)]
+            other.execute("UPDATE projects SET name = name")
+            other.commit()
+            
+            streamed.close()
+            
+            with temp_db._get_connection() as conn:
+                assert not conn.in_transaction
+            assert len(list(temp_db.iter_memories(project.id))) == 3
+        finally:
+            other.close()
+    
+    def test_close_reopens_on_next_query(self, temp_db, project):
+        """Test that queries still work after closing the connection."""
+        temp_db.close()
+        
+        assert temp_db.get_project(project.id).name == "test-project"
+
+
+class TestOpen:
+    """Tests for the per-process database cache."""
+    
+    def test_open_reuses_instance(self, tmp_path):
+        """Test that opening the same file twice returns one instance."""
+        db = SQLiteDatabase.open(tmp_path / "test.db")
+        
+        assert SQLiteDatabase.open(tmp_path / "." / "test.db") is db
+        assert SQLiteDatabase.open(tmp_path / "other.db") is not db
+    
+    def test_open_sets_up_deleted_file(self, tmp_path):
+        """Test that a deleted database is created with its schema again."""
+        db_path = tmp_path / "test.db"
+        db = SQLiteDatabase.open(db_path)
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        
+        reopened = SQLiteDatabase.open(db_path)
+        
+        assert reopened is not db
+        assert reopened.create_project(Project(name="p", root_path="/p")).name == "p"
@@ -89,6 +89,43 @@ class TestSyncResult:
         assert result.success is False
 
 
+@pytest.mark.skipif(not HAS_SYNC, reason="sync dependencies not installed")
+class TestLocalFileAdapter:
+    """Tests for the local directory backend."""
+    
+    def test_list_and_count_only_visible_json_files(self, tmp_path):
+        """Test that listing skips other files, hidden files and directories."""
+        (tmp_path / "a.json").write_text("{}")
+        (tmp_path / "b.json").write_text("{}")
+        (tmp_path / ".hidden.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "dir.json").mkdir()
+        
+        adapter = LocalFileAdapter(tmp_path)
+        
+        assert sorted(adapter.list_files()) == ["a.json", "b.json"]
+        assert adapter.count_files() == 2
+    
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Test that a sync directory that does not exist yet has no files."""
+        adapter = LocalFileAdapter(tmp_path / "missing")
+        
+        assert adapter.list_files() == []
+        assert adapter.count_files() == 0
+    
+    def test_read_write_and_missing_files(self, tmp_path):
+        """Test reading back written files and None for missing ones."""
+        adapter = LocalFileAdapter(tmp_path / "sync")
+        
+        assert adapter.read_file("a.json") is None
+        assert adapter.get_last_modified("a.json") is None
+        
+        adapter.write_file("a.json", '{"id": "a"}')
+        
+        assert adapter.read_file("a.json") == '{"id": "a"}'
+        assert adapter.get_last_modified("a.json") is not None
+
+
 @pytest.mark.skipif(not HAS_SYNC, reason="sync dependencies not installed")
 class TestSyncExport:
     """Tests for memory export."""
@@ -140,10 +177,41 @@ class TestSyncExport:
         )
         
         result = manager.export_memories(force=True)
-        
+
         assert result.exported == 1
         assert len(result.conflicts) == 0
 
+    def test_repeat_export_skips_unchanged(self, temp_db, project, mock_adapter, mock_encryption):
+        """Test that a second push does not rewrite unchanged memories."""
+        memory = Memory(
+            content="Test memory",
+            type=MemoryType.NOTE,
+            source=MemorySource.MANUAL,
+            project_id=project.id,
+            confirmed=True,
+        )
+        temp_db.create_memory(memory)
+
+        files = {}
+        mock_adapter.write_file.side_effect = files.__setitem__
+        mock_adapter.read_file.side_effect = files.get
+
+        manager = SyncManager(
+            db=temp_db,
+            adapter=mock_adapter,
+            encryption=mock_encryption,
+            project_id=project.id,
+        )
+
+        first = manager.export_memories()
+        second = manager.export_memories()
+
+        assert first.exported == 1
+        assert second.exported == 0
+        assert second.unchanged == 1
+        assert second.success
+        assert mock_encryption.encrypt.call_count == 1
+
 
 @pytest.mark.skipif(not HAS_SYNC, reason="sync dependencies not installed")
 class TestSyncConflictDetection:
@@ -227,6 +295,86 @@ class TestSyncImport:
         assert saved is not None
         assert saved.content == "Remote memory"
 
+    def test_failed_batch_saves_memories_one_at_a_time(
+        self, temp_db, project, mock_adapter, mock_encryption
+    ):
+        """Test that one bad memory does not drop the other new memories."""
+        memories = [
+            Memory(
+                content=f"Remote memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(3)
+        ]
+        files = {
+            f"{m.id}.json": json.dumps({
+                "id": str(m.id),
+                "project_id": str(m.project_id),
+                "updated_at": datetime.utcnow().isoformat(),
+                "checksum": None,
+                "encrypted_data": m.model_dump_json(),
+            })
+            for m in memories
+        }
+        mock_adapter.list_files.return_value = list(files)
+        mock_adapter.read_file.side_effect = files.get
+        
+        bad = memories[1]
+        create_memory = temp_db.create_memory
+        
+        def fail_on_bad(memory):
+            if memory.id == bad.id:
+                raise ValueError("constraint failed")
+            return create_memory(memory)
+        
+        temp_db.create_memories = Mock(side_effect=ValueError("constraint failed"))
+        temp_db.create_memory = fail_on_bad
+        
+        manager = SyncManager(temp_db, mock_adapter, mock_encryption, project.id)
+        result = manager.import_memories()
+        
+        assert result.imported == 2
+        assert result.errors == [f"Import failed for {bad.id}.json: constraint failed"]
+        assert temp_db.get_memory(memories[0].id) is not None
+        assert temp_db.get_memory(bad.id) is None
+    
+    def test_roundtrip_with_worker_pool(self, temp_db, project, mock_adapter, mock_encryption):
+        """Test that a multi-threaded push is fully read back by a multi-threaded pull."""
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project.id,
+                confirmed=True,
+            )
+            for i in range(20)
+        ]
+        temp_db.create_memories(memories)
+
+        files = {}
+        mock_adapter.write_file.side_effect = files.__setitem__
+        mock_adapter.read_file.side_effect = files.get
+        mock_adapter.list_files.side_effect = lambda: sorted(files)
+
+        source = SyncManager(temp_db, mock_adapter, mock_encryption, project.id)
+        assert source.export_memories(workers=4).exported == 20
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target_db = SQLiteDatabase(Path(tmpdir) / "target.db")
+            target_db.create_project(project)
+            target = SyncManager(target_db, mock_adapter, mock_encryption, project.id)
+
+            result = target.import_memories(workers=4)
+
+            assert result.imported == 20
+            assert result.success
+            imported = target_db.list_memories(project.id, limit=100)
+            assert {m.content for m in imported} == {m.content for m in memories}
+
 
 @pytest.mark.skipif(not HAS_SYNC, reason="sync dependencies not installed") 
 class TestSyncIntegrity:
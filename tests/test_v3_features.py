@@ -181,6 +181,64 @@ class TestGraphBuilder:
         assert len(view["incoming"]) == 1
         assert len(view["outgoing"]) == 1
 
+    def test_linked_memories_fetched_in_bulk(self, db, sample_memories):
+        """Test that views and traversals load linked memories without per-link lookups."""
+        from unittest.mock import patch
+        
+        from memoryforge.core.graph_builder import GraphBuilder
+        
+        builder = GraphBuilder(db)
+        decision, constraint, stack = sample_memories
+        builder.link_memories(constraint.id, decision.id, RelationType.CAUSED_BY)
+        builder.link_memories(stack.id, decision.id, RelationType.CAUSED_BY)
+        builder.link_memories(decision.id, stack.id, RelationType.RELATES_TO)
+        
+        with patch.object(db, "get_memory", wraps=db.get_memory) as get_memory:
+            view = builder.get_graph_view(decision.id)
+            related = builder.find_related_memories(constraint.id, max_depth=2)
+            consequences = builder.get_decision_consequences(decision.id)
+        
+        assert get_memory.call_count == 1
+        assert [item["memory"].id for item in view["incoming"]] == [constraint.id, stack.id]
+        assert [item["memory"].id for item in view["outgoing"]] == [stack.id]
+        assert [item["relation_type"] for item in view["incoming"]] == ["caused_by", "caused_by"]
+        assert [item["relation_type"] for item in view["outgoing"]] == ["relates_to"]
+        
+        (relation, peer), = db.get_memory_relations_with_peers(stack.id, "incoming")
+        assert (relation.source_memory_id, relation.target_memory_id) == (decision.id, stack.id)
+        assert peer.content == decision.content
+        with pytest.raises(ValueError):
+            db.get_memory_relations_with_peers(stack.id, "both")
+        assert [m.id for m in related] == [decision.id, stack.id]
+        assert {m.id for m in consequences} == {constraint.id, stack.id}
+
+    def test_find_related_queries_relations_per_level(self, db, sample_memories):
+        """Test that traversal fetches relations once per level and filters types in SQL."""
+        from unittest.mock import patch
+        
+        from memoryforge.core.graph_builder import GraphBuilder
+        
+        builder = GraphBuilder(db)
+        decision, constraint, stack = sample_memories
+        builder.link_memories(decision.id, constraint.id, RelationType.DEPENDS_ON)
+        builder.link_memories(stack.id, decision.id, RelationType.CAUSED_BY)
+        builder.link_memories(constraint.id, stack.id, RelationType.RELATES_TO)
+        
+        with patch.object(
+            db, "get_relations_for_memories", wraps=db.get_relations_for_memories
+        ) as get_relations:
+            related = builder.find_related_memories(decision.id, max_depth=2)
+        
+        assert get_relations.call_count == 2
+        assert {m.id for m in related} == {constraint.id, stack.id}
+        
+        only_depends = builder.find_related_memories(
+            decision.id, relation_types=[RelationType.DEPENDS_ON], max_depth=3
+        )
+        assert [m.id for m in only_depends] == [constraint.id]
+        assert len(db.get_relations_for_memories([decision.id, constraint.id])) == 3
+        assert len(db.get_relations_for_memories([decision.id], direction="outgoing")) == 1
+
     def test_link_nonexistent_memory_fails(self, db, sample_memories):
         """Test that linking to nonexistent memory raises error."""
         from memoryforge.core.graph_builder import GraphBuilder
@@ -285,6 +343,59 @@ class TestConfidenceScorer:
         
         assert confirmed_score > unconfirmed_score
 
+    def test_batch_update_matches_calculate_score(self, db, project_id):
+        """Test that the vectorized batch update gives the per-memory scores."""
+        from memoryforge.core.confidence_scorer import ConfidenceScorer
+        
+        now = datetime.utcnow()
+        memories = [
+            Memory(
+                content=f"Memory {i}",
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project_id,
+                confirmed=i % 2 == 0,
+                created_at=now - timedelta(days=15 * i, hours=1),
+                last_accessed=now - timedelta(days=2 * i) if i % 3 == 0 else None,
+            )
+            for i in range(6)
+        ]
+        db.create_memories(memories)
+        for count, memory in zip((1, 2, 5), memories[1:4]):
+            for _ in range(count):
+                db.log_conflict(memory.id, "local", "remote", ConflictResolution.LOCAL_WINS)
+        
+        scorer = ConfidenceScorer(db)
+        expected = {m.id: scorer.calculate_score(m) for m in memories}
+        
+        results = scorer.batch_update_scores(project_id)
+        
+        assert results.keys() == expected.keys()
+        for memory_id, score in results.items():
+            assert score == pytest.approx(expected[memory_id])
+            assert db.get_memory(memory_id).confidence_score == pytest.approx(score)
+
+    def test_conflict_score_buckets(self):
+        """Test that conflict counts map to the documented score buckets."""
+        from memoryforge.core.confidence_scorer import ConfidenceScorer
+        
+        scores = [ConfidenceScorer._conflict_score_for_count(n) for n in range(7)]
+        
+        assert scores == [1.0, 0.7, 0.5, 0.5, 0.3, 0.3, 0.3]
+
+    def test_confidence_details_match_score(self, db, sample_memories):
+        """Test that the breakdown adds up to the calculated score."""
+        from memoryforge.core.confidence_scorer import ConfidenceScorer
+        
+        memory = sample_memories[0]
+        db.log_conflict(memory.id, "local", "remote", ConflictResolution.LOCAL_WINS)
+        scorer = ConfidenceScorer(db)
+        
+        details = scorer.get_confidence_details(memory.id)
+        
+        assert details["breakdown"]["conflicts"] == {"score": 0.7, "conflict_count": 1}
+        assert details["calculated_score"] == pytest.approx(scorer.calculate_score(memory))
+
     def test_get_low_confidence(self, db, project_id):
         """Test getting low confidence memories."""
         from memoryforge.core.confidence_scorer import ConfidenceScorer
@@ -351,6 +462,8 @@ class TestConflictLogging:
         conflicts = db.get_conflict_history(memory.id)
         assert len(conflicts) == 1
         assert conflicts[0].resolution == ConflictResolution.MERGED
+        assert db.get_conflict_count(memory.id) == 1
+        assert db.get_conflict_count(sample_memories[1].id) == 0
 
     def test_all_conflict_resolutions(self, db, sample_memories):
         """Test all conflict resolution types."""
@@ -416,6 +529,66 @@ class TestConflictResolver:
         conflicts = resolver.list_conflicts(memory.id)
         assert len(conflicts) == 1
         assert conflicts[0].resolution == ConflictResolution.MANUAL
+        assert db.get_memory(memory.id).content == "Manually merged content"
+
+    def test_equal_timestamps_resolve_the_same_on_both_sides(self, db, project_id):
+        """Test that a timestamp tie picks one winner whichever side is local."""
+        from memoryforge.core.conflict_resolver import ConflictResolver, SyncConflict
+        
+        resolver = ConflictResolver(db)
+        stamp = datetime.utcnow()
+        ours, theirs = (
+            Memory(
+                content=content,
+                type=MemoryType.NOTE,
+                source=MemorySource.MANUAL,
+                project_id=project_id,
+                updated_at=stamp,
+            )
+            for content in ("Version A", "Version B")
+        )
+        
+        assert resolver.detect_conflict(ours, theirs.content, stamp)
+        assert not resolver.detect_conflict(ours, ours.content, stamp)
+        
+        winners = set()
+        for local, remote in ((ours, theirs), (theirs, ours)):
+            conflict = SyncConflict(local.id, local, remote.content, stamp)
+            winners.add(remote.content if resolver._remote_wins(conflict) else local.content)
+        
+        assert winners == {"Version B"}
+
+    def test_resolve_last_write_wins_batch(self, db, sample_memories):
+        """Test that a batch applies remote winners and logs every conflict."""
+        from memoryforge.core.conflict_resolver import ConflictResolver, SyncConflict
+        
+        resolver = ConflictResolver(db)
+        newer, older = sample_memories[0], sample_memories[1]
+        conflicts = [
+            SyncConflict(
+                memory_id=newer.id,
+                local_memory=newer,
+                remote_content="Updated remotely",
+                remote_updated_at=datetime.utcnow() + timedelta(hours=1),
+            ),
+            SyncConflict(
+                memory_id=older.id,
+                local_memory=older,
+                remote_content="Stale remote",
+                remote_updated_at=datetime.utcnow() - timedelta(days=30),
+            ),
+        ]
+        
+        results = resolver.resolve_last_write_wins_batch(conflicts)
+        
+        assert [r.resolution for r in results] == [
+            ConflictResolution.REMOTE_WINS,
+            ConflictResolution.LOCAL_WINS,
+        ]
+        assert db.get_memory(newer.id).content == "Updated remotely"
+        assert db.get_memory(older.id).content == older.content
+        assert resolver.get_conflict_count(newer.id) == 1
+        assert resolver.get_conflict_count(older.id) == 1
 
 
 # ============================================================================